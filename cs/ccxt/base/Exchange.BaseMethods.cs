@@ -2853,7 +2853,7 @@ public partial class Exchange
         if (isTrue(this.enableRateLimit))
         {
             object cost = this.calculateRateLimiterCost(api, method, path, parameters, config);
-            await this.throttle(cost);
+            await this.throttle(cost, api, method, path, config);
         }
         this.lastRestRequestTimestamp = this.milliseconds();
         object request = this.sign(path, api, method, parameters, headers, body);
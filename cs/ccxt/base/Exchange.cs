@@ -489,7 +489,7 @@ public partial class Exchange
         return amount * scale;
     }
 
-    public async Task throttle(object cost)
+    public async Task throttle(object cost, object api = null, object method = null, object path = null, object config = null)
     {
         await this.throttler.throttle(cost);
     }
@@ -6,6 +6,7 @@ public partial class Exchange
 {
     public ConcurrentDictionary<string, WebSocketClient> clients = new ConcurrentDictionary<string, WebSocketClient>();
     public static ClientWebSocket ws = null;
+    public Dictionary<string, ccxt.pro.MessageRouter> messageRouters = null;
 
     public ccxt.pro.OrderBook orderBook(object snapshot = null, object depth = null)
     {
@@ -22,6 +23,34 @@ public partial class Exchange
         return new ccxt.pro.CountedOrderBook(snapshot, depth);
     }
 
+    public ccxt.pro.ArrayCacheByTimestamp ohlcvCache(object limit = null)
+    {
+        return new ccxt.pro.ArrayCacheByTimestamp(limit);
+    }
+
+    public virtual object messageRoutes()
+    {
+        // the tables of routes to the handlers of the messages, see MessageRouter, overridden by the exchanges
+        return new Dictionary<string, object>() { };
+    }
+
+    public object findMessageHandler(object table, object route)
+    {
+        // the routers are built on the first message, the messages of different connections can come at once
+        var routers = this.messageRouters;
+        if (routers == null)
+        {
+            routers = new Dictionary<string, ccxt.pro.MessageRouter>();
+            var routes = this.messageRoutes() as IDictionary<string, object>;
+            foreach (var name in routes.Keys)
+            {
+                routers[name] = new ccxt.pro.MessageRouter(routes[name]);
+            }
+            routers = Interlocked.CompareExchange(ref this.messageRouters, routers, null) ?? routers;
+        }
+        return routers[table.ToString()].find(route);
+    }
+
     public virtual void onClose(WebSocketClient client, object error = null)
     {
         // var client = (WebSocketClient)client2;
@@ -0,0 +1,83 @@
+namespace ccxt.pro;
+
+using System.Collections.Concurrent;
+
+// one table of routes of Exchange.messageRoutes (), the routes are tried in this order:
+// "exact" by the whole route, "prefix" and "contains" in the order they are listed,
+// then "predicate", a list of [ predicate (route), handler ]
+// the handler found for a route is remembered, the routes of the messages of a connection repeat
+
+public class MessageRouter
+{
+    public static int maxResolved = 1024;
+
+    public IDictionary<string, object> exact;
+    public List<KeyValuePair<string, object>> prefixes;
+    public List<KeyValuePair<string, object>> substrings;
+    public List<object> predicates;
+    // the handlers of different connections are called from different threads
+    public ConcurrentDictionary<string, object> resolved = new ConcurrentDictionary<string, object>();
+
+    public MessageRouter(object routes = null)
+    {
+        var table = routes as IDictionary<string, object> ?? new Dictionary<string, object>();
+        this.exact = entries(table, "exact") ?? new Dictionary<string, object>();
+        this.prefixes = (entries(table, "prefix") ?? new Dictionary<string, object>()).ToList();
+        this.substrings = (entries(table, "contains") ?? new Dictionary<string, object>()).ToList();
+        this.predicates = (table.TryGetValue("predicate", out var predicates) ? predicates as IList<object> : null)?.ToList() ?? new List<object>();
+    }
+
+    private static IDictionary<string, object> entries(IDictionary<string, object> table, string key)
+    {
+        return table.TryGetValue(key, out var value) ? value as IDictionary<string, object> : null;
+    }
+
+    public object find(object route)
+    {
+        if (!(route is string key))
+        {
+            return null;
+        }
+        if (this.exact.TryGetValue(key, out var handler))
+        {
+            return handler;
+        }
+        if (this.resolved.TryGetValue(key, out handler))
+        {
+            return handler;
+        }
+        handler = this.resolve(key);
+        if (this.resolved.Count < maxResolved)
+        {
+            this.resolved[key] = handler;
+        }
+        return handler;
+    }
+
+    public object resolve(string route)
+    {
+        foreach (var prefix in this.prefixes)
+        {
+            if (route.StartsWith(prefix.Key, StringComparison.Ordinal))
+            {
+                return prefix.Value;
+            }
+        }
+        foreach (var substring in this.substrings)
+        {
+            if (route.Contains(substring.Key))
+            {
+                return substring.Value;
+            }
+        }
+        foreach (var entry in this.predicates)
+        {
+            var predicate = entry as IList<object>;
+            if (Exchange.isTrue(Exchange.DynamicInvoker.InvokeMethod(predicate[0], new object[] { route })))
+            {
+                return predicate[1];
+            }
+        }
+        return null;
+    }
+}
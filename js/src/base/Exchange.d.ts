@@ -569,7 +569,7 @@ export default class Exchange {
     checkRequiredVersion(requiredVersion: any, error?: boolean): boolean;
     checkAddress(address: any): any;
     initRestRateLimiter(): void;
-    throttle(cost?: any): any;
+    throttle(cost?: any, api?: any, method?: any, path?: any, config?: {}): any;
     defineRestApiEndpoint(methodName: any, uppercaseMethod: any, lowercaseMethod: any, camelcaseMethod: any, path: any, paths: any, config?: {}): void;
     defineRestApi(api: any, methodName: any, paths?: any[]): void;
     log(...args: any[]): void;
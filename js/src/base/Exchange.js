@@ -662,7 +662,7 @@ export default class Exchange {
         }, this.tokenBucket);
         this.throttler = new Throttler(this.tokenBucket);
     }
-    throttle(cost = undefined) {
+    throttle(cost = undefined, api = undefined, method = undefined, path = undefined, config = {}) {
         return this.throttler.throttle(cost);
     }
     defineRestApiEndpoint(methodName, uppercaseMethod, lowercaseMethod, camelcaseMethod, path, paths, config = {}) {
@@ -3668,7 +3668,7 @@ export default class Exchange {
     async fetch2(path, api = 'public', method = 'GET', params = {}, headers = undefined, body = undefined, config = {}) {
         if (this.enableRateLimit) {
             const cost = this.calculateRateLimiterCost(api, method, path, params, config);
-            await this.throttle(cost);
+            await this.throttle(cost, api, method, path, config);
         }
         this.lastRestRequestTimestamp = this.milliseconds();
         const request = this.sign(path, api, method, params, headers, body);
@@ -1366,7 +1366,7 @@ class Exchange {
         return MessagePack::pack($data);
     }
 
-    public function throttle($cost = null) {
+    public function throttle($cost = null, $api = null, $method = null, $path = null, $config = array ()) {
         // TODO: use a token bucket here
         $now = $this->milliseconds();
         $elapsed = $now - $this->lastRestRequestTimestamp;
@@ -4517,7 +4517,7 @@ class Exchange {
     public function fetch2($path, mixed $api = 'public', $method = 'GET', $params = array (), mixed $headers = null, mixed $body = null, $config = array ()) {
         if ($this->enableRateLimit) {
             $cost = $this->calculate_rate_limiter_cost($api, $method, $path, $params, $config);
-            $this->throttle ($cost);
+            $this->throttle ($cost, $api, $method, $path, $config);
         }
         $this->lastRestRequestTimestamp = $this->milliseconds ();
         $request = $this->sign ($path, $api, $method, $params, $headers, $body);
@@ -279,7 +279,7 @@ class Exchange extends \ccxt\Exchange {
         });
     }
 
-    public function throttle($cost = null) {
+    public function throttle($cost = null, $api = null, $method = null, $path = null, $config = array ()) {
         // stub so the async throttler gets called instead of the sync throttler
         return call_user_func($this->throttler, $cost);
     }
@@ -2627,7 +2627,7 @@ class Exchange extends \ccxt\Exchange {
         return Async\async(function () use ($path, $api, $method, $params, $headers, $body, $config) {
             if ($this->enableRateLimit) {
                 $cost = $this->calculate_rate_limiter_cost($api, $method, $path, $params, $config);
-                Async\await($this->throttle ($cost));
+                Async\await($this->throttle ($cost, $api, $method, $path, $config));
             }
             $this->lastRestRequestTimestamp = $this->milliseconds ();
             $request = $this->sign ($path, $api, $method, $params, $headers, $body);
@@ -24,6 +24,8 @@ trait ClientTrait {
 
     public $newUpdates = true;
 
+    public $message_routers = null;
+
     public function inflate($data) {
         return \ccxt\pro\inflate($data); // zlib_decode($data);
     }
@@ -48,6 +50,26 @@ trait ClientTrait {
         return new CountedOrderBook($snapshot, $depth);
     }
 
+    public function ohlcv_cache($limit = null) {
+        return new ArrayCacheByTimestamp($limit);
+    }
+
+    public function message_routes() {
+        // the tables of routes to the handlers of the messages, see MessageRouter, overridden by the exchanges
+        return array();
+    }
+
+    public function find_message_handler($table, $route) {
+        // the routers are built on the first message
+        if ($this->message_routers === null) {
+            $this->message_routers = array();
+            foreach ($this->message_routes() as $name => $routes) {
+                $this->message_routers[$name] = new MessageRouter($routes);
+            }
+        }
+        return $this->message_routers[$table]->find($route);
+    }
+
     public function client($url) : Client {
         if (!array_key_exists($url, $this->clients)) {
             $on_message = array($this, 'handle_message');
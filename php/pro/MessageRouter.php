@@ -0,0 +1,62 @@
+<?php
+
+namespace ccxt\pro;
+
+// one table of routes of message_routes(), the routes are tried in this order:
+// 'exact' by the whole route, 'prefix' and 'contains' in the order they are listed,
+// then 'predicate', a list of array(predicate(route), handler)
+// the handler found for a route is remembered, the routes of the messages of a connection repeat
+
+class MessageRouter {
+    const MAX_RESOLVED = 1024;
+
+    public $exact;
+    public $prefixes;
+    public $substrings;
+    public $predicates;
+    public $resolved;
+
+    public function __construct($routes = array()) {
+        $this->exact = isset($routes['exact']) ? $routes['exact'] : array();
+        $this->prefixes = isset($routes['prefix']) ? $routes['prefix'] : array();
+        $this->substrings = isset($routes['contains']) ? $routes['contains'] : array();
+        $this->predicates = isset($routes['predicate']) ? $routes['predicate'] : array();
+        $this->resolved = array();
+    }
+
+    public function find($route) {
+        if (!is_string($route)) {
+            return null;
+        }
+        if (array_key_exists($route, $this->exact)) {
+            return $this->exact[$route];
+        }
+        if (array_key_exists($route, $this->resolved)) {
+            return $this->resolved[$route];
+        }
+        $handler = $this->resolve($route);
+        if (count($this->resolved) < static::MAX_RESOLVED) {
+            $this->resolved[$route] = $handler;
+        }
+        return $handler;
+    }
+
+    public function resolve($route) {
+        foreach ($this->prefixes as $prefix => $handler) {
+            if (str_starts_with($route, (string) $prefix)) {
+                return $handler;
+            }
+        }
+        foreach ($this->substrings as $substring => $handler) {
+            if (str_contains($route, (string) $substring)) {
+                return $handler;
+            }
+        }
+        foreach ($this->predicates as $predicate) {
+            if (call_user_func($predicate[0], $route)) {
+                return $predicate[1];
+            }
+        }
+        return null;
+    }
+}
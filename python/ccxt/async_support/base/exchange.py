@@ -21,22 +21,28 @@ from ccxt.base.types import Int, Str, Num, Strings
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.throttler import Throttler
+from ccxt.async_support.base.rate_limiter import RateLimiter, header_parsers, parse_retry_after, rate_limit_priority
 
 # -----------------------------------------------------------------------------
 
-from ccxt.base.errors import BaseError, BadSymbol, BadRequest, BadResponse, ExchangeError, ExchangeNotAvailable, RequestTimeout, NotSupported, NullResponse, InvalidAddress, RateLimitExceeded
+from ccxt.base.errors import BaseError, BadSymbol, BadRequest, BadResponse, ExchangeError, ExchangeNotAvailable, RequestTimeout, NotSupported, NullResponse, InvalidAddress, RateLimitExceeded, DDoSProtection
 from ccxt.base.types import OrderType, OrderSide, OrderRequest
 
 # -----------------------------------------------------------------------------
 
 from ccxt.base.exchange import Exchange as BaseExchange, ArgumentsRequired
+from ccxt.base.markets_cache import read as read_markets_cache
+from ccxt.base.columns import nested_call as columns_nested_call
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.ws.functions import inflate, inflate64, gunzip
 from ccxt.async_support.base.ws.fast_client import FastClient
 from ccxt.async_support.base.ws.future import Future
-from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook, ArrayOrderBook, ArrayCountedOrderBook
+from ccxt.async_support.base.ws.cache import ArrayCacheByTimestamp, ArrayCacheByTimestampColumns, compact_trades
+from ccxt.async_support.base.ws.router import MessageRouter
+from ccxt.async_support.base.ws.subscription import Subscription, watching
 
 
 # -----------------------------------------------------------------------------
@@ -64,7 +70,14 @@ class Exchange(BaseExchange):
     }
     ping = None
     newUpdates = True
+    orderBookEngine = 'list'  # 'array' stores the price levels of order books in blocks of float arrays, faster for deep books
+    ohlcvEngine = 'list'  # 'columns' stores the candles of watch_ohlcv in preallocated typed arrays, with numpy views, 'compact' in a float array per candle
+    compactTrades = False  # stores the trades of the websocket caches as TradeRecord, with __slots__ instead of a dict
+    compactTradesInfo = True  # set to False to drop the 'info' of the compact trades
     clients = {}
+    rateLimitScope = None  # instances of the same exchange with the same scope (an IP, an account) share their rate limit buckets
+    rateLimitBuckets = None  # extra token buckets by name, each with an 'endpoints' dict laid out like describe()['api']
+    adaptiveRateLimit = True  # pause the buckets on the quota reported in the response headers and back off when rate limited
 
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
@@ -76,11 +89,69 @@ class Exchange(BaseExchange):
         super(Exchange, self).__init__(config)
         self.throttle = None
         self.init_rest_rate_limiter()
+        # pages are queued behind the other requests
+        for name in ('fetch_paginated_call_dynamic', 'fetch_paginated_call_deterministic', 'fetch_paginated_call_cursor', 'fetch_paginated_call_incremental'):
+            setattr(self, name, self.with_rate_limit_priority(getattr(self, name), 'backfill'))
         self.markets_loading = None
         self.reloading_markets = False
+        self.markets_refreshing = None
+        self.message_routers = None
 
     def init_rest_rate_limiter(self):
-        self.throttle = Throttler(self.tokenBucket, self.asyncio_loop)
+        self.throttle = RateLimiter.from_exchange(self.id, self.rateLimitScope, self.tokenBucket, self.rateLimitBuckets, self.asyncio_loop)
+
+    @staticmethod
+    def with_columnar_results(method, convert):
+        async def wrapper(*args, **kwargs):
+            if columns_nested_call.get():
+                return await method(*args, **kwargs)
+            # the tasks started inside the call, like the pages of a pagination, inherit the flag and return rows
+            token = columns_nested_call.set(True)
+            try:
+                result = await method(*args, **kwargs)
+            finally:
+                columns_nested_call.reset(token)
+            return convert(result)
+        return wrapper
+
+    @staticmethod
+    def with_rate_limit_priority(method, priority):
+        async def wrapper(*args, **kwargs):
+            # an outer priority wins, the inner calls inherit it through the context of the task
+            token = rate_limit_priority.set(priority) if rate_limit_priority.get() is None else None
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                if token is not None:
+                    rate_limit_priority.reset(token)
+        return wrapper
+
+    def is_signed_request(self, request):
+        # the api key or an Authorization header is in the request built by sign()
+        headers = request['headers'] or {}
+        if any(key.lower() == 'authorization' for key in headers):
+            return True
+        return any(self.apiKey in str(value) for value in (request['url'], request['body'], list(headers.values())))
+
+    def parse_rate_limit_headers(self, headers):
+        parser = header_parsers.get(self.id)
+        if parser is None:
+            return []
+        try:
+            return parser(self, {key.lower(): value for key, value in headers.items()})
+        except (TypeError, ValueError, KeyError) as e:
+            # a malformed header must not fail a successful response
+            self.logger.debug("%s ignored malformed rate limit headers: %s", self.id, e)
+            return []
+
+    def handle_rate_limit_headers(self, headers, error=None):
+        if not self.enableRateLimit or not self.adaptiveRateLimit:
+            return
+        if error is None:
+            self.throttle.feedback(self.parse_rate_limit_headers(headers))
+        else:
+            delay = self.throttle.backoff(parse_retry_after({key.lower(): value for key, value in headers.items()}))
+            self.logger.debug("%s rate limited, backing off for %sms", self.id, delay)
 
     def get_event_loop(self):
         return self.asyncio_loop
@@ -118,6 +189,9 @@ class Exchange(BaseExchange):
             self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
 
     async def close(self):
+        if self.markets_refreshing is not None:
+            self.markets_refreshing.cancel()
+            self.markets_refreshing = None
         await self.ws_close()
         if self.session is not None:
             if self.own_session:
@@ -240,8 +314,13 @@ class Exchange(BaseExchange):
             details = ' '.join([self.id, method, url])
             raise ExchangeError(details) from e
 
-        self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
-        self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
+        try:
+            self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
+            self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
+        except (RateLimitExceeded, DDoSProtection) as e:
+            self.handle_rate_limit_headers(headers, e)
+            raise
+        self.handle_rate_limit_headers(headers)
         if json_response is not None:
             return json_response
         if self.is_text_response(headers):
@@ -256,11 +335,64 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+        if self.sharedMarkets and not params:
+            return await self.load_shared_markets(reload)
+        markets, currencies = await self.load_markets_and_currencies(reload, params)
+        self.update_markets(markets, currencies)
+        return self.markets
+
+    async def load_markets_and_currencies(self, reload=False, params={}):
+        path = self.markets_cache_file(params)
+        if path is not None and not reload:
+            cached = read_markets_cache(path, __version__)
+            if cached is not None:
+                if self.milliseconds() - cached[2] >= self.marketsCacheTTL and self.markets_refreshing is None:
+                    # the expired markets are used until the fresh ones are loaded in the background
+                    self.markets_refreshing = asyncio.ensure_future(self.refresh_markets())
+                return cached[0], cached[1]
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        if path is not None:
+            self.store_markets_cache(path, markets, currencies)
+        return markets, currencies
+
+    async def refresh_markets(self):
+        # not through load_markets(True), that would join the load in progress which returns the expired markets
+        try:
+            if self.sharedMarkets:
+                await self.load_shared_markets(True)
+            else:
+                markets, currencies = await self.load_markets_and_currencies(True)
+                self.update_markets(markets, currencies)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.warning('%s could not refresh the cached markets: %s', self.id, e)
+        finally:
+            self.markets_refreshing = None
+
+    async def load_shared_markets(self, reload=False):
+        shared = self.shared_markets_entry()
+        loading = shared.loading
+        # joins the load of another instance on the same event loop
+        if loading is None or loading.done() or loading.get_loop() is not asyncio.get_running_loop():
+            if not reload and shared.values is not None:
+                return shared.apply(self)
+            loading = shared.loading = asyncio.ensure_future(self.fetch_shared_markets(shared, reload))
+        try:
+            # the load goes on for the other instances if this one is cancelled
+            await asyncio.shield(loading)
+        finally:
+            if shared.loading is loading and loading.done():
+                shared.loading = None
+        return shared.apply(self)
+
+    async def fetch_shared_markets(self, shared, reload=False):
+        markets, currencies = await self.load_markets_and_currencies(reload)
+        self.update_markets(markets, currencies)
+        return shared.store(self)
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -342,18 +474,37 @@ class Exchange(BaseExchange):
         return gunzip(data)
 
     def order_book(self, snapshot={}, depth=None):
+        if self.orderBookEngine == 'array':
+            return ArrayOrderBook(snapshot, depth)
         return OrderBook(snapshot, depth)
 
     def indexed_order_book(self, snapshot={}, depth=None):
         return IndexedOrderBook(snapshot, depth)
 
     def counted_order_book(self, snapshot={}, depth=None):
+        if self.orderBookEngine == 'array':
+            return ArrayCountedOrderBook(snapshot, depth)
         return CountedOrderBook(snapshot, depth)
 
+    def ohlcv_cache(self, limit=None):
+        if self.ohlcvEngine == 'columns' and limit:
+            return ArrayCacheByTimestampColumns(limit)
+        return ArrayCacheByTimestamp(limit, self.ohlcvEngine == 'compact')
+
+    def message_routes(self):
+        # the tables of routes to the handlers of the messages, see MessageRouter, overridden by the exchanges
+        return {}
+
+    def find_message_handler(self, table, route):
+        # the routers are built on the first message, with the handlers bound to this instance
+        if self.message_routers is None:
+            self.message_routers = {name: MessageRouter(routes) for name, routes in self.message_routes().items()}
+        return self.message_routers[table].find(route)
+
     def client(self, url):
         self.clients = self.clients or {}
         if url not in self.clients:
-            on_message = self.handle_message
+            on_message = self.handle_message_with_compact_trades if self.compactTrades else self.handle_message
             on_error = self.on_error
             on_close = self.on_close
             on_connected = self.on_connected
@@ -365,6 +516,7 @@ class Exchange(BaseExchange):
                 'verbose': self.verbose,
                 'throttle': Throttler(self.tokenBucket, self.asyncio_loop),
                 'asyncio_loop': self.asyncio_loop,
+                'json_loads': self.json_loads,
             }, ws_options)
             self.clients[url] = FastClient(url, on_message, on_error, on_close, on_connected, options)
             self.clients[url].proxy = self.get_ws_proxy()
@@ -383,6 +535,14 @@ class Exchange(BaseExchange):
     def delay(self, timeout, method, *args):
         return self.asyncio_loop.call_later(timeout / 1000, self.spawn, method, *args)
 
+    def handle_message_with_compact_trades(self, client, message):
+        # the trade caches made by the handlers store TradeRecord, see ArrayCache
+        token = compact_trades.set(self.compactTradesInfo)
+        try:
+            return self.handle_message(client, message)
+        finally:
+            compact_trades.reset(token)
+
     def handle_message(self, client, message):
         always = True
         if always:
@@ -394,6 +554,9 @@ class Exchange(BaseExchange):
         self.open()
         backoff_delay = 0
         client = self.client(url)
+        watcher = watching.get()
+        if watcher is not None:
+            watcher.attach(client, message_hashes)
 
         future = Future.race([client.future(message_hash) for message_hash in message_hashes])
 
@@ -433,6 +596,9 @@ class Exchange(BaseExchange):
         self.open()
         backoff_delay = 0
         client = self.client(url)
+        watcher = watching.get()
+        if watcher is not None:
+            watcher.attach(client, [message_hash])
         if subscribe_hash is None and message_hash in client.futures:
             return client.futures[message_hash]
         future = client.future(message_hash)
@@ -466,6 +632,12 @@ class Exchange(BaseExchange):
 
         return future
 
+    def subscription(self, method, *args, max_size=1000, policy='drop_oldest', callback=None, **kwargs):
+        # every update of a watch method, iterate the subscription or pass a callback, see Subscription for the policies
+        subscription = Subscription(max_size, policy, callback)
+        subscription.task = asyncio.ensure_future(subscription.start(getattr(self, method), args, kwargs))
+        return subscription
+
     def on_connected(self, client, message=None):
         # for user hooks
         # print('Connected to', client.url)
@@ -804,9 +976,12 @@ class Exchange(BaseExchange):
     async def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
-            await self.throttle(cost)
+            await self.throttle(cost, api, method, path, config)
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
+        if self.enableRateLimit and self.apiKey:
+            # the lane of the next requests to the endpoint follows what sign() did with it
+            self.throttle.record_signed(api, path, self.is_signed_request(request))
         self.last_request_headers = request['headers']
         self.last_request_body = request['body']
         self.last_request_url = request['url']
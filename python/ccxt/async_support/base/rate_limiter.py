@@ -0,0 +1,287 @@
+import asyncio
+import contextvars
+import re
+import time
+from email.utils import parsedate_to_datetime
+from ccxt.async_support.base.throttler import Throttler
+
+
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'head', 'options')
+
+
+class RateLimitRegistry:
+    """Process-wide token buckets keyed by (exchange id, scope, bucket name)"""
+
+    def __init__(self):
+        self.buckets = {}
+
+    def bucket(self, exchange_id, scope, name, config, loop=None):
+        # the first instance to ask for a bucket defines its config, later instances share it as is
+        key = (exchange_id, scope, name)
+        if key not in self.buckets:
+            self.buckets[key] = Throttler(config, loop)
+        return self.buckets[key]
+
+    def status(self, exchange_id=None, scope=None):
+        result = []
+        for (bucket_id, bucket_scope, name), throttler in self.buckets.items():
+            if (exchange_id is None or exchange_id == bucket_id) and (scope is None or scope == bucket_scope):
+                status = {
+                    'id': bucket_id,
+                    'scope': bucket_scope,
+                    'bucket': name,
+                }
+                status.update(throttler.status())
+                result.append(status)
+        return result
+
+    def clear(self):
+        self.buckets.clear()
+
+
+registry = RateLimitRegistry()
+
+# the priority of the requests made by the current task when they do not set one, like 'backfill' during pagination
+rate_limit_priority = contextvars.ContextVar('rate_limit_priority', default=None)
+
+
+def api_key(api):
+    return tuple(api) if isinstance(api, list) else (api,)
+
+
+def flatten_endpoints(endpoints, api=()):
+    # endpoints follow the layout of describe()['api']: api → [sub-api →] method → path → cost
+    result = {}
+    for key, value in endpoints.items():
+        if key.lower() in HTTP_METHODS:
+            for path, cost in value.items():
+                result[(api, key.lower(), path)] = cost.get('cost', 1) if isinstance(cost, dict) else cost
+        elif isinstance(value, dict):
+            result.update(flatten_endpoints(value, api + (key,)))
+    return result
+
+
+class RateLimiter:
+    """Callable like a Throttler, charges the default bucket and every extra bucket an endpoint belongs to"""
+
+    def __init__(self, buckets, endpoints={}):
+        self.buckets = buckets
+        self.default = buckets['default']
+        # (api, method, path) → [(throttler, cost), ...]
+        self.endpoints = endpoints
+        # (api, path) → whether sign() authenticated the last request to the endpoint
+        self.signed = {}
+        # header feedback, the share of a quota kept in reserve and the backoff delays in milliseconds
+        self.reserve = 0.05
+        self.backoff_delay = 1000
+        self.max_backoff_delay = 60000
+        self.backoff_streak = 0
+
+    @classmethod
+    def from_exchange(cls, exchange_id, scope, token_bucket, extra_buckets=None, loop=None):
+        configs = {'default': token_bucket}
+        configs.update(extra_buckets or {})
+        buckets = {}
+        endpoints = {}
+        for name, config in configs.items():
+            bucket_config = {key: value for key, value in config.items() if key != 'endpoints'}
+            if scope is None:
+                buckets[name] = Throttler(bucket_config, loop)
+            else:
+                buckets[name] = registry.bucket(exchange_id, scope, name, bucket_config, loop)
+            for endpoint, cost in flatten_endpoints(config.get('endpoints', {})).items():
+                endpoints.setdefault(endpoint, []).append((buckets[name], cost))
+        return cls(buckets, endpoints)
+
+    @property
+    def loop(self):
+        return self.default.loop
+
+    @loop.setter
+    def loop(self, loop):
+        for throttler in self.buckets.values():
+            throttler.loop = loop
+
+    # the default bucket is exposed as before for backwards compatibility
+    @property
+    def config(self):
+        return self.default.config
+
+    def status(self):
+        return {name: throttler.status() for name, throttler in self.buckets.items()}
+
+    def feedback(self, entries):
+        # called with the quotas parsed from the headers of every successful response
+        self.backoff_streak = 0
+        for entry in entries:
+            throttler = self.buckets.get(entry.get('bucket', 'default'))
+            limit = entry.get('limit')
+            if throttler is None or not limit:
+                continue
+            remaining = limit - entry['used']
+            reset = entry.get('reset', 0)
+            if remaining <= limit * self.reserve:
+                # the exchange says the window is (almost) spent, wait for it to reset
+                throttler.pause(reset)
+            elif entry.get('window'):
+                # the bucket refills at the rate of the limit, the tokens it can still release
+                # before the reset are brought down to what is left of the quota, never raised
+                throttler.sync(remaining / limit * entry['window'], reset)
+
+    def backoff(self, retry_after=None):
+        # called when the exchange rejects a request with RateLimitExceeded or DDoSProtection
+        self.backoff_streak += 1
+        if retry_after is None:
+            retry_after = min(self.backoff_delay * 2 ** (self.backoff_streak - 1), self.max_backoff_delay)
+        self.default.pause(retry_after)
+        return retry_after
+
+    def record_signed(self, api, path, signed):
+        self.signed[(api_key(api), path)] = signed
+
+    def priority(self, api, method, path, config):
+        # params['rateLimitPriority'] or the endpoint config, then the task, then whether the endpoint is signed
+        priority = config.get('priority') if config else None
+        if priority is None:
+            priority = rate_limit_priority.get()
+        if priority is None and method is not None:
+            signed = self.signed.get((api_key(api), path))
+            if signed is None:
+                # the first request to an endpoint, before sign() has told whether it is private
+                signed = 'private' in str(api).lower()
+            if signed:
+                priority = 'account' if method.upper() == 'GET' else 'trading'
+            else:
+                priority = 'market'
+        return priority
+
+    def __call__(self, cost=None, api=None, method=None, path=None, config={}):
+        priority = self.priority(api, method, path, config)
+        charges = self.endpoints.get((api_key(api), method.lower(), path)) if self.endpoints and method else None
+        if charges is None:
+            return self.default(cost, priority)
+        # wait on all buckets at once, the request is released when the slowest one has a token
+        return asyncio.gather(self.default(cost, priority), *[throttler(bucket_cost, priority) for throttler, bucket_cost in charges])
+
+
+# ----------------------------------------------------------------------------
+# response header parsers, each one returns a list of quotas like
+# {'bucket': 'default', 'used': 1150, 'limit': 1200, 'reset': 25000, 'window': 60000}
+# where reset is the number of milliseconds until the window starts over and the
+# optional window is its length in milliseconds, headers are passed with lowercase keys
+# a parser may raise on malformed values, the feedback of that response is skipped
+
+INTERVALS = {
+    's': 1000,
+    'm': 60000,
+    'h': 3600000,
+    'd': 86400000,
+}
+
+binance_limits = {
+    'binance': {'used-weight-1m': 6000, 'order-count-10s': 100, 'order-count-1d': 200000},
+    'binanceus': {'used-weight-1m': 1200, 'order-count-10s': 100, 'order-count-1d': 200000},
+    'binanceusdm': {'used-weight-1m': 2400, 'order-count-10s': 300, 'order-count-1m': 1200},
+    'binancecoinm': {'used-weight-1m': 2400, 'order-count-1m': 1200},
+}
+
+
+def parse_interval(interval):
+    # '1m' → 60000, binance windows are aligned to the clock
+    return int(interval[:-1]) * INTERVALS[interval[-1]]
+
+
+def parse_binance_headers(exchange, headers):
+    limits = binance_limits.get(exchange.id, binance_limits['binance'])
+    now = exchange.milliseconds()
+    result = []
+    for header, value in headers.items():
+        if not header.startswith('x-mbx-'):
+            continue
+        name = header[6:]
+        limit = limits.get(name)
+        if limit is None:
+            continue
+        interval = parse_interval(name[name.rfind('-') + 1:])
+        result.append({
+            'bucket': 'default' if name.startswith('used-weight') else 'orders',
+            'used': int(value),
+            'limit': limit,
+            'reset': interval - now % interval,
+            'window': interval,
+        })
+    return result
+
+
+def parse_bybit_headers(exchange, headers):
+    remaining = headers.get('x-bapi-limit-status')
+    limit = headers.get('x-bapi-limit')
+    if remaining is None or limit is None:
+        return []
+    reset = headers.get('x-bapi-limit-reset-timestamp')
+    return [{
+        'bucket': 'default',
+        'used': int(limit) - int(remaining),
+        'limit': int(limit),
+        'reset': 0 if reset is None else max(int(reset) - exchange.milliseconds(), 0),
+    }]
+
+
+def parse_reset(value, now):
+    # seconds until the reset or a unix timestamp in seconds or milliseconds
+    value = float(value)
+    if value < 1e9:
+        return value * 1000
+    if value < 1e12:
+        value *= 1000
+    return max(value - now, 0)
+
+
+def parse_ratelimit_headers(exchange, headers):
+    # the common X-RateLimit-* and IETF draft RateLimit-* headers
+    for prefix in ('x-ratelimit-', 'ratelimit-'):
+        remaining = headers.get(prefix + 'remaining')
+        limit = headers.get(prefix + 'limit')
+        if remaining is not None and limit is not None:
+            # the draft allows a policy after the number, like '100, 100;w=10' where w is the window in seconds
+            window = re.search(r';\s*w=([0-9.]+)', limit)
+            limit = float(limit.split(',')[0].split(';')[0])
+            reset = headers.get(prefix + 'reset')
+            result = {
+                'bucket': 'default',
+                'used': limit - float(remaining),
+                'limit': limit,
+                'reset': 0 if reset is None else parse_reset(reset, exchange.milliseconds()),
+            }
+            if window is not None:
+                result['window'] = float(window.group(1)) * 1000
+            return [result]
+    return []
+
+
+def parse_retry_after(headers):
+    # milliseconds, Retry-After holds either seconds or an http date
+    value = headers.get('retry-after')
+    if value is None:
+        return None
+    try:
+        return float(value) * 1000
+    except ValueError:
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0) * 1000
+        except (TypeError, ValueError):
+            return None
+
+
+# exchange id → parser, register a function here to add header feedback to another exchange
+header_parsers = {
+    'binance': parse_binance_headers,
+    'binanceus': parse_binance_headers,
+    'binanceusdm': parse_binance_headers,
+    'binancecoinm': parse_binance_headers,
+    'bybit': parse_bybit_headers,
+    # okx does not send quota headers on every endpoint, it answers 429 / code 50011
+    # when over the limit, which is handled by the backoff, the generic parser
+    # covers the X-RateLimit-* headers it sends where available
+    'okx': parse_ratelimit_headers,
+}
@@ -11,26 +11,63 @@ class Throttler:
             'delay': 0.001,
             'cost': 1.0,
             'tokens': 0,
-            'maxCapacity': 2000,
+            'maxCapacity': 2000,  # per lane, a number or a dict by priority
             'capacity': 1.0,
+            'scheduler': 'looper',  # 'looper' polls every `delay` seconds, 'timer' sleeps until the next token
+            'priorities': ['trading', 'account', 'market', 'backfill'],  # lanes from the highest priority to the lowest
+            'priority': 'market',  # the lane of calls without a priority
+            'starvationDelay': 10000,  # milliseconds after which a queued request goes ahead of the higher lanes
         }
         self.config.update(config)
-        self.queue = collections.deque()
+        # priority → deque of (future, cost, timestamp)
+        self.queues = {priority: collections.deque() for priority in self.config['priorities']}
+        self.queued = 0
+        self.metrics = {priority: {'served': 0, 'promoted': 0, 'peak': 0} for priority in self.config['priorities']}
         self.running = False
+        # used by the timer scheduler only
+        self.timer = None
+        self.last_timestamp = None
+
+    @property
+    def queue(self):
+        # the lane of calls without a priority, the single queue of the throttler before the lanes
+        return self.queues[self.config['priority']]
+
+    def next_priority(self):
+        # the highest priority lane goes first, unless the head of a lower lane has waited past starvationDelay
+        result = None
+        starved = None
+        deadline = time() * 1000 - self.config['starvationDelay']
+        queues = self.queues
+        for priority, queue in queues.items():
+            if queue:
+                if result is None:
+                    result = priority
+                elif queue[0][2] <= deadline and (starved is None or queue[0][2] < queues[starved][0][2]):
+                    starved = priority
+        if starved is not None and queues[starved][0][2] < queues[result][0][2]:
+            self.metrics[starved]['promoted'] += 1
+            return starved
+        return result
+
+    def pop(self):
+        priority = self.next_priority()
+        future, cost, timestamp = self.queues[priority].popleft()
+        self.queued -= 1
+        self.metrics[priority]['served'] += 1
+        return future, cost
 
     async def looper(self):
         last_timestamp = time() * 1000
         while self.running:
-            future, cost = self.queue[0]
-            cost = self.config['cost'] if cost is None else cost
             if self.config['tokens'] >= 0:
-                self.config['tokens'] -= cost
+                future, cost = self.pop()
+                self.config['tokens'] -= self.config['cost'] if cost is None else cost
                 if not future.done():
                     future.set_result(None)
-                self.queue.popleft()
                 # context switch
                 await asyncio.sleep(0)
-                if len(self.queue) == 0:
+                if self.queued == 0:
                     self.running = False
             else:
                 await asyncio.sleep(self.config['delay'])
@@ -39,12 +76,82 @@ class Throttler:
                 last_timestamp = now
                 self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
 
-    def __call__(self, cost=None):
+    def get_loop(self):
+        return self.loop if self.loop is not None else asyncio.get_event_loop()
+
+    def refill(self, loop):
+        now = loop.time() * 1000
+        elapsed = 0 if self.last_timestamp is None else now - self.last_timestamp
+        # initial tokens above capacity are spent before the cap applies, like in looper()
+        if elapsed > 0 and self.config['tokens'] < self.config['capacity']:
+            self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+        self.last_timestamp = now
+
+    def drain(self):
+        # resolves every queued future the bucket can afford right now, then arms
+        # a single timer for the moment the deficit of the next one is refilled
+        self.timer = None
+        loop = self.get_loop()
+        self.refill(loop)
+        config = self.config
+        while self.queued and config['tokens'] >= 0:
+            future, cost = self.pop()
+            config['tokens'] -= config['cost'] if cost is None else cost
+            if not future.done():
+                future.set_result(None)
+        if self.queued:
+            delay = -config['tokens'] / config['refillRate']  # milliseconds
+            self.timer = loop.call_at(loop.time() + delay / 1000, self.drain)
+        else:
+            self.running = False
+
+    def __call__(self, cost=None, priority=None):
+        if priority is None:
+            priority = self.config['priority']
+        queue = self.queues.get(priority)
+        if queue is None:
+            raise ValueError('unknown throttle priority ' + str(priority) + ', expected one of ' + ', '.join(self.queues))
+        max_capacity = self.config['maxCapacity']
+        if isinstance(max_capacity, dict):
+            max_capacity = max_capacity.get(priority, 2000)
+        if len(queue) > max_capacity:
+            raise RuntimeError('throttle queue of the ' + priority + ' lane is over maxCapacity (' + str(int(max_capacity)) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
         future = asyncio.Future()
-        if len(self.queue) > self.config['maxCapacity']:
-            raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
-        self.queue.append((future, cost))
+        queue.append((future, cost, time() * 1000))
+        self.queued += 1
+        metrics = self.metrics[priority]
+        if len(queue) > metrics['peak']:
+            metrics['peak'] = len(queue)
         if not self.running:
             self.running = True
-            asyncio.ensure_future(self.looper(), loop=self.loop)
+            if self.config['scheduler'] == 'timer':
+                # resolve on the next loop iteration rather than synchronously so callers still yield
+                self.timer = self.get_loop().call_soon(self.drain)
+            else:
+                asyncio.ensure_future(self.looper(), loop=self.loop)
         return future
+
+    def pause(self, milliseconds):
+        # empties the bucket so that the next request waits at least `milliseconds`
+        if self.config['refillRate'] == float('inf'):
+            return
+        if self.config['scheduler'] == 'timer':
+            self.refill(self.get_loop())
+        self.config['tokens'] = min(self.config['tokens'], -milliseconds * self.config['refillRate'])
+
+    def sync(self, milliseconds, reset):
+        # caps what the bucket releases until the reset at the tokens refilled in `milliseconds`
+        if self.config['refillRate'] == float('inf'):
+            return
+        if self.config['scheduler'] == 'timer':
+            self.refill(self.get_loop())
+        self.config['tokens'] = min(self.config['tokens'], (milliseconds - reset) * self.config['refillRate'])
+
+    def status(self):
+        return {
+            'tokens': self.config['tokens'],
+            'capacity': self.config['capacity'],
+            'refillRate': self.config['refillRate'],
+            'queued': self.queued,
+            'lanes': {priority: dict(self.metrics[priority], queued=len(queue)) for priority, queue in self.queues.items()},
+        }
@@ -24,8 +24,12 @@ class AiohttpClient(Client):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
         if isinstance(data, bytes):
+            if len(data) >= 2 and data[0] in b'{[':
+                # the decoder reads the utf-8 bytes without an intermediate str
+                self.on_message_callback(self, self.json_loads(data))
+                return
             data = data.decode()
-        decoded = json.loads(data) if is_json_encoded_object(data) else data
+        decoded = self.json_loads(data) if is_json_encoded_object(data) else data
         self.on_message_callback(self, decoded)
 
     def handle_message(self, message):
@@ -100,6 +104,9 @@ class AiohttpClient(Client):
                     future.cancel()  # this is an "internal" future so we want to cancel it silently
                 else:
                     future.reject(ExchangeClosedByUser('Connection closed by the user'))
+        for subscribers in list(self.subscribers.values()):
+            for subscriber in list(subscribers):
+                subscriber.fail(ExchangeClosedByUser('Connection closed by the user'))
 
     async def ping_loop(self):
         if self.verbose:
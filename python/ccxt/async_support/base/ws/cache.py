@@ -1,4 +1,12 @@
 import collections
+import collections.abc
+import contextvars
+import functools
+import itertools
+import math
+from array import array
+from ccxt.base.errors import BadResponse, NotSupported
+from ccxt.base.exchange import Exchange
 
 
 class Delegate:
@@ -11,6 +19,241 @@ class Delegate:
         return getattr(deque, self.name)
 
 
+class KeyedDeque:
+    # the items of a cache in insertion order behind the interface of a deque
+    # an OrderedDict by key finds, moves to the end and evicts an item in O(1)
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self._items = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __reversed__(self):
+        return reversed(self._items.values())
+
+    def __contains__(self, item):
+        return item in self._items.values()
+
+    def key_at(self, index):
+        length = len(self._items)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError('deque index out of range')
+        # walks from the closest end like a deque
+        if index < length // 2:
+            return next(itertools.islice(self._items, index, None))
+        return next(itertools.islice(reversed(self._items), length - 1 - index, None))
+
+    def __getitem__(self, index):
+        return self._items[self.key_at(index)]
+
+    def __setitem__(self, index, item):
+        self._items[self.key_at(index)] = item
+
+    def __delitem__(self, index):
+        del self._items[self.key_at(index)]
+
+    def clear(self):
+        self._items.clear()
+
+    def set(self, key, item):
+        self._items[key] = item
+
+    def move_to_end(self, key):
+        self._items.move_to_end(key)
+
+    def popleft(self):
+        return self._items.popitem(last=False)[1]
+
+
+# -----------------------------------------------------------------------------
+# compact records, opt-in per exchange with the compactTrades option and ohlcvEngine = 'compact'
+
+DERIVED = object()  # the datetime of a trade record is rebuilt from its timestamp
+EMPTY = object()  # the fees of a trade record are an empty list
+PLACEHOLDER = object()  # the only key of the dict of a trade record
+
+# set by the exchange while it handles a message, the keep_info of the trade caches made meanwhile, None to store dicts
+compact_trades = contextvars.ContextVar('compact_trades', default=None)
+
+
+@functools.lru_cache(maxsize=1024)
+def iso8601_seconds(seconds):
+    return Exchange.iso8601(seconds * 1000)[:-5]
+
+
+def iso8601(timestamp):
+    # Exchange.iso8601 with the formatting of the seconds cached, trades come in bursts within the same second
+    if type(timestamp) is not int or timestamp < 0:
+        return Exchange.iso8601(timestamp)
+    return iso8601_seconds(timestamp // 1000) + '.%03dZ' % (timestamp % 1000)
+
+
+class TradeRecord(dict):
+    # a unified trade in __slots__ instead of the items of the dict, reads and writes like the dict it was made from
+    # the dict itself only holds a placeholder, json.dumps skips an empty dict, then it goes through items() like dict()
+    __slots__ = ('info', 'timestamp', 'datetime', 'symbol', 'id', 'order', 'type', 'side', 'takerOrMaker', 'price', 'amount', 'cost', 'fee', 'fees')
+    fields = frozenset(__slots__)
+
+    def __init__(self, trade, keep_info=True):
+        super(TradeRecord, self).__init__()
+        super(TradeRecord, self).__setitem__(PLACEHOLDER, None)
+        for key, value in trade.items():
+            object.__setattr__(self, key, value)
+        if not keep_info:
+            self.info = None
+        timestamp = trade.get('timestamp')
+        if timestamp is not None and trade.get('datetime') == iso8601(timestamp):
+            self.datetime = DERIVED
+        if trade.get('fees') == []:
+            self.fees = EMPTY
+
+    def __getitem__(self, key):
+        try:
+            value = getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+        if value is DERIVED:
+            return iso8601(self.timestamp)
+        if value is EMPTY:
+            return []
+        return value
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __delitem__(self, key):
+        try:
+            delattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in self.__slots__:
+            if hasattr(self, key):
+                yield key
+
+    def __len__(self):
+        return sum(1 for key in self.__slots__ if hasattr(self, key))
+
+    def __contains__(self, key):
+        return key in TradeRecord.fields and hasattr(self, key)
+
+    # the mapping methods on top of the ones above, the ones of dict read its own empty items
+    get = collections.abc.Mapping.get
+    keys = collections.abc.Mapping.keys
+    items = collections.abc.Mapping.items
+    values = collections.abc.Mapping.values
+    pop = collections.abc.MutableMapping.pop
+    popitem = collections.abc.MutableMapping.popitem
+    setdefault = collections.abc.MutableMapping.setdefault
+    update = collections.abc.MutableMapping.update
+
+    def clear(self):
+        for key in list(self):
+            delattr(self, key)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __eq__(self, other):
+        if isinstance(other, collections.abc.Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __or__(self, other):
+        result = dict(self.items())
+        result.update(other)
+        return result
+
+    def __reduce__(self):
+        # copy, deepcopy and pickle rebuild the record from a dict
+        return (self.__class__, (self.copy(),))
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class OHLCVRecord(list):
+    # a candle in a float array instead of a list of python numbers, the timestamp is read back as an int
+    # the list itself stays empty, json.dumps and list() go through __iter__ and the methods below
+    __slots__ = ('_values',)
+
+    def __init__(self, ohlcv):
+        super(OHLCVRecord, self).__init__()
+        self._values = array('d', ohlcv if type(ohlcv) is list else list(ohlcv))
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        value = self._values[index]
+        return int(value) if index == 0 or index == -len(self._values) else value
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            # array() reads the items of a list subclass directly, the ones of a record are empty
+            value = value._values if isinstance(value, OHLCVRecord) else array('d', list(value))
+        self._values[index] = value
+
+    def __iter__(self):
+        values = iter(self._values)
+        for value in values:
+            yield int(value)
+            break
+        yield from values
+
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __contains__(self, value):
+        return value in list(self)
+
+    def index(self, value, *args):
+        return list(self).index(value, *args)
+
+    def count(self, value):
+        return list(self).count(value)
+
+    def copy(self):
+        return list(self)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, array)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def __repr__(self):
+        return str(list(self))
+
+
 class BaseCache(list):
     # implicitly called magic methods don't invoke __getattribute__
     # https://docs.python.org/3/reference/datamodel.html#special-method-lookup
@@ -43,6 +286,8 @@ class BaseCache(list):
         deque = super(list, self).__getattribute__('_deque')
         if isinstance(item, slice):
             start, stop, step = item.indices(len(deque))
+            if step > 0:
+                return list(itertools.islice(deque, start, stop, step))
             return [deque[i] for i in range(start, stop, step)]
         else:
             return deque[item]
@@ -57,8 +302,15 @@ class BaseCache(list):
 
 
 class ArrayCache(BaseCache):
+    compact = False  # stores unified trades as TradeRecord
+    keep_info = True  # set to False to drop the 'info' of the compact trades
+
     def __init__(self, max_size=None):
         super(ArrayCache, self).__init__(max_size)
+        keep_info = compact_trades.get()
+        if keep_info is not None:
+            self.compact = True
+            self.keep_info = keep_info
         self._nested_new_updates_by_symbol = False
         self._new_updates_by_symbol = {}
         self._clear_updates_by_symbol = {}
@@ -83,6 +335,8 @@ class ArrayCache(BaseCache):
             return new_updates_value
 
     def append(self, item):
+        if self.compact and type(item) is dict and item.keys() <= TradeRecord.fields:
+            item = TradeRecord(item, self.keep_info)
         self._deque.append(item)
         if self._clear_all_updates:
             self._clear_all_updates = False
@@ -97,8 +351,11 @@ class ArrayCache(BaseCache):
 
 
 class ArrayCacheByTimestamp(BaseCache):
-    def __init__(self, max_size=None):
+    compact = False  # stores candles as OHLCVRecord, set on the caches made with ohlcvEngine = 'compact'
+
+    def __init__(self, max_size=None, compact=False):
         super(ArrayCacheByTimestamp, self).__init__(max_size)
+        self.compact = compact
         self.hashmap = {}
         self._size_tracker = set()
         self._new_updates = 0
@@ -111,6 +368,12 @@ class ArrayCacheByTimestamp(BaseCache):
         return min(self._new_updates, limit)
 
     def append(self, item):
+        if self.compact and type(item) is list:
+            try:
+                item = OHLCVRecord(item)
+            except TypeError:
+                # a missing or non-numeric value, kept as a list
+                pass
         if item[0] in self.hashmap:
             reference = self.hashmap[item[0]]
             if reference != item:
@@ -128,31 +391,161 @@ class ArrayCacheByTimestamp(BaseCache):
         self._new_updates = len(self._size_tracker)
 
 
+def check_timestamp(candle):
+    # the timestamp column holds integers, and the candles are found by their timestamp
+    if candle[0] is None:
+        raise BadResponse('candle without a timestamp: ' + str(list(candle)))
+
+
+class ColumnCandle(list):
+    # a candle read from a ColumnDeque, a write to it is stored in the columns while the candle is still in the deque
+    __slots__ = ('deque', 'sequence')
+
+    def __setitem__(self, index, value):
+        deque = self.deque
+        sequence = self.sequence
+        current = deque.start <= sequence < deque.end and deque.columns[0][sequence % deque.maxlen] == self[0]
+        super(ColumnCandle, self).__setitem__(index, value)
+        if current:
+            deque.set(sequence, self)
+
+
+class ColumnDeque:
+    # the candles of a cache in preallocated timestamp/open/high/low/close/volume columns behind the interface of a deque
+    # every candle is written twice, at its slot and at slot + maxlen, so the latest n candles are always contiguous
+    # the columns are never resized, numpy views of them stay valid and see the updates
+    def __init__(self, maxlen):
+        self.maxlen = maxlen
+        self.columns = [array('q', bytes(16 * maxlen))] + [array('d', bytes(16 * maxlen)) for i in range(5)]
+        self.start = 0  # sequence number of the oldest candle
+        self.end = 0  # sequence number of the next candle
+
+    def __len__(self):
+        return self.end - self.start
+
+    def sequence(self, index):
+        length = self.end - self.start
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError('deque index out of range')
+        return self.start + index
+
+    def get(self, sequence):
+        slot = sequence % self.maxlen
+        # missing values are stored as nan
+        candle = ColumnCandle([None if value != value else value for value in [column[slot] for column in self.columns]])
+        candle.deque = self
+        candle.sequence = sequence
+        return candle
+
+    def set(self, sequence, candle):
+        check_timestamp(candle)
+        slot = sequence % self.maxlen
+        for column, value in zip(self.columns, candle):
+            if value is None:
+                value = math.nan
+            column[slot] = value
+            column[slot + self.maxlen] = value
+
+    def __iter__(self):
+        for sequence in range(self.start, self.end):
+            yield self.get(sequence)
+
+    def __reversed__(self):
+        for sequence in range(self.end - 1, self.start - 1, -1):
+            yield self.get(sequence)
+
+    def __contains__(self, item):
+        return any(candle == item for candle in self)
+
+    def __getitem__(self, index):
+        return self.get(self.sequence(index))
+
+    def __setitem__(self, index, item):
+        self.set(self.sequence(index), item)
+
+    def clear(self):
+        self.start = 0
+        self.end = 0
+
+    def append(self, item):
+        if self.end - self.start == self.maxlen:
+            self.start += 1
+        self.set(self.end, item)
+        self.end += 1
+        return self.end - 1
+
+    def popleft(self):
+        if self.end == self.start:
+            raise IndexError('pop from an empty deque')
+        self.start += 1
+        return self.get(self.start - 1)
+
+
+class ArrayCacheByTimestampColumns(ArrayCacheByTimestamp):
+    # an ArrayCacheByTimestamp with the candles in a ColumnDeque, reading a candle returns a new list that writes through
+    # the hashmap holds the sequence number of each timestamp instead of the candle
+    def __init__(self, max_size):
+        super(ArrayCacheByTimestampColumns, self).__init__(max_size)
+        self._deque = ColumnDeque(max_size)
+
+    def append(self, item):
+        check_timestamp(item)
+        if item[0] in self.hashmap:
+            # the current candle is updated in place
+            self._deque.set(self.hashmap[item[0]], item)
+        else:
+            if len(self._deque) == self._deque.maxlen:
+                delete_reference = self._deque.popleft()
+                del self.hashmap[delete_reference[0]]
+            self.hashmap[item[0]] = self._deque.append(item)
+        if self._clear_updates:
+            self._clear_updates = False
+            self._size_tracker.clear()
+        self._size_tracker.add(item[0])
+        self._new_updates = len(self._size_tracker)
+
+    def clear(self):
+        self._deque.clear()
+        self.hashmap.clear()
+
+    def arrays(self, limit=None):
+        # numpy views of the timestamp, open, high, low, close and volume columns of the latest limit candles, without a copy
+        # they change with the updates of the cache, copy them to keep the values
+        try:
+            import numpy as np
+        except ImportError:
+            raise NotSupported('ArrayCacheByTimestampColumns.arrays() requires numpy, install it with "pip install numpy"')
+        deque = self._deque
+        length = len(deque) if limit is None else min(limit, len(deque))
+        offset = (deque.end - length) % deque.maxlen
+        return tuple(np.frombuffer(column, np.int64 if column.typecode == 'q' else np.float64, length, offset * column.itemsize) for column in deque.columns)
+
+
 class ArrayCacheBySymbolById(ArrayCache):
     def __init__(self, max_size=None):
         super(ArrayCacheBySymbolById, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        # keyed by (symbol, id)
+        self._deque = KeyedDeque(max_size)
 
     def append(self, item):
         by_id = self.hashmap.setdefault(item['symbol'], {})
+        key = (item['symbol'], item['id'])
         if item['id'] in by_id:
             reference = by_id[item['id']]
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['id'])
-            del self._deque[index]
-            del self._index[index]
+            self._deque.move_to_end(key)
         else:
             by_id[item['id']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
-            del self.hashmap[delete_item['symbol']][delete_item['id']]
-        self._deque.append(item)
-        self._index.append(item['id'])
+            if len(self._deque) == self._deque.maxlen:
+                delete_item = self._deque.popleft()
+                del self.hashmap[delete_item['symbol']][delete_item['id']]
+            self._deque.set(key, item)
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
@@ -175,26 +568,24 @@ class ArrayCacheBySymbolBySide(ArrayCache):
         super(ArrayCacheBySymbolBySide, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        # keyed by (symbol, side)
+        self._deque = KeyedDeque(max_size)
 
     def append(self, item):
         by_side = self.hashmap.setdefault(item['symbol'], {})
+        key = (item['symbol'], item['side'])
         if item['side'] in by_side:
             reference = by_side[item['side']]
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['side'])
-            del self._deque[index]
-            del self._index[index]
+            self._deque.move_to_end(key)
         else:
             by_side[item['side']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
-            del self.hashmap[delete_item['symbol']][delete_item['side']]
-        self._deque.append(item)
-        self._index.append(item['side'])
+            if len(self._deque) == self._deque.maxlen:
+                delete_item = self._deque.popleft()
+                del self.hashmap[delete_item['symbol']][delete_item['side']]
+            self._deque.set(key, item)
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
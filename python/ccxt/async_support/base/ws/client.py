@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
 from asyncio import sleep, ensure_future, wait_for, TimeoutError
+from time import perf_counter
 from .functions import milliseconds, iso8601, deep_extend
 from ccxt import NetworkError, RequestTimeout, NotSupported
 from ccxt.async_support.base.ws.future import Future
+from ccxt.base.json_decoders import loads_json
 
 
 class Client(object):
@@ -14,6 +16,7 @@ class Client(object):
     options = {}  # ws-specific options
     subscriptions = {}
     rejections = {}
+    subscribers = {}  # the Subscription objects by message hash
     on_message_callback = None
     on_error_callback = None
     on_close_callback = None
@@ -38,6 +41,17 @@ class Client(object):
     asyncio_loop = None
     ping_looper = None
     receive_looper = None
+    json_loads = staticmethod(loads_json)  # the json decoder of the exchange
+    drainBatchSize = 1  # the most messages handled before yielding to the event loop, 0 for no limit
+    drainBatchTime = 0  # the most microseconds spent handling messages before yielding, 0 for no limit
+    maxReadPause = 1000  # the most milliseconds a subscription with policy 'block' pauses reading, at most half of keepAlive
+    # the counters of the connection
+    messages_handled = 0
+    batches = 0
+    max_batch_size = 0
+    max_queue_depth = 0
+    handler_time = 0.0  # seconds in handle_message
+    max_handler_time = 0.0
 
     def __init__(self, url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config={}):
         defaults = {
@@ -45,6 +59,7 @@ class Client(object):
             'futures': {},
             'subscriptions': {},
             'rejections': {},
+            'subscribers': {},
             'on_message_callback': on_message_callback,
             'on_error_callback': on_error_callback,
             'on_close_callback': on_close_callback,
@@ -77,6 +92,9 @@ class Client(object):
             future = self.futures[message_hash]
             future.resolve(result)
             del self.futures[message_hash]
+        if message_hash in self.subscribers:
+            for subscriber in self.subscribers[message_hash]:
+                subscriber.push(message_hash, result)
         return result
 
     def reject(self, result, message_hash=None):
@@ -87,12 +105,44 @@ class Client(object):
                 del self.futures[message_hash]
             else:
                 self.rejections[message_hash] = result
+            if message_hash in self.subscribers:
+                for subscriber in list(self.subscribers[message_hash]):
+                    subscriber.fail(result)
         else:
             message_hashes = list(self.futures.keys())
             for message_hash in message_hashes:
                 self.reject(result, message_hash)
+            for subscribers in list(self.subscribers.values()):
+                for subscriber in list(subscribers):
+                    subscriber.fail(result)
         return result
 
+    def queue_depth(self):
+        # the messages received and not handled yet
+        return 0
+
+    def count_batch(self, size, elapsed, slowest):
+        self.messages_handled += size
+        self.batches += 1
+        self.handler_time += elapsed
+        if size > self.max_batch_size:
+            self.max_batch_size = size
+        if slowest > self.max_handler_time:
+            self.max_handler_time = slowest
+
+    def stats(self):
+        return {
+            'queue_depth': self.queue_depth(),
+            'max_queue_depth': self.max_queue_depth,
+            'messages_handled': self.messages_handled,
+            'batches': self.batches,
+            'average_batch_size': self.messages_handled / self.batches if self.batches else 0,
+            'max_batch_size': self.max_batch_size,
+            'handler_time': self.handler_time,
+            'average_handler_time': self.handler_time / self.messages_handled if self.messages_handled else 0,
+            'max_handler_time': self.max_handler_time,
+        }
+
     async def receive_loop(self):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'receive loop')
@@ -100,7 +150,10 @@ class Client(object):
             try:
                 message = await self.receive()
                 # self.log(iso8601(milliseconds()), 'received', message)
+                start = perf_counter()
                 self.handle_message(message)
+                elapsed = perf_counter() - start
+                self.count_batch(1, elapsed, elapsed)
             except Exception as e:
                 error = NetworkError(str(e))
                 if self.verbose:
@@ -174,6 +227,12 @@ class Client(object):
     def receive(self):
         raise NotSupported('receive() not implemented')
 
+    def pause_reading(self, subscriber):
+        raise NotSupported('pause_reading() not implemented')
+
+    def resume_reading(self, subscriber):
+        raise NotSupported('resume_reading() not implemented')
+
     def handle_message(self, message):
         raise NotSupported('handle_message() not implemented')
 
@@ -3,6 +3,7 @@
 import asyncio
 import socket
 import collections
+from time import perf_counter
 from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient
 
 
@@ -15,25 +16,77 @@ class FastClient(AiohttpClient):
         # https://github.com/aio-libs/aiohttp/blob/1d296d549050aa335ef542421b8b7dad788246d5/aiohttp/streams.py#L534
         self.stack = collections.deque()
         self.callback_scheduled = False
+        self.paused_by = set()  # the subscriptions with a full queue
+        self.pause_timer = None
 
-    def receive_loop(self):
-        def handler():
-            if not self.stack:
-                self.callback_scheduled = False
-                return
-            message = self.stack.popleft()
+    def queue_depth(self):
+        return len(self.stack)
+
+    def pause_reading(self, subscriber):
+        # the frames already received are still handled
+        self.paused_by.add(subscriber)
+        if self.transport is not None and self.transport.is_reading():
+            self.transport.pause_reading()
+            # the pongs are not read either, the pause ends before the ping loop times the connection out
+            self.pause_timer = self.asyncio_loop.call_later(self.max_read_pause() / 1000, self.end_read_pause)
+
+    def resume_reading(self, subscriber):
+        self.paused_by.discard(subscriber)
+        if not self.paused_by:
+            self.end_read_pause()
+
+    def max_read_pause(self):
+        if self.keepAlive:
+            return min(self.maxReadPause, self.keepAlive / 2)
+        return self.maxReadPause
+
+    def end_read_pause(self):
+        if self.pause_timer is not None:
+            self.pause_timer.cancel()
+            self.pause_timer = None
+        self.paused_by.clear()
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.resume_reading()
+
+    def feed_message(self, message, size=0):
+        if not self.callback_scheduled:
+            self.callback_scheduled = True
+            self.asyncio_loop.call_soon(self.drain)
+        self.stack.append(message)
+        if len(self.stack) > self.max_queue_depth:
+            self.max_queue_depth = len(self.stack)
+
+    def drain(self):
+        # handles up to drainBatchSize messages or drainBatchTime microseconds, then yields to the event loop
+        if not self.stack:
+            self.callback_scheduled = False
+            return
+        self.handle_messages(self.drainBatchSize or None, self.drainBatchTime)
+        self.asyncio_loop.call_soon(self.drain)
+
+    def handle_messages(self, limit=None, duration=0):
+        stack = self.stack
+        size = 0
+        slowest = 0.0
+        start = previous = perf_counter()
+        deadline = start + duration / 1000000 if duration else None
+        while stack and (limit is None or size < limit):
+            message = stack.popleft()
             try:
                 self.handle_message(message)
             except Exception as error:
                 self.reject(error)
-            self.asyncio_loop.call_soon(handler)
-
-        def feed_data(message, size):
-            if not self.callback_scheduled:
-                self.callback_scheduled = True
-                self.asyncio_loop.call_soon(handler)
-            self.stack.append(message)
+            size += 1
+            now = perf_counter()
+            if now - previous > slowest:
+                slowest = now - previous
+            previous = now
+            if deadline is not None and now >= deadline:
+                break
+        if size:
+            self.count_batch(size, previous - start, slowest)
 
+    def receive_loop(self):
         def feed_eof():
             if self._close_code == 1000:  # OK close
                 self.on_close(1000)
@@ -42,8 +95,8 @@ class FastClient(AiohttpClient):
 
         def wrapper(func):
             def parse_frame(buf):
-                while self.stack:
-                    self.handle_message(self.stack.popleft())
+                # the messages of the previous frames are handled before the next ones
+                self.handle_messages()
                 return func(buf)
             return parse_frame
 
@@ -83,7 +136,7 @@ class FastClient(AiohttpClient):
 
         ws_reader = connection.protocol._payload_parser
         ws_reader.parse_frame = wrapper(ws_reader.parse_frame)
-        ws_reader.queue.feed_data = feed_data
+        ws_reader.queue.feed_data = self.feed_message
         ws_reader.queue.feed_eof = feed_eof
         self.connection.close = close
         # return a future so super class won't complain
@@ -92,5 +145,8 @@ class FastClient(AiohttpClient):
     def reset(self, error):
         super(FastClient, self).reset(error)
         self.stack.clear()
+        if self.pause_timer is not None:
+            self.pause_timer.cancel()
+            self.pause_timer = None
         if self.transport:
             self.transport.abort()
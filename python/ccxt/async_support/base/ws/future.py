@@ -16,45 +16,41 @@ class Future(asyncio.Future):
 
     @classmethod
     def race(cls, futures):
+        # the first of the futures to complete settles the race, without a task of asyncio.wait
         future = Future()
+        futures = list(futures)
+        if not futures:
+            future.set_exception(ValueError('Set of Tasks/Futures is empty.'))
+            return future
         for f in futures:
             f.is_race_future = True
-        coro = asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
-        task = asyncio.create_task(coro)
 
         def callback(done):
-            exception = done.exception()
-            if exception is None:
-                complete, _ = done.result()
-                # check for exceptions
-                exceptions = []
-                for f in complete:
-                    if f._state == 'CANCELLED':
-                        continue  # was canceled internally
-                    err = f.exception()
-                    if err:
-                        exceptions.append(err)
-                # if any exceptions return with first exception
-                if len (exceptions) > 0:
-                    future.set_exception(exceptions[0])
+            for f in futures:
+                f.remove_done_callback(callback)
+            if future.done():
+                # handle wait_for scenario
+                return
+            complete = [f for f in futures if f.done()]
+            # if any exceptions return with first exception
+            for f in complete:
+                if not f.cancelled() and f.exception() is not None:  # cancelled ones were canceled internally
+                    future.set_exception(f.exception())
                     return
-                # else return first result
-                else:
-                    futures_list = list(complete)
-                    are_all_canceled = all(f._state == 'CANCELLED' for f in futures_list)
-                    if are_all_canceled and future._state == 'PENDING':
-                        future.set_exception(ExchangeClosedByUser('Connection closed by the user'))
-                        return
-
-                    # handle wait_for scenario
-                    if are_all_canceled and future._state == 'CANCELLED':
-                        return
-
-                    first = futures_list[0]
-
-                    first_result = first.result()
-                    future.set_result(first_result)
-            else:
-                future.set_exception(exception)
-        task.add_done_callback(callback)
+            # else return first result
+            for f in complete:
+                if not f.cancelled():
+                    future.set_result(f.result())
+                    return
+            future.set_exception(ExchangeClosedByUser('Connection closed by the user'))
+
+        def cleanup(race):
+            # the futures are shared with other watchers, they are left pending when the race is cancelled
+            if race.cancelled():
+                for f in futures:
+                    f.remove_done_callback(callback)
+
+        for f in futures:
+            f.add_done_callback(callback)
+        future.add_done_callback(cleanup)
         return future
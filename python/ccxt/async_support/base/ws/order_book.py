@@ -8,6 +8,8 @@ import sys
 class OrderBook(dict):
     def __init__(self, snapshot={}, depth=None):
         self.cache = []
+        # the last top(n) snapshot, with n, the sides and the versions of the sides it was built from
+        self._top = None
         depth = depth or sys.maxsize
         defaults = {
             'bids': [],
@@ -19,9 +21,9 @@ class OrderBook(dict):
         }
         # do not mutate snapshot
         defaults.update(snapshot)
-        if not isinstance(defaults['asks'], order_book_side.OrderBookSide):
+        if not isinstance(defaults['asks'], (order_book_side.OrderBookSide, order_book_side.ArrayOrderBookSide)):
             defaults['asks'] = order_book_side.Asks(defaults['asks'], depth)
-        if not isinstance(defaults['bids'], order_book_side.OrderBookSide):
+        if not isinstance(defaults['bids'], (order_book_side.OrderBookSide, order_book_side.ArrayOrderBookSide)):
             defaults['bids'] = order_book_side.Bids(defaults['bids'], depth)
         defaults['datetime'] = Exchange.iso8601(defaults.get('timestamp'))
         # merge to self
@@ -33,11 +35,9 @@ class OrderBook(dict):
         return self
 
     def reset(self, snapshot={}):
-        self['asks']._index.clear()
         self['asks'].clear()
         for ask in snapshot.get('asks', []):
             self['asks'].storeArray(ask)
-        self['bids']._index.clear()
         self['bids'].clear()
         for bid in snapshot.get('bids', []):
             self['bids'].storeArray(bid)
@@ -52,6 +52,52 @@ class OrderBook(dict):
             return self
         self.reset(snapshot)
 
+    # read views, they only touch the best levels of the sides
+
+    def top(self, n=None):
+        # a plain snapshot of the best n levels, rebuilt only when the book has changed since the last read
+        asks = self['asks']
+        bids = self['bids']
+        cached = self._top
+        # the sides are compared by identity, == would compare their levels
+        if cached is not None and cached[0] == n and cached[1] is asks and cached[2] == asks._version and cached[3] is bids \
+                and cached[4] == bids._version and cached[5] == self['nonce'] and cached[6] == self['timestamp']:
+            return cached[7]
+        snapshot = {
+            'asks': asks.top(n),
+            'bids': bids.top(n),
+            'timestamp': self['timestamp'],
+            'datetime': self['datetime'],
+            'nonce': self['nonce'],
+            'symbol': self['symbol'],
+        }
+        self._top = (n, asks, asks._version, bids, bids._version, self['nonce'], self['timestamp'], snapshot)
+        return snapshot
+
+    def best_bid(self):
+        return self['bids'].best()
+
+    def best_ask(self):
+        return self['asks'].best()
+
+    def mid(self):
+        bid = self['bids'].best()
+        ask = self['asks'].best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def spread(self):
+        bid = self['bids'].best()
+        ask = self['asks'].best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def depth_to(self, side, amount):
+        # the worst price, filled amount, cost and number of levels needed to fill `amount` from 'asks' or 'bids'
+        return self[side].depth_to(amount)
+
 # -----------------------------------------------------------------------------
 # overwrites absolute volumes at price levels
 # or deletes price levels based on order counts (3rd value in a bidask delta)
@@ -76,3 +122,24 @@ class IndexedOrderBook(OrderBook):
             'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
         })
         super(IndexedOrderBook, self).__init__(copy, depth)
+
+# -----------------------------------------------------------------------------
+# the same books with the price levels stored in float arrays, see ArrayOrderBookSide
+
+
+class ArrayOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.ArrayAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.ArrayBids(snapshot.get('bids', []), depth),
+        })
+        super(ArrayOrderBook, self).__init__(copy, depth)
+
+
+class ArrayCountedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.ArrayCountedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.ArrayCountedBids(snapshot.get('bids', []), depth),
+        })
+        super(ArrayCountedOrderBook, self).__init__(copy, depth)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""Vectorized order book analytics, requires numpy"""
+
+from ccxt.base.errors import NotSupported
+from ccxt.async_support.base.ws.order_book_side import ArrayOrderBookSide
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# the functions accept a websocket OrderBook as well as the dict returned by
+# fetch_order_book() or parse_order_book(), `side` is 'asks' or 'bids'
+
+
+def require_numpy():
+    if np is None:
+        raise NotSupported('order book analytics require numpy, install it with "pip install numpy"')
+
+
+def side_arrays(side):
+    # price and amount columns of one side as float64 arrays, best level first
+    require_numpy()
+    if isinstance(side, ArrayOrderBookSide):
+        # the blocks are copied with memcpy, a view would pin their buffers and the side could not be resized anymore
+        if not side._blocks:
+            return np.empty(0), np.empty(0)
+        prices = np.concatenate([np.frombuffer(block[0], np.float64) for block in side._blocks])
+        amounts = np.concatenate([np.frombuffer(block[1], np.float64) for block in side._blocks])
+        return (-prices if side.side else prices), amounts
+    length = len(side)
+    prices = np.fromiter((level[0] for level in side), np.float64, length)
+    amounts = np.fromiter((level[1] for level in side), np.float64, length)
+    return prices, amounts
+
+
+def arrays(orderbook, side):
+    return side_arrays(orderbook[side])
+
+
+def cumulative(orderbook, side):
+    # prices with the cumulative amounts and costs up to and including each level
+    prices, amounts = arrays(orderbook, side)
+    return prices, np.cumsum(amounts), np.cumsum(prices * amounts)
+
+
+def slippage_curve(orderbook, side, amounts):
+    # fills every amount from the best level, the slippage is the relative distance of the average price from the best price
+    prices, cumulative_amounts, cumulative_costs = cumulative(orderbook, side)
+    amounts = np.asarray(amounts, np.float64)
+    if not len(prices):
+        nan = np.full(amounts.shape, np.nan)
+        return {'amount': np.zeros(amounts.shape), 'cost': np.zeros(amounts.shape), 'average': nan, 'price': nan, 'slippage': nan}
+    filled = np.minimum(amounts, cumulative_amounts[-1])
+    # the level where each fill ends
+    last = np.minimum(np.searchsorted(cumulative_amounts, filled), len(prices) - 1)
+    previous_amounts = np.where(last > 0, cumulative_amounts[last - 1], 0)
+    previous_costs = np.where(last > 0, cumulative_costs[last - 1], 0)
+    cost = previous_costs + (filled - previous_amounts) * prices[last]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        average = np.where(filled > 0, cost / filled, np.nan)
+    best = prices[0]
+    slippage = (average - best) / best if side == 'asks' else (best - average) / best
+    return {'amount': filled, 'cost': cost, 'average': average, 'price': np.where(filled > 0, prices[last], np.nan), 'slippage': slippage}
+
+
+def market_impact(orderbook, side, amount):
+    # the result of a market order of `amount` against one side, buying takes the asks and selling takes the bids
+    curve = slippage_curve(orderbook, side, [amount])
+    return {key: float(value[0]) for key, value in curve.items()}
+
+
+def vwap(orderbook, side, amount):
+    # the average price of filling `amount`
+    return market_impact(orderbook, side, amount)['average']
+
+
+def imbalance(orderbook, levels=None):
+    # (bid amount - ask amount) / (bid amount + ask amount) over the best `levels` levels, from -1 to 1
+    bids = arrays(orderbook, 'bids')[1][:levels].sum()
+    asks = arrays(orderbook, 'asks')[1][:levels].sum()
+    total = bids + asks
+    return float((bids - asks) / total) if total else None
+
+
+def depth_at_bps(orderbook, bps):
+    # the amount available within `bps` basis points of the mid price on each side, bps can be a number or a list
+    ask_prices, ask_amounts = arrays(orderbook, 'asks')
+    bid_prices, bid_amounts = arrays(orderbook, 'bids')
+    if not len(ask_prices) or not len(bid_prices):
+        return None
+    scalar = np.ndim(bps) == 0
+    bps = np.asarray(bps, np.float64)
+    mid = (ask_prices[0] + bid_prices[0]) / 2
+    cumulative_asks = np.concatenate(([0], np.cumsum(ask_amounts)))
+    cumulative_bids = np.concatenate(([0], np.cumsum(bid_amounts)))
+    # asks are ascending and bids are descending
+    asks = cumulative_asks[np.searchsorted(ask_prices, mid * (1 + bps / 10000), 'right')]
+    bids = cumulative_bids[np.searchsorted(-bid_prices, -mid * (1 - bps / 10000), 'right')]
+    if scalar:
+        return {'asks': float(asks), 'bids': float(bids)}
+    return {'asks': asks, 'bids': bids}
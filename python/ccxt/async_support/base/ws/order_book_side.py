@@ -2,6 +2,8 @@
 
 import sys
 import bisect
+import operator
+from array import array
 
 """Author: Carlo Revelli"""
 """Fast bisect bindings"""
@@ -18,10 +20,13 @@ class OrderBookSide(list):
         self._n = sys.maxsize
         # parallel to self
         self._index = []
+        # bumped on every change, lets readers cache what they built from the side
+        self._version = 0
         for delta in deltas:
             self.storeArray(list(delta))
 
     def storeArray(self, delta):
+        self._version += 1
         price = delta[0]
         size = delta[1]
         index_price = -price if self.side else price
@@ -41,13 +46,44 @@ class OrderBookSide(list):
 
     def limit(self):
         difference = len(self) - self._depth
-        for _ in range(difference):
-            self.remove_index(self.pop())
-            self._index.pop()
+        if difference > 0:
+            self._version += 1
+            for order in super(OrderBookSide, self).__getitem__(slice(self._depth, None)):
+                self.remove_index(order)
+            del self[self._depth:]
+            del self._index[self._depth:]
 
     def remove_index(self, order):
         pass
 
+    def clear(self):
+        super(OrderBookSide, self).clear()
+        self._index.clear()
+        self._version += 1
+
+    def top(self, n=None):
+        # copies of the best n levels, without going through the other ones
+        return [level[:] for level in super(OrderBookSide, self).__getitem__(slice(0, n))]
+
+    def best(self):
+        return super(OrderBookSide, self).__getitem__(0)[:] if super(OrderBookSide, self).__len__() else None
+
+    def depth_to(self, amount):
+        # walks the levels from the best one until `amount` is filled
+        filled = 0
+        cost = 0
+        price = None
+        levels = 0
+        for level in super(OrderBookSide, self).__iter__():
+            if filled >= amount:
+                break
+            price = level[0]
+            size = min(level[1], amount - filled)
+            filled += size
+            cost += size * price
+            levels += 1
+        return {'price': price, 'amount': filled, 'cost': cost, 'levels': levels}
+
     def __len__(self):
         length = super(OrderBookSide, self).__len__()
         return min(length, self._n)
@@ -55,7 +91,7 @@ class OrderBookSide(list):
     def __getitem__(self, item):
         if isinstance(item, slice):
             start, stop, step = item.indices(len(self))
-            return [self[i] for i in range(start, stop, step)]
+            return super(OrderBookSide, self).__getitem__(slice(start, stop, step))
         else:
             return super(OrderBookSide, self).__getitem__(item)
 
@@ -78,6 +114,7 @@ class CountedOrderBookSide(OrderBookSide):
         super(CountedOrderBookSide, self).__init__(deltas, depth)
 
     def storeArray(self, delta):
+        self._version += 1
         price = delta[0]
         size = delta[1]
         count = delta[2]
@@ -107,6 +144,7 @@ class IndexedOrderBookSide(OrderBookSide):
         super(IndexedOrderBookSide, self).__init__(deltas, depth)
 
     def storeArray(self, delta):
+        self._version += 1
         price = delta[0]
         if price is not None:
             index_price = -price if self.side else price
@@ -157,9 +195,332 @@ class IndexedOrderBookSide(OrderBookSide):
         if order_id in self._hashmap:
             del self._hashmap[order_id]
 
+    def clear(self):
+        super(IndexedOrderBookSide, self).clear()
+        self._hashmap.clear()
+
     def store(self, price, size, order_id):
         self.storeArray([price, size, order_id])
 
+# -----------------------------------------------------------------------------
+# stores the price levels in sorted blocks of float arrays instead of a list of lists
+# an update moves at most one block of machine floats, a snapshot of thousands of
+# levels holds no python objects per level, the levels are built when they are read
+# the side is a list for isinstance checks and json.dumps, but the list itself stays
+# empty, every read goes through the methods below
+
+
+# a price level read from an ArrayOrderBookSide, a write to it replaces the level in the side
+
+
+class ArrayLevel(list):
+    __slots__ = ()
+    book_side = None  # set on the subclass made for each side
+
+    def __setitem__(self, item, value):
+        price = self[0]
+        super(ArrayLevel, self).__setitem__(item, value)
+        self.book_side.delete(price)
+        self.book_side.storeArray(list(self))
+
+
+class ArrayOrderBookSide(list):
+    __slots__ = ('_depth', '_level', '_blocks', '_maxes', '_len', '_version')  # attributes of list subclasses are slower without
+    side = None  # set to True for bids and False for asks
+    columns = ('d',)  # typecodes of the values after the price
+    load = 256  # blocks are split when they grow over twice this size
+
+    def __init__(self, deltas=[], depth=None):
+        super(ArrayOrderBookSide, self).__init__()
+        self._depth = depth or sys.maxsize
+        self._level = type('ArrayLevel', (ArrayLevel,), {'__slots__': (), 'book_side': self})
+        self.clear()
+        for delta in deltas:
+            self.storeArray(delta)
+
+    def clear(self):
+        # each block is [index prices, *columns], _maxes holds the last index price of each block
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+        self._version = getattr(self, '_version', 0) + 1
+
+    def new_block(self):
+        return [array('d')] + [array(typecode) for typecode in self.columns]
+
+    def find(self, index_price):
+        # returns the block number, the position in the block and whether the price is there
+        i = bisect.bisect_left(self._maxes, index_price)
+        if i == len(self._maxes):
+            if i == 0:
+                return 0, 0, False
+            i -= 1
+            return i, len(self._blocks[i][0]), False
+        keys = self._blocks[i][0]
+        j = bisect.bisect_left(keys, index_price)
+        return i, j, keys[j] == index_price
+
+    def insert_at(self, i, j, index_price, values):
+        if not self._blocks:
+            self._blocks.append(self.new_block())
+            self._maxes.append(index_price)
+        block = self._blocks[i]
+        block[0].insert(j, index_price)
+        for column, value in zip(block[1:], values):
+            column.insert(j, value)
+        self._len += 1
+        keys = block[0]
+        self._maxes[i] = keys[-1]
+        if len(keys) > 2 * self.load:
+            half = len(keys) // 2
+            self._blocks.insert(i + 1, [column[half:] for column in block])
+            for column in block:
+                del column[half:]
+            self._maxes.insert(i + 1, self._maxes[i])
+            self._maxes[i] = keys[-1]
+
+    def delete_at(self, i, j):
+        block = self._blocks[i]
+        for column in block:
+            del column[j]
+        self._len -= 1
+        if block[0]:
+            self._maxes[i] = block[0][-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+
+    def index_price(self, price):
+        # the arrays only hold numbers, a price given as a string is converted like the sizes
+        if price is None:
+            raise ValueError('order book level without a price')
+        price = float(price)
+        return -price if self.side else price
+
+    @staticmethod
+    def number(value):
+        # a level without a size or count is removed, like a zero one
+        return 0 if value is None else float(value)
+
+    def storeArray(self, delta):
+        self._version += 1
+        price = delta[0]
+        size = delta[1]
+        if price.__class__ is float:
+            index_price = -price if self.side else price
+        else:
+            index_price = self.index_price(price)
+        if size.__class__ is not float:
+            size = self.number(size)
+        i, j, found = self.find(index_price)
+        if size:
+            if found:
+                self._blocks[i][1][j] = size
+            else:
+                self.insert_at(i, j, index_price, (size,))
+        elif found:
+            self.delete_at(i, j)
+
+    def store(self, price, size):
+        self.storeArray([price, size])
+
+    def delete(self, price):
+        i, j, found = self.find(self.index_price(price))
+        if found:
+            self._version += 1
+            self.delete_at(i, j)
+
+    def limit(self):
+        difference = self._len - self._depth
+        if difference > 0:
+            self._version += 1
+        while difference > 0:
+            block = self._blocks[-1]
+            length = len(block[0])
+            if length <= difference:
+                self._blocks.pop()
+                self._maxes.pop()
+                removed = length
+            else:
+                for column in block:
+                    del column[length - difference:]
+                self._maxes[-1] = block[0][-1]
+                removed = difference
+            self._len -= removed
+            difference -= removed
+
+    def level(self, block, j):
+        price = block[0][j]
+        return self._level([-price if self.side else price] + [column[j] for column in block[1:]])
+
+    def top(self, n=None):
+        return self[:n]
+
+    def best(self):
+        return self.level(self._blocks[0], 0) if self._len else None
+
+    def depth_to(self, amount):
+        filled = 0
+        cost = 0
+        price = None
+        levels = 0
+        for block in self._blocks:
+            for index_price, size in zip(block[0], block[1]):
+                if filled >= amount:
+                    break
+                price = -index_price if self.side else index_price
+                size = min(size, amount - filled)
+                filled += size
+                cost += size * price
+                levels += 1
+            else:
+                continue
+            break
+        return {'price': price, 'amount': filled, 'cost': cost, 'levels': levels}
+
+    def __len__(self):
+        return self._len
+
+    def levels(self, block, start, stop):
+        prices = block[0][start:stop]
+        prices = map(operator.neg, prices) if self.side else prices
+        return list(map(self._level, zip(prices, *[column[start:stop] for column in block[1:]])))
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from self.levels(block, 0, len(block[0]))
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self._len)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            result = []
+            offset = 0
+            for block in self._blocks:
+                if offset >= stop:
+                    break
+                length = len(block[0])
+                if offset + length > start:
+                    result.extend(self.levels(block, max(start - offset, 0), stop - offset))
+                offset += length
+            return result
+        if item < 0:
+            item += self._len
+        if item < 0 or item >= self._len:
+            raise IndexError('order book side index out of range')
+        for block in self._blocks:
+            length = len(block[0])
+            if item < length:
+                return self.level(block, item)
+            item -= length
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            raise TypeError('order book side slices are read only')
+        self.delete(self[item][0])
+        self.storeArray(list(value))
+
+    def __delitem__(self, item):
+        if isinstance(item, slice):
+            for level in self[item]:
+                self.delete(level[0])
+        else:
+            self.delete(self[item][0])
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(self.levels(block, 0, len(block[0])))
+
+    def __contains__(self, level):
+        return any(level == item for item in self)
+
+    def index(self, level, *args):
+        return list(self).index(level, *args)
+
+    def count(self, level):
+        return list(self).count(level)
+
+    def copy(self):
+        return list(self)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __mul__(self, n):
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    def __reduce__(self):
+        # copy, deepcopy and pickle rebuild the side from its levels
+        return (self.__class__, ([list(level) for level in self], self._depth))
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self):
+        return str(list(self))
+
+# -----------------------------------------------------------------------------
+# overwrites absolute volumes at price levels
+# or deletes price levels based on order counts (3rd value in a bidask delta)
+
+
+class ArrayCountedOrderBookSide(ArrayOrderBookSide):
+    __slots__ = ('_raw_counts',)
+    columns = ('d', 'q')
+
+    def __init__(self, deltas=[], depth=None):
+        self._raw_counts = False
+        super(ArrayCountedOrderBookSide, self).__init__(deltas, depth)
+
+    def new_block(self):
+        return [array('d'), array('d'), [] if self._raw_counts else array('q')]
+
+    def store_raw_counts(self):
+        # a third value that is not a number, like the raw delta bitget keeps for its checksum,
+        # is stored as it is from then on, in a list instead of an array, and removes the level when empty
+        self._raw_counts = True
+        for block in self._blocks:
+            block[2] = list(block[2])
+
+    def storeArray(self, delta):
+        self._version += 1
+        price = delta[0]
+        size = delta[1]
+        count = delta[2]
+        if price.__class__ is float:
+            index_price = -price if self.side else price
+        else:
+            index_price = self.index_price(price)
+        if size.__class__ is not float:
+            size = self.number(size)
+        if not self._raw_counts:
+            try:
+                count = int(self.number(count))
+            except TypeError:
+                self.store_raw_counts()
+        i, j, found = self.find(index_price)
+        if size and count:
+            if found:
+                block = self._blocks[i]
+                block[1][j] = size
+                block[2][j] = count
+            else:
+                self.insert_at(i, j, index_price, (size, count))
+        elif found:
+            self.delete_at(i, j)
+
+    def store(self, price, size, count):
+        self.storeArray([price, size, count])
+
 # -----------------------------------------------------------------------------
 # a more elegant syntax is possible here, but native inheritance is portable
 
@@ -169,3 +530,7 @@ class CountedAsks(CountedOrderBookSide): side = False                       # no
 class CountedBids(CountedOrderBookSide): side = True                        # noqa
 class IndexedAsks(IndexedOrderBookSide): side = False                       # noqa
 class IndexedBids(IndexedOrderBookSide): side = True                        # noqa
+class ArrayAsks(ArrayOrderBookSide): side = False                           # noqa
+class ArrayBids(ArrayOrderBookSide): side = True                            # noqa
+class ArrayCountedAsks(ArrayCountedOrderBookSide): side = False             # noqa
+class ArrayCountedBids(ArrayCountedOrderBookSide): side = True              # noqa
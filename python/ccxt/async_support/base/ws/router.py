@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""The handlers of the messages of an exchange by channel or event, looked up without rebuilding a table per message"""
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'MessageRouter',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class MessageRouter:
+    """One table of routes of Exchange.message_routes()
+
+    The routes are tried in this order: 'exact' by the whole route, 'prefix' and 'contains' in the order they are listed,
+    then 'predicate', a list of [predicate(route), handler]. The handler found for a route is remembered, the routes of
+    the messages of a connection repeat"""
+
+    max_resolved = 1024
+
+    def __init__(self, routes):
+        self.exact = dict(routes.get('exact', {}))
+        self.prefixes = list(routes.get('prefix', {}).items())
+        self.substrings = list(routes.get('contains', {}).items())
+        self.predicates = [tuple(predicate) for predicate in routes.get('predicate', [])]
+        # the exact routes and the routes resolved so far
+        self.resolved = dict(self.exact)
+
+    def find(self, route):
+        try:
+            return self.resolved[route]
+        except (KeyError, TypeError):
+            pass
+        if not isinstance(route, str):
+            return None
+        handler = self.resolve(route)
+        if len(self.resolved) < len(self.exact) + self.max_resolved:
+            self.resolved[route] = handler
+        return handler
+
+    def resolve(self, route):
+        for prefix, handler in self.prefixes:
+            if route.startswith(prefix):
+                return handler
+        for substring, handler in self.substrings:
+            if substring in route:
+                return handler
+        for predicate, handler in self.predicates:
+            if predicate(route):
+                return handler
+        return None
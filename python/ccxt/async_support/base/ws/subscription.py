@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""Every value resolved for the message hashes of a watch method, as an async iterator or passed to a callback"""
+
+import asyncio
+import collections
+import contextvars
+import inspect
+from ccxt.base.errors import ExchangeClosedByUser, NotSupported
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Subscription',
+    'watching',
+]
+
+# -----------------------------------------------------------------------------
+
+# set while the first call of the watch method runs, Exchange.watch and watch_multiple attach the subscription
+watching = contextvars.ContextVar('watching', default=None)
+
+policies = ('drop_oldest', 'conflate', 'block')
+
+
+class Subscription:
+    """The updates of a watch method without a future per update
+
+    The values are the ones the exchange resolves for the message hashes of the last watch or watch_multiple call
+    of the method: a ticker, the order book or the cache of trades, orders and candles, each ticker of watch_tickers.
+    At most max_size values are queued, when the consumer falls behind:
+    'drop_oldest' drops the oldest values, 'conflate' keeps the latest value of each message hash,
+    'block' pauses reading from the connection until the queue goes below max_size or for at most maxReadPause
+    milliseconds of the client, the values received after that are queued beyond max_size"""
+
+    def __init__(self, max_size=1000, policy='drop_oldest', callback=None):
+        if policy not in policies:
+            raise NotSupported('Subscription policy must be one of ' + ', '.join(["'" + name + "'" for name in policies]) + ', got ' + repr(policy))
+        self.max_size = max_size
+        self.policy = policy
+        self.callback = callback
+        # values by message hash for 'conflate', a deque of values otherwise
+        self.queue = {} if policy == 'conflate' else collections.deque(maxlen=max_size if policy == 'drop_oldest' else None)
+        self.dropped = 0
+        self.client = None
+        self.message_hashes = []
+        self.paused = False
+        self.waiter = None
+        self.error = None
+        self.closed = False
+        self.task = None  # the first call of the watch method, then the calls of the callback
+
+    def attach(self, client, message_hashes):
+        # the last watch call of the method wins, the values of the previous ones (authentication) are dropped
+        self.detach()
+        self.queue.clear()
+        self.client = client
+        self.message_hashes = list(message_hashes)
+        for message_hash in self.message_hashes:
+            client.subscribers.setdefault(message_hash, []).append(self)
+
+    def detach(self):
+        if self.client is None:
+            return
+        for message_hash in self.message_hashes:
+            subscribers = self.client.subscribers.get(message_hash)
+            if subscribers and self in subscribers:
+                subscribers.remove(self)
+                if not subscribers:
+                    del self.client.subscribers[message_hash]
+        if self.paused:
+            self.paused = False
+            self.client.resume_reading(self)
+        self.client = None
+        self.message_hashes = []
+
+    def push(self, message_hash, value):
+        queue = self.queue
+        if self.policy == 'conflate':
+            queue[message_hash] = value
+        else:
+            if len(queue) == self.max_size:
+                if self.policy == 'drop_oldest':
+                    self.dropped += 1
+                elif not self.paused:
+                    self.paused = True
+                    self.client.pause_reading(self)
+            queue.append(value)
+        self.wake()
+
+    def fail(self, error):
+        # the values queued before the error are still delivered
+        if self.error is None:
+            self.error = error
+        self.detach()
+        self.wake()
+
+    def close(self):
+        self.closed = True
+        self.detach()
+        self.queue.clear()
+        self.wake()
+
+    def wake(self):
+        waiter = self.waiter
+        if waiter is not None:
+            self.waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def pop(self):
+        queue = self.queue
+        if self.policy == 'conflate':
+            return queue.pop(next(iter(queue)))
+        value = queue.popleft()
+        if self.paused and len(queue) < self.max_size:
+            self.paused = False
+            self.client.resume_reading(self)
+        return value
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            if self.closed:
+                raise StopAsyncIteration
+            if self.queue:
+                return self.pop()
+            if self.error is not None:
+                if isinstance(self.error, ExchangeClosedByUser):
+                    raise StopAsyncIteration
+                raise self.error
+            self.waiter = asyncio.get_running_loop().create_future()
+            await self.waiter
+
+    async def start(self, method, args, kwargs):
+        token = watching.set(self)
+        try:
+            await method(*args, **kwargs)
+        except Exception as error:
+            self.fail(error)
+        finally:
+            watching.reset(token)
+        if self.callback is not None:
+            try:
+                async for value in self:
+                    result = self.callback(value)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as error:
+                # the values of the failed callback are dropped, a paused connection is resumed
+                self.fail(error)
+                self.queue.clear()
+                raise
+            finally:
+                self.detach()
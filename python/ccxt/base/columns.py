@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""The results of fetch_ohlcv, fetch_trades and fetch_funding_rate_history as typed columns"""
+
+import contextvars
+import math
+from array import array
+from ccxt.base.errors import NotSupported
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Columns',
+    'ohlcv_columns',
+    'trade_columns',
+    'funding_rate_columns',
+    'nested_call',
+]
+
+# -----------------------------------------------------------------------------
+
+# set while a converted method runs, the calls made inside it (the pages of a pagination) return rows
+nested_call = contextvars.ContextVar('columns_nested_call', default=False)
+
+dtypes = {'q': 'int64', 'd': 'float64', 'b': 'int8'}
+
+
+class Columns(dict):
+    """Columns by name, array('q') timestamps, array('d') numbers with nan for missing values and lists of strings"""
+
+    def __len__(self):
+        # the number of rows
+        for column in self.values():
+            return len(column)
+        return 0
+
+    def arrays(self):
+        # numpy views of the typed columns without a copy, the lists of strings become arrays of objects
+        try:
+            import numpy as np
+        except ImportError:
+            raise NotSupported('Columns.arrays() requires numpy, install it with "pip install numpy"')
+        return {name: np.frombuffer(column, dtypes[column.typecode]) if isinstance(column, array) else np.array(column, dtype=object) for name, column in self.items()}
+
+    def rows(self):
+        # the columns as tuples, in the order of the columns
+        return list(zip(*self.values()))
+
+
+def timestamps(values):
+    # a missing timestamp is 0, int64 has no nan
+    return array('q', [0 if value is None else int(value) for value in values])
+
+
+def numbers(values):
+    return array('d', [math.nan if value is None else float(value) for value in values])
+
+
+def ohlcv_columns(ohlcvs):
+    return Columns((
+        ('timestamp', timestamps([ohlcv[0] for ohlcv in ohlcvs])),
+        ('open', numbers([ohlcv[1] for ohlcv in ohlcvs])),
+        ('high', numbers([ohlcv[2] for ohlcv in ohlcvs])),
+        ('low', numbers([ohlcv[3] for ohlcv in ohlcvs])),
+        ('close', numbers([ohlcv[4] for ohlcv in ohlcvs])),
+        ('volume', numbers([ohlcv[5] for ohlcv in ohlcvs])),
+    ))
+
+
+def trade_columns(trades):
+    sides = {'buy': 1, 'sell': -1}
+    return Columns((
+        ('timestamp', timestamps([trade.get('timestamp') for trade in trades])),
+        ('price', numbers([trade.get('price') for trade in trades])),
+        ('amount', numbers([trade.get('amount') for trade in trades])),
+        ('cost', numbers([trade.get('cost') for trade in trades])),
+        # 1 for buy, -1 for sell, 0 when the side is unknown
+        ('side', array('b', [sides.get(trade.get('side'), 0) for trade in trades])),
+        ('id', [trade.get('id') for trade in trades]),
+        ('symbol', [trade.get('symbol') for trade in trades]),
+    ))
+
+
+def funding_rate_columns(rates):
+    return Columns((
+        ('timestamp', timestamps([rate.get('timestamp') for rate in rates])),
+        ('fundingRate', numbers([rate.get('fundingRate') for rate in rates])),
+        ('symbol', [rate.get('symbol') for rate in rates]),
+    ))
@@ -1,4 +1,6 @@
 import decimal
+import fractions
+import functools
 import numbers
 import itertools
 import re
@@ -14,6 +16,9 @@ __all__ = [
     'NO_PADDING',
     'PAD_WITH_ZERO',
     'decimal_to_precision',
+    'PrecisionFormatter',
+    'precision_formatter',
+    'fast_decimal_to_precision',
 ]
 
 
@@ -165,6 +170,156 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
             return precise
 
 
+# -----------------------------------------------------------------------------
+# the formatting of one precision computed once, the common cases without Decimal and the decimal context
+
+number_pattern = re.compile(r'[0-9]+(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?')
+
+# the integer arithmetic stays below the 28 digits of the default decimal context
+max_scaled = 10 ** 26
+max_places = 20
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_positive(string):
+    # (integer, decimals >= 0) of a plain positive number string, None for anything else
+    if number_pattern.fullmatch(string) is None:
+        return None
+    modifier = 0
+    string = string.lower()
+    if 'e' in string:
+        string, modifier = string.split('e')
+        modifier = int(modifier)
+    dot = string.find('.')
+    decimals = (len(string) - dot - 1 if dot > -1 else 0) - modifier
+    integer = int(string.replace('.', ''))
+    if decimals < 0:
+        return integer * 10 ** -decimals, 0
+    return integer, decimals
+
+
+def scaled_to_string(integer, places, padding_mode):
+    # integer / 10 ** places
+    if padding_mode == PAD_WITH_ZERO:
+        if places == 0:
+            return str(integer)
+        digits = str(integer).rjust(places + 1, '0')
+        return digits[:-places] + '.' + digits[-places:]
+    string = str(integer)
+    stripped = string.rstrip('0')
+    if integer == 0 or places == 0:
+        return string
+    places -= len(string) - len(stripped)
+    if places <= 0:
+        return stripped + '0' * -places
+    stripped = stripped.rjust(places + 1, '0')
+    return stripped[:-places] + '.' + stripped[-places:]
+
+
+class PrecisionFormatter:
+    """decimal_to_precision() with one precision, counting mode and padding mode fixed in advance
+
+    Positive numbers in DECIMAL_PLACES and TICK_SIZE modes are rounded with integers, anything else goes to
+    decimal_to_precision(), the results are the same"""
+
+    def __init__(self, precision, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+        self.precision = precision
+        self.counting_mode = counting_mode
+        self.padding_mode = padding_mode
+        self.places = None  # the decimal places of the result, None when every number goes to decimal_to_precision()
+        self.tick = None  # (integer, decimals) of the tick size
+        self.half = None  # (numerator, denominator) of half the tick size the way decimal_to_precision() compares to it
+        if padding_mode not in (NO_PADDING, PAD_WITH_ZERO) or isinstance(precision, bool):
+            return
+        if counting_mode == DECIMAL_PLACES:
+            if isinstance(precision, numbers.Integral) and 0 <= precision <= max_places:
+                self.places = int(precision)
+        elif counting_mode == TICK_SIZE:
+            if not isinstance(precision, (float, decimal.Decimal, numbers.Integral, str)):
+                return
+            try:
+                tick = float(precision) if isinstance(precision, str) else precision
+                if not tick > 0:
+                    return
+                self.tick = parse_positive(str(tick))
+                half = fractions.Fraction(tick / 2)
+                self.half = (half.numerator, half.denominator)
+                string = '{:f}'.format(decimal.Decimal(str(tick)))
+            except (ValueError, ArithmeticError):
+                return
+            if self.tick is None:
+                return
+            # the decimal places of the tick size like decimal_to_precision() finds them
+            parts = re.sub(r'0+$', '', string).split('.')
+            places = len(parts[1]) if len(parts) > 1 else 0
+            if places <= max_places:
+                self.places = places
+
+    def __call__(self, n, rounding_mode=ROUND):
+        if self.places is not None and (rounding_mode == ROUND or rounding_mode == TRUNCATE):
+            kind = type(n)
+            if kind is float:
+                # repr() of a float has a dot unless it is nan or inf, -0.0 is negative for decimal_to_precision()
+                string = repr(n)
+                dot = string.find('.')
+                parsed = (int(string.replace('.', '')), len(string) - dot - 1) if dot > 0 and string[0] != '-' and 'e' not in string else parse_positive(string)
+            elif kind is int:
+                parsed = (n, 0) if n >= 0 else None
+            elif kind is str:
+                parsed = parse_positive(n)
+            else:
+                parsed = None
+            if parsed is not None:
+                result = self.format(parsed[0], parsed[1], rounding_mode)
+                if result is not None:
+                    return result
+        return decimal_to_precision(n, rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+
+    def format(self, integer, decimals, rounding_mode):
+        if self.tick is not None:
+            tick, tick_decimals = self.tick
+            scale = max(decimals, tick_decimals)
+            integer *= 10 ** (scale - decimals)
+            tick *= 10 ** (scale - tick_decimals)
+            if integer >= max_scaled:
+                return None
+            missing = integer % tick
+            if missing:
+                integer -= missing
+                if rounding_mode == ROUND and missing * self.half[1] >= self.half[0] * 10 ** scale:
+                    integer += tick
+            # the multiple of the tick size is then rounded to its decimal places
+            rounding_mode = ROUND
+            decimals = scale
+        places = self.places
+        if decimals <= places:
+            integer *= 10 ** (places - decimals)
+        else:
+            divisor = 10 ** (decimals - places)
+            integer, remainder = divmod(integer, divisor)
+            if rounding_mode == ROUND and remainder * 2 >= divisor:
+                # half away from zero
+                integer += 1
+        if integer >= max_scaled:
+            return None
+        return scaled_to_string(integer, places, self.padding_mode)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def precision_formatter(precision, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    return PrecisionFormatter(precision, counting_mode, padding_mode)
+
+
+def fast_decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    # decimal_to_precision() through the formatter of the precision
+    try:
+        formatter = precision_formatter(precision, counting_mode, padding_mode)
+    except TypeError:
+        # an unhashable precision
+        return decimal_to_precision(n, rounding_mode, precision, counting_mode, padding_mode)
+    return formatter(n, rounding_mode)
+
+
 def number_to_string(x):
     # avoids scientific notation for too large and too small numbers
     if x is None:
@@ -27,26 +27,33 @@ from ccxt.base.errors import ProxyError
 
 # -----------------------------------------------------------------------------
 
-from ccxt.base.decimal_to_precision import decimal_to_precision
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE, NO_PADDING, TRUNCATE, ROUND, ROUND_UP, ROUND_DOWN, SIGNIFICANT_DIGITS
 from ccxt.base.decimal_to_precision import number_to_string
+from ccxt.base.decimal_to_precision import fast_decimal_to_precision, precision_formatter
+from ccxt.base.json_decoders import json_decoder
 from ccxt.base.precise import Precise
 from ccxt.base.types import BalanceAccount, Currency, IndexType, OrderSide, OrderType, Trade, OrderRequest, Market, MarketType, Str, Num, Strings
+from ccxt.base.shared_markets import registry as shared_markets_registry
+from ccxt.base.markets_cache import cache_path as markets_cache_path, read as read_markets_cache, write as write_markets_cache
+from ccxt.base.columns import ohlcv_columns, trade_columns, funding_rate_columns, nested_call as columns_nested_call
 
 # -----------------------------------------------------------------------------
 
+# the signing dependencies are imported on first use, most programs never sign with them
+from ccxt.base.lazy import LazyModule
+
 # rsa jwt signing
-from cryptography.hazmat import backends
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
+backends = LazyModule('cryptography.hazmat.backends')
+hashes = LazyModule('cryptography.hazmat.primitives.hashes')
+padding = LazyModule('cryptography.hazmat.primitives.asymmetric.padding')
 # from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
-from cryptography.hazmat.primitives.serialization import load_pem_private_key
+serialization = LazyModule('cryptography.hazmat.primitives.serialization')
 
 # -----------------------------------------------------------------------------
 
 # ecdsa signing
-from ccxt.static_dependencies import ecdsa
-from ccxt.static_dependencies import keccak
+ecdsa = LazyModule('ccxt.static_dependencies.ecdsa')
+keccak = LazyModule('ccxt.static_dependencies.keccak')
 
 # eddsa signing
 try:
@@ -55,9 +62,9 @@ except ImportError:
     eddsa = None
 
 # eth signing
-from ccxt.static_dependencies.ethereum import abi
-from ccxt.static_dependencies.ethereum import account
-from ccxt.static_dependencies.msgpack import packb
+abi = LazyModule('ccxt.static_dependencies.ethereum.abi')
+account = LazyModule('ccxt.static_dependencies.ethereum.account')
+msgpack = LazyModule('ccxt.static_dependencies.msgpack')
 
 
 # -----------------------------------------------------------------------------
@@ -81,8 +88,11 @@ import gzip
 import hashlib
 import hmac
 import io
+import itertools
 import json
 import math
+import operator
+import pickle
 import random
 from numbers import Number
 import re
@@ -205,6 +215,15 @@ class Exchange(object):
     twofa = None
     markets_by_id = None
     currencies_by_id = None
+    sharedMarkets = False  # instances with the same id and options load the markets once and share them read-only
+    _shared_markets = None
+    markets_sources = None  # the markets and currencies of the last load, update_markets() compares the next one with them
+    markets_changes = None  # the symbols and currency codes that changed in the last load
+    marketsCache = None  # a directory where the markets and currencies are kept between runs
+    bulkParsing = False  # parse_trades, parse_ohlcvs and parse_orders filter while parsing and do not sort data that is already in order
+    resultsFormat = 'rows'  # 'columns' returns fetch_ohlcv, fetch_trades and fetch_funding_rate_history as typed arrays by column
+    jsonDecoder = 'json'  # the decoder of the responses and the ws messages, 'orjson' or 'auto' to use orjson when it is installed
+    marketsCacheTTL = 86400000  # milliseconds before the cached markets are loaded again from the exchange
     precision = None
     exceptions = None
     limits = {
@@ -437,7 +456,7 @@ class Exchange(object):
         self.ohlcvs = dict() if self.ohlcvs is None else self.ohlcvs
         self.currencies = dict() if self.currencies is None else self.currencies
         self.options = self.get_default_options() if self.options is None else self.options  # Python does not allow to define properties in run-time with setattr
-        self.decimal_to_precision = decimal_to_precision
+        self.decimal_to_precision = fast_decimal_to_precision
         self.number_to_string = number_to_string
 
         # version = '.'.join(map(str, sys.version_info[:3]))
@@ -448,13 +467,15 @@ class Exchange(object):
         self.origin = self.uuid()
         self.userAgent = default_user_agent()
 
-        settings = self.deep_extend(self.describe(), config)
+        # settings is a private copy, its dicts are moved into the attributes instead of being copied again
+        settings = self.deep_merge(self.describe_copy(), self.deep_extend(None, config))
 
         for key in settings:
-            if hasattr(self, key) and isinstance(getattr(self, key), dict):
-                setattr(self, key, self.deep_extend(getattr(self, key), settings[key]))
+            value = settings[key]
+            if hasattr(self, key) and isinstance(getattr(self, key), dict) and isinstance(value, dict):
+                setattr(self, key, self.deep_merge(self.deep_extend(None, getattr(self, key)), value))
             else:
-                setattr(self, key, settings[key])
+                setattr(self, key, value)
 
         if self.markets:
             self.set_markets(self.markets)
@@ -462,22 +483,35 @@ class Exchange(object):
         self.after_construct()
 
         # convert all properties from underscore notation foo_bar to camelcase notation fooBar
+        # the first instance of a class aliases the methods on the class and records the names of the other attributes
         cls = type(self)
-        for name in dir(self):
-            if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
-                else:
-                    if hasattr(self, camelcase):
-                        if attr is not None:
-                            setattr(self, camelcase, attr)
+        aliases = cls.__dict__.get('_camelcase_aliases')
+        if aliases is None:
+            aliases = {}
+            for name in dir(cls):
+                if self.is_underscore_name(name):
+                    camelcase = self.camelcase_name(name)
+                    if name not in self.__dict__ and isinstance(getattr(self, name), types.MethodType):
+                        setattr(cls, camelcase, getattr(cls, name))
                     else:
-                        setattr(self, camelcase, attr)
+                        aliases[name] = camelcase
+            cls._camelcase_aliases = aliases
+        # attributes that only this instance has, from the config
+        extra = [name for name in self.__dict__ if name not in aliases and self.is_underscore_name(name)]
+        for name in itertools.chain(aliases, extra):
+            attr = getattr(self, name)
+            camelcase = aliases[name] if name in aliases else self.camelcase_name(name)
+            if hasattr(self, camelcase):
+                if attr is not None:
+                    setattr(self, camelcase, attr)
+            else:
+                setattr(self, camelcase, attr)
+
+        if self.bulkParsing:
+            self.use_bulk_parsing()
+        if self.resultsFormat == 'columns':
+            self.use_columnar_results()
+        self.json_loads = json_decoder(self.jsonDecoder)
 
         self.tokenBucket = self.extend({
             'refillRate': 1.0 / self.rateLimit if self.rateLimit > 0 else float('inf'),
@@ -507,7 +541,21 @@ class Exchange(object):
     def describe(self):
         return {}
 
-    def throttle(self, cost=None):
+    def describe_copy(self):
+        # describe() is built once per class and copied with pickle for each instance, much faster than building it again
+        cls = type(self)
+        described = cls.__dict__.get('_described')
+        if described is None:
+            description = self.describe()
+            # bound methods and other objects could tie the copies to this instance, describe() is called for each instance then
+            described = pickle.dumps(description, pickle.HIGHEST_PROTOCOL) if self.is_plain_tree(description) else False
+            cls._described = described
+            return description
+        if described is False:
+            return self.describe()
+        return pickle.loads(described)
+
+    def throttle(self, cost=None, api=None, method=None, path=None, config={}):
         now = float(self.milliseconds())
         elapsed = now - self.lastRestRequestTimestamp
         cost = 1 if cost is None else cost
@@ -547,10 +595,7 @@ class Exchange(object):
         return response_body.strip()
 
     def on_json_response(self, response_body):
-        if self.quoteJsonNumbers:
-            return json.loads(response_body, parse_float=str, parse_int=str)
-        else:
-            return json.loads(response_body)
+        return self.json_loads(response_body, self.quoteJsonNumbers)
 
     def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
@@ -692,8 +737,14 @@ class Exchange(object):
         content_type = headers.get('Content-Type', '')
         return content_type.startswith('application/json') or content_type.startswith('text/')
 
+    # the safe_* methods below look plain dicts up with dict.get() first, those are nearly all the parsed responses
+    # the other types of objects go through key_exists() as before
+
     @staticmethod
     def key_exists(dictionary, key):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            return value is not None and value != ''
         if hasattr(dictionary, '__getitem__') and not isinstance(dictionary, str):
             if isinstance(dictionary, list) and type(key) is not int:
                 return False
@@ -706,6 +757,14 @@ class Exchange(object):
 
     @staticmethod
     def safe_float(dictionary, key, default_value=None):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            if value is None or value == '':
+                return default_value
+            try:
+                return float(value)
+            except ValueError:
+                return default_value
         value = default_value
         try:
             if Exchange.key_exists(dictionary, key):
@@ -716,6 +775,11 @@ class Exchange(object):
 
     @staticmethod
     def safe_string(dictionary, key, default_value=None):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            if value is None or value == '':
+                return default_value
+            return value if type(value) is str else str(value)
         return str(dictionary[key]) if Exchange.key_exists(dictionary, key) else default_value
 
     @staticmethod
@@ -734,9 +798,14 @@ class Exchange(object):
 
     @staticmethod
     def safe_integer(dictionary, key, default_value=None):
-        if not Exchange.key_exists(dictionary, key):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            if value is None or value == '':
+                return default_value
+        elif not Exchange.key_exists(dictionary, key):
             return default_value
-        value = dictionary[key]
+        else:
+            value = dictionary[key]
         try:
             # needed to avoid breaking on "100.0"
             # https://stackoverflow.com/questions/1094717/convert-a-string-to-integer-with-decimal-in-python#1094721
@@ -748,9 +817,14 @@ class Exchange(object):
 
     @staticmethod
     def safe_integer_product(dictionary, key, factor, default_value=None):
-        if not Exchange.key_exists(dictionary, key):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            if value is None or value == '':
+                return default_value
+        elif not Exchange.key_exists(dictionary, key):
             return default_value
-        value = dictionary[key]
+        else:
+            value = dictionary[key]
         if isinstance(value, Number):
             return int(value * factor)
         elif isinstance(value, str):
@@ -766,6 +840,9 @@ class Exchange(object):
 
     @staticmethod
     def safe_value(dictionary, key, default_value=None):
+        if type(dictionary) is dict:
+            value = dictionary.get(key)
+            return default_value if value is None or value == '' else value
         return dictionary[key] if Exchange.key_exists(dictionary, key) else default_value
 
     # we're not using safe_floats with a list argument as we're trying to save some cycles here
@@ -777,6 +854,13 @@ class Exchange(object):
 
     @staticmethod
     def safe_string_2(dictionary, key1, key2, default_value=None):
+        if type(dictionary) is dict:
+            value = dictionary.get(key1)
+            if value is None or value == '':
+                value = dictionary.get(key2)
+                if value is None or value == '':
+                    return default_value
+            return value if type(value) is str else str(value)
         return Exchange.safe_either(Exchange.safe_string, dictionary, key1, key2, default_value)
 
     @staticmethod
@@ -802,6 +886,13 @@ class Exchange(object):
 
     @staticmethod
     def safe_value_2(dictionary, key1, key2, default_value=None):
+        if type(dictionary) is dict:
+            value = dictionary.get(key1)
+            if value is None or value == '':
+                value = dictionary.get(key2)
+                if value is None or value == '':
+                    return default_value
+            return value
         return Exchange.safe_either(Exchange.safe_value, dictionary, key1, key2, default_value)
 
     # safe_method_n methods family
@@ -885,8 +976,13 @@ class Exchange(object):
 
     @staticmethod
     def get_object_value_from_key_list(dictionary_or_list, key_list):
+        is_dict = type(dictionary_or_list) is dict
         for key in key_list:
-            if isinstance(key, str):
+            if is_dict and type(key) is str:
+                value = dictionary_or_list.get(key)
+                if value is not None and value != '':
+                    return value
+            elif isinstance(key, str):
                 if key in dictionary_or_list and dictionary_or_list[key] is not None and dictionary_or_list[key] != '':
                     return dictionary_or_list[key]
             elif key is not None:
@@ -964,6 +1060,37 @@ class Exchange(object):
             return result
         return {}
 
+    @staticmethod
+    def deep_merge(target, source):
+        # deep_extend(target, source) into target, the dicts of source are moved instead of copied
+        for key in source:
+            value = source[key]
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                Exchange.deep_merge(target[key], value)
+            else:
+                target[key] = value
+        return target
+
+    @staticmethod
+    def is_plain_tree(value):
+        # dicts, lists and tuples of plain values and classes, like the exceptions of describe()
+        if isinstance(value, dict):
+            return all(Exchange.is_plain_tree(item) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return all(Exchange.is_plain_tree(item) for item in value)
+        return value is None or isinstance(value, (str, int, float, type))
+
+    @staticmethod
+    def is_underscore_name(name):
+        return name[0] != '_' and name[-1] != '_' and '_' in name
+
+    @staticmethod
+    def camelcase_name(name):
+        parts = name.split('_')
+        # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+        exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
+        return parts[0] + ''.join(exceptions.get(i, Exchange.capitalize(i)) for i in parts[1:])
+
     @staticmethod
     def deep_extend(*args):
         result = None
@@ -1354,7 +1481,7 @@ class Exchange(object):
             "sha512": hashes.SHA512(),
         }
         algorithm = algorithms[alg]
-        priv_key = load_pem_private_key(Exchange.encode(secret), None, backends.default_backend())
+        priv_key = serialization.load_pem_private_key(Exchange.encode(secret), None, backends.default_backend())
         return Exchange.binary_to_base64(priv_key.sign(Exchange.encode(request), padding.PKCS1v15(), algorithm))
 
     @staticmethod
@@ -1368,7 +1495,7 @@ class Exchange(object):
 
     @staticmethod
     def packb(o):
-        return packb(o)
+        return msgpack.packb(o)
 
     @staticmethod
     def int_to_base16(num):
@@ -1426,7 +1553,7 @@ class Exchange(object):
 
     @staticmethod
     def eddsa(request, secret, curve='ed25519'):
-        private_key = load_pem_private_key(Exchange.encode(secret), None)
+        private_key = serialization.load_pem_private_key(Exchange.encode(secret), None)
         return Exchange.binary_to_base64(private_key.sign(request))
 
     @staticmethod
@@ -1510,11 +1637,218 @@ class Exchange(object):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+        if self.sharedMarkets and not params:
+            return self.load_shared_markets(reload)
+        markets, currencies = self.load_markets_and_currencies(reload, params)
+        self.update_markets(markets, currencies)
+        return self.markets
+
+    def markets_cache_file(self, params={}):
+        # the markets fetched with params are not cached, they can be a subset of the markets
+        if self.marketsCache is None or params:
+            return None
+        return markets_cache_path(self.marketsCache, shared_markets_registry.key(self))
+
+    def store_markets_cache(self, path, markets, currencies):
+        try:
+            write_markets_cache(path, __version__, markets, currencies)
+        except (OSError, TypeError, ValueError) as e:
+            # the cache is an optimization, the markets are loaded anyway
+            self.logger.warning('%s could not write the markets cache %s: %s', self.id, path, e)
+
+    def load_markets_and_currencies(self, reload=False, params={}):
+        path = self.markets_cache_file(params)
+        if path is not None and not reload:
+            cached = read_markets_cache(path, __version__)
+            if cached is not None and self.milliseconds() - cached[2] < self.marketsCacheTTL:
+                return cached[0], cached[1]
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = self.fetch_currencies()
         markets = self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        if path is not None:
+            self.store_markets_cache(path, markets, currencies)
+        return markets, currencies
+
+    def shared_markets_entry(self):
+        # the entry is kept, the options can change while the markets load and would give another key
+        if self._shared_markets is None:
+            self._shared_markets = shared_markets_registry.entry(self)
+            self._shared_markets.attach(self)
+        return self._shared_markets
+
+    def load_shared_markets(self, reload=False):
+        shared = self.shared_markets_entry()
+        with shared.lock:
+            if not reload and shared.values is not None:
+                return shared.apply(self)
+            markets, currencies = self.load_markets_and_currencies(reload)
+            self.update_markets(markets, currencies)
+            return shared.store(self)
+
+    def update_markets(self, markets, currencies=None):
+        # set_markets() for a reload, only the markets and currencies that differ from the last load are built again
+        # the unchanged market and currency structures are kept, markets and markets_by_id are patched in place,
+        # or in copies when they are shared
+        # returns the symbols added, removed and changed since the last load and the codes of the changed currencies
+        values = self.sort_by(self.to_array(markets), 'spot', True, True)
+        sources = self.markets_sources
+        by_symbol = {value['symbol']: value for value in values}
+        if sources is not None and sources['markets'] is self.markets:
+            previous = sources['values']
+            added = sorted(symbol for symbol in by_symbol if symbol not in previous)
+            removed = sorted(symbol for symbol in previous if symbol not in by_symbol)
+            changed = sorted(symbol for symbol in by_symbol if symbol in previous and previous[symbol] != by_symbol[symbol])
+        else:
+            # the first load or set_markets() was called since, the changes are those to the markets it installed
+            installed = self.markets if isinstance(self.markets, dict) else {}
+            added = sorted(symbol for symbol in by_symbol if symbol not in installed)
+            removed = sorted(symbol for symbol in installed if symbol not in by_symbol)
+            changed = sorted(symbol for symbol in by_symbol if symbol in installed and installed[symbol] != self.market_structure_from(by_symbol[symbol]))
+        before = self.currencies if isinstance(self.currencies, dict) else {}
+        if sources is None or sources['markets'] is not self.markets or not self.markets_by_id or len(by_symbol) < len(values) or (currencies is None) != (sources['currencies'] is None):
+            # the first load, set_markets() was called since or several markets have the same symbol
+            self.set_markets(values, currencies)
+            codes = sorted(code for code in self.currencies if before.get(code) != self.currencies[code])
+        else:
+            codes = self.patch_markets(previous, by_symbol, values, currencies, sources['currencies'], added, removed, changed)
+        self.markets_sources = {'markets': self.markets, 'values': by_symbol, 'currencies': currencies}
+        self.markets_changes = {
+            'added': added,
+            'removed': removed,
+            'changed': changed,
+            'currencies': codes,
+        }
+        self.compile_precision_formatters(added + changed)
+        return self.markets_changes
+
+    def compile_precision_formatters(self, symbols):
+        # the formatters of the price and amount precisions used by price_to_precision() and amount_to_precision()
+        # are built with the markets instead of on the first order
+        for symbol in symbols:
+            precision = self.safe_dict(self.markets.get(symbol), 'precision', {})
+            for key in ('price', 'amount'):
+                value = precision.get(key)
+                if value is not None and not isinstance(value, (dict, list)):
+                    precision_formatter(value, self.precisionMode, self.paddingMode)
+
+    def patch_markets(self, previous, by_symbol, values, currencies, previous_currencies, added, removed, changed):
+        # shared markets are patched in copies, the other instances hold the same objects until SharedMarkets.store()
+        # replaces them, the patched structures are assigned at the end
+        shared = self._shared_markets is not None
+        markets = dict(self.markets) if shared else self.markets
+        markets_by_id = dict(self.markets_by_id) if shared else self.markets_by_id
+        all_currencies = dict(self.currencies) if shared else self.currencies
+        base_currencies = dict(self.baseCurrencies) if shared and self.baseCurrencies is not None else self.baseCurrencies
+        quote_currencies = dict(self.quoteCurrencies) if shared and self.quoteCurrencies is not None else self.quoteCurrencies
+        symbols = self.symbols
+        ids = self.ids
+        currencies_by_id = self.currencies_by_id
+        all_codes = self.codes
+        changed_ids = set()
+        for symbol in removed:
+            changed_ids.add(previous[symbol]['id'])
+            del markets[symbol]
+        for symbol in changed:
+            changed_ids.add(previous[symbol]['id'])
+        for symbol in added + changed:
+            value = by_symbol[symbol]
+            changed_ids.add(value['id'])
+            markets[symbol] = self.market_structure_from(value)
+        if changed_ids:
+            # the markets with the same id are listed spot first, like in set_markets()
+            by_id = {}
+            for value in values:
+                if value['id'] in changed_ids:
+                    by_id.setdefault(value['id'], []).append(value)
+            for id in changed_ids:
+                if id in by_id:
+                    markets_by_id[id] = by_id[id]
+                else:
+                    markets_by_id.pop(id, None)
+        if added or removed:
+            symbols = sorted(markets)
+            ids = sorted(markets_by_id)
+        if currencies is not None:
+            codes = sorted(code for code in currencies if previous_currencies.get(code) != currencies[code])
+            for code in codes:
+                all_currencies[code] = self.deep_extend(all_currencies.get(code), currencies[code])
+        else:
+            codes = set()
+            for market in [previous[symbol] for symbol in removed + changed] + [by_symbol[symbol] for symbol in added + changed]:
+                codes.update((self.safe_string(market, 'base'), self.safe_string(market, 'quote')))
+            codes.discard(None)
+            codes = [code for code in sorted(codes) if self.derive_currency(code, values, markets, all_currencies, base_currencies, quote_currencies)]
+        if codes:
+            currencies_by_id = self.index_by(all_currencies, 'id')
+            all_codes = sorted(all_currencies)
+        self.markets = markets
+        self.markets_by_id = markets_by_id
+        self.symbols = symbols
+        self.ids = ids
+        self.currencies = all_currencies
+        self.currencies_by_id = currencies_by_id
+        self.codes = all_codes
+        self.baseCurrencies = base_currencies
+        self.quoteCurrencies = quote_currencies
+        return codes
+
+    def market_structure_from(self, value):
+        # a market of set_markets()
+        market = self.deep_extend(self.safe_market_structure(), {
+            'precision': self.precision,
+            'limits': self.limits,
+        }, self.fees['trading'], value)
+        if market['linear']:
+            market['subType'] = 'linear'
+        elif market['inverse']:
+            market['subType'] = 'inverse'
+        else:
+            market['subType'] = None
+        return market
+
+    def derive_currency(self, code, values, markets, all_currencies, base_currencies, quote_currencies):
+        # the currency of set_markets() without fetched currencies, from the markets with code as base or quote
+        # returns True if the currency changed
+        defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+        bases = []
+        quotes = []
+        for value in values:
+            market = markets[value['symbol']]
+            marketPrecision = self.safe_dict(market, 'precision', {})
+            if market['base'] == code:
+                bases.append(self.safe_currency_structure({
+                    'id': self.safe_string_2(market, 'baseId', 'base'),
+                    'numericId': self.safe_integer(market, 'baseNumericId'),
+                    'code': code,
+                    'precision': self.safe_value_2(marketPrecision, 'base', 'amount', defaultCurrencyPrecision),
+                }))
+            if market['quote'] == code:
+                quotes.append(self.safe_currency_structure({
+                    'id': self.safe_string_2(market, 'quoteId', 'quote'),
+                    'numericId': self.safe_integer(market, 'quoteNumericId'),
+                    'code': code,
+                    'precision': self.safe_value_2(marketPrecision, 'quote', 'price', defaultCurrencyPrecision),
+                }))
+        for currencies, derived in ((base_currencies, bases), (quote_currencies, quotes)):
+            if derived:
+                currencies[code] = derived[-1]
+            else:
+                currencies.pop(code, None)
+        if not bases and not quotes:
+            # set_markets() keeps the currencies of the markets that were removed
+            return False
+        highestPrecisionCurrency = None
+        for currency in bases + quotes:
+            if highestPrecisionCurrency is None:
+                highestPrecisionCurrency = currency
+            elif self.precisionMode == TICK_SIZE:
+                highestPrecisionCurrency = currency if (currency['precision'] < highestPrecisionCurrency['precision']) else highestPrecisionCurrency
+            else:
+                highestPrecisionCurrency = currency if (currency['precision'] > highestPrecisionCurrency['precision']) else highestPrecisionCurrency
+        previous = all_currencies.get(code)
+        all_currencies[code] = self.deep_extend(previous, highestPrecisionCurrency)
+        return previous != all_currencies[code]
 
     def fetch_markets(self, params={}):
         # markets are returned as a list
@@ -1746,6 +2080,99 @@ class Exchange(object):
     def create_safe_dictionary(self):
         return {}
 
+    def use_bulk_parsing(self):
+        # replaces the methods on this instance, unless the exchange class has its own
+        for name, method in (('parse_trades', self.parse_trades_in_bulk), ('parse_ohlcvs', self.parse_ohlcvs_in_bulk), ('parse_orders', self.parse_orders_in_bulk)):
+            if getattr(type(self), name) is getattr(Exchange, name):
+                setattr(self, name, method)
+                setattr(self, self.camelcase_name(name), method)
+
+    def use_columnar_results(self):
+        for name, convert in (('fetch_ohlcv', ohlcv_columns), ('fetch_trades', trade_columns), ('fetch_funding_rate_history', funding_rate_columns)):
+            method = self.with_columnar_results(getattr(self, name), convert)
+            setattr(self, name, method)
+            setattr(self, self.camelcase_name(name), method)
+
+    @staticmethod
+    def with_columnar_results(method, convert):
+        # the outermost call converts its rows, the calls made inside it, like the pages of a pagination, return rows
+        def wrapper(*args, **kwargs):
+            if columns_nested_call.get():
+                return method(*args, **kwargs)
+            token = columns_nested_call.set(True)
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                columns_nested_call.reset(token)
+            return convert(result)
+        return wrapper
+
+    @staticmethod
+    def sort_by_keys(array, keys):
+        # a stable sort by precomputed keys, an array already in order or in strictly reverse order is not sorted again
+        following = keys[1:]
+        if all(map(operator.le, keys, following)):
+            return array
+        if all(map(operator.gt, keys, following)):
+            array.reverse()
+            return array
+        return [array[i] for i in sorted(range(len(array)), key=keys.__getitem__)]
+
+    def parse_trades_in_bulk(self, trades: List[Any], market: Market = None, since: Int = None, limit: Int = None, params={}):
+        # the results of parse_trades() in one pass, the trades are filtered by symbol and since as they are parsed
+        symbol = market['symbol'] if (market is not None) else None
+        parse_trade = self.parse_trade
+        result = []
+        for trade in self.to_array(trades):
+            trade = parse_trade(trade, market)
+            if params:
+                trade = self.extend(trade, params)
+            if symbol is not None and trade['symbol'] != symbol:
+                continue
+            if since is not None:
+                # like filter_by_value_since_limit(), where a since of 0 filters everything out
+                timestamp = self.safe_value(trade, 'timestamp')
+                if not (timestamp and since and timestamp >= since):
+                    continue
+            result.append(trade)
+        keys = [(trade['timestamp'] if trade['timestamp'] is not None else '', trade['id'] if trade['id'] is not None else '') for trade in result]
+        return self.filter_by_limit(self.sort_by_keys(result, keys), limit, 'timestamp', since is not None)
+
+    def parse_ohlcvs_in_bulk(self, ohlcvs: List[object], market: Any = None, timeframe: str = '1m', since: Int = None, limit: Int = None):
+        # the results of parse_ohlcvs() in one pass, the candles are filtered by since as they are parsed
+        parse_ohlcv = self.parse_ohlcv
+        result = []
+        for ohlcv in ohlcvs:
+            candle = parse_ohlcv(ohlcv, market)
+            if since is not None:
+                timestamp = candle[0] if candle else None
+                if not (timestamp and timestamp >= since):
+                    continue
+            result.append(candle)
+        keys = [candle[0] if candle[0] is not None else 0 for candle in result]
+        return self.filter_by_limit(self.sort_by_keys(result, keys), limit, 0, since is not None)
+
+    def parse_orders_in_bulk(self, orders: object, market: Market = None, since: Int = None, limit: Int = None, params={}):
+        # the results of parse_orders() in one pass, the orders are filtered by symbol and since as they are parsed
+        if not isinstance(orders, list):
+            orders = [self.extend({'id': id}, orders[id]) for id in orders]
+        symbol = market['symbol'] if (market is not None) else None
+        parse_order = self.parse_order
+        result = []
+        for order in orders:
+            order = parse_order(order, market)
+            if params:
+                order = self.extend(order, params)
+            if symbol is not None and order['symbol'] != symbol:
+                continue
+            if since is not None:
+                timestamp = self.safe_value(order, 'timestamp')
+                if not (timestamp and since and timestamp >= since):
+                    continue
+            result.append(order)
+        keys = [order['timestamp'] if order['timestamp'] is not None else 0 for order in result]
+        return self.filter_by_limit(self.sort_by_keys(result, keys), limit, 'timestamp', since is not None)
+
     # ########################################################################
     # ########################################################################
     # ########################################################################
@@ -3642,7 +4069,7 @@ class Exchange(object):
     def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
-            self.throttle(cost)
+            self.throttle(cost, api, method, path, config)
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         self.last_request_headers = request['headers']
@@ -3795,10 +4222,7 @@ class Exchange(object):
         })
 
     def safe_market(self, marketId: Str, market: Market = None, delimiter: Str = None, marketType: Str = None):
-        result = self.safe_market_structure({
-            'symbol': marketId,
-            'marketId': marketId,
-        })
+        # the structure of an unknown market is only built when it is returned, parsers call self for every item
         if marketId is not None:
             if (self.markets_by_id is not None) and (marketId in self.markets_by_id):
                 markets = self.markets_by_id[marketId]
@@ -3816,6 +4240,10 @@ class Exchange(object):
                         if currentMarket[marketType]:
                             return currentMarket
             elif delimiter is not None and delimiter != '':
+                result = self.safe_market_structure({
+                    'symbol': marketId,
+                    'marketId': marketId,
+                })
                 parts = marketId.split(delimiter)
                 partsLength = len(parts)
                 if partsLength == 2:
@@ -3829,7 +4257,10 @@ class Exchange(object):
                     return result
         if market is not None:
             return market
-        return result
+        return self.safe_market_structure({
+            'symbol': marketId,
+            'marketId': marketId,
+        })
 
     def check_required_credentials(self, error=True):
         """
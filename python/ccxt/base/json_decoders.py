@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""The JSON decoders of the responses and the messages, by name, the stdlib json module and orjson when it is installed"""
+
+import importlib
+import json
+from ccxt.base.errors import NotSupported
+
+orjson = None  # imported when an exchange selects it
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'loads_json',
+    'loads_orjson',
+    'json_decoder',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def loads_json(data, quote_numbers=False):
+    # data is a str or utf-8 bytes, quote_numbers keeps the numbers as the strings of the document for Precise
+    if quote_numbers:
+        return json.loads(data, parse_float=str, parse_int=str)
+    return json.loads(data)
+
+
+def loads_orjson(data, quote_numbers=False):
+    if quote_numbers:
+        # orjson has no parse_float, the text of a float like '0.10' or '1e-8' cannot be recovered from the float
+        return loads_json(data, True)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # NaN, Infinity and the floats beyond the range of a double are accepted by json, invalid documents raise there again
+        return loads_json(data)
+
+
+decoders = {
+    'json': loads_json,
+    'orjson': loads_orjson,
+}
+
+
+def import_orjson():
+    global orjson
+    if orjson is None:
+        try:
+            orjson = importlib.import_module('orjson')
+        except ImportError:
+            return False
+    return True
+
+
+def json_decoder(name):
+    # 'auto' is orjson when it is installed, json otherwise
+    if name == 'auto':
+        name = 'orjson' if import_orjson() else 'json'
+    if name not in decoders:
+        raise NotSupported('jsonDecoder must be one of ' + ', '.join(["'auto'"] + ["'" + key + "'" for key in decoders]) + ', got ' + repr(name))
+    if name == 'orjson' and not import_orjson():
+        raise NotSupported('jsonDecoder orjson requires orjson, install it with "pip install orjson"')
+    return decoders[name]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""Deferred imports of the exchange modules and of the heavy signing dependencies"""
+
+import importlib
+import types
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'LazyModule',
+    'ExchangesModule',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class LazyModule(object):
+    # stands for a module that is imported on the first access to one of its attributes
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if attribute.startswith('__'):
+            raise AttributeError(attribute)
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+    def __repr__(self):
+        return '<lazy module ' + repr(self._name) + '>'
+
+
+class ExchangesModule(types.ModuleType):
+    # the class of the ccxt, ccxt.async_support and ccxt.pro packages
+    # the module of an exchange is imported when its class is first accessed, like ccxt.binance
+    # the import system sets the module as an attribute of the package, the class is kept instead
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and value.__name__ == self.__name__ + '.' + name and name in self.__dict__.get('exchanges', ()):
+            value = getattr(value, name)
+        super(ExchangesModule, self).__setattr__(name, value)
+
+    def __getattr__(self, name):
+        if name in self.__dict__.get('exchanges', ()):
+            exchange = getattr(importlib.import_module(self.__name__ + '.' + name), name)
+            super(ExchangesModule, self).__setattr__(name, exchange)
+            return exchange
+        raise AttributeError('module ' + repr(self.__name__) + ' has no attribute ' + repr(name))
+
+    def __dir__(self):
+        return sorted(set(super(ExchangesModule, self).__dir__()) | set(self.__dict__.get('exchanges', ())))
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""The markets and currencies of an exchange kept in a local file between runs"""
+
+import json
+import os
+import tempfile
+import time
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'cache_path',
+    'read',
+    'write',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def cache_path(directory, key):
+    # key is (exchange id, hash of the options), like the keys of the shared markets
+    exchange_id, options_hash = key
+    return os.path.join(directory, exchange_id + '-' + options_hash + '.json')
+
+
+def read(path, version):
+    # returns (markets, currencies, timestamp) or None if there is no usable cache
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get('version') != version or 'markets' not in cached:
+        # written by another version of ccxt, the unified structures may have changed
+        return None
+    return cached['markets'], cached.get('currencies'), cached.get('timestamp', 0)
+
+
+def write(path, version, markets, currencies):
+    # written to a temporary file and renamed, readers never see a partial file
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    cached = {
+        'version': version,
+        'timestamp': int(time.time() * 1000),
+        'markets': markets,
+        'currencies': currencies,
+    }
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            json.dump(cached, file, separators=(',', ':'))
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
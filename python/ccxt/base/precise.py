@@ -10,23 +10,70 @@
 #
 # (╯°□°）╯︵ ┻━┻
 
+import functools
+
+
+@functools.lru_cache(maxsize=65536)
+def parse(number):
+    # the (integer, decimals) of a number string, the same prices and amounts come again and again
+    modifier = 0
+    number = number.lower()
+    if 'e' in number:
+        number, modifier = number.split('e')
+        modifier = int(modifier)
+    decimal_index = number.find('.')
+    if decimal_index > -1:
+        decimals = len(number) - decimal_index - 1
+        integer = int(number.replace('.', ''))
+    else:
+        decimals = 0
+        integer = int(number)
+    return integer, decimals - modifier
+
+
+def reduced(integer, decimals):
+    # without the trailing zeros, like Precise.reduce()
+    if integer == 0:
+        return 0, 0
+    string = str(integer)
+    stripped = string.rstrip('0')
+    return (int(stripped), decimals - len(string) + len(stripped)) if len(stripped) < len(string) else (integer, decimals)
+
+
+def to_string(integer, decimals):
+    # str(Precise(integer, decimals))
+    integer, decimals = reduced(integer, decimals)
+    sign = '-' if integer < 0 else ''
+    digits = str(abs(integer))
+    if decimals <= 0:
+        return sign + digits + '0' * -decimals
+    if len(digits) <= decimals:
+        return sign + '0.' + digits.rjust(decimals, '0')
+    return sign + digits[:-decimals] + '.' + digits[-decimals:]
+
+
+def add(integer1, decimals1, integer2, decimals2):
+    if decimals1 == decimals2:
+        return integer1 + integer2, decimals1
+    if decimals1 > decimals2:
+        return integer2 * 10 ** (decimals1 - decimals2) + integer1, decimals1
+    return integer1 * 10 ** (decimals2 - decimals1) + integer2, decimals2
+
+
+def difference(string1, string2):
+    # the sign of string1 - string2
+    integer1, decimals1 = parse(string1)
+    integer2, decimals2 = parse(string2)
+    return add(integer1, decimals1, -integer2, decimals2)[0]
+
 
 class Precise:
+    # the string_* methods work on the parsed (integer, decimals) pairs without creating Precise objects
+    # and give the same strings as the methods of the objects
+
     def __init__(self, number, decimals=None):
         if decimals is None:
-            modifier = 0
-            number = number.lower()
-            if 'e' in number:
-                number, modifier = number.split('e')
-                modifier = int(modifier)
-            decimal_index = number.find('.')
-            if decimal_index > -1:
-                self.decimals = len(number) - decimal_index - 1
-                self.integer = int(number.replace('.', ''))
-            else:
-                self.decimals = 0
-                self.integer = int(number)
-            self.decimals = self.decimals - modifier
+            self.integer, self.decimals = parse(number)
         else:
             self.integer = number
             self.decimals = decimals
@@ -193,16 +240,42 @@ class Precise:
     def string_mul(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mul(Precise(string2)))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return to_string(integer1 * integer2, decimals1 + decimals2)
+
+    @staticmethod
+    def string_mul_add(string1, string2, string3):
+        # string_add(string_mul(string1, string2), string3) without the intermediate string
+        if string1 is None or string2 is None:
+            return string3
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        if string3 is None:
+            return to_string(integer1 * integer2, decimals1 + decimals2)
+        # the product goes through its reduced form, like the string of string_mul() would
+        product, decimals = reduced(integer1 * integer2, decimals1 + decimals2)
+        return to_string(*add(product, decimals, *parse(string3)))
 
     @staticmethod
     def string_div(string1, string2, precision=18):
         if string1 is None or string2 is None:
             return None
-        string2_precise = Precise(string2)
-        if string2_precise.integer == 0:
+        integer2, decimals2 = parse(string2)
+        if integer2 == 0:
             return None
-        return str(Precise(string1).div(string2_precise, precision))
+        integer1, decimals1 = parse(string1)
+        distance = precision - decimals1 + decimals2
+        if distance == 0:
+            numerator = integer1
+        elif distance < 0:
+            numerator = integer1 // 10 ** -distance
+        else:
+            numerator = integer1 * 10 ** distance
+        result, mod = divmod(numerator, integer2)
+        # python floors negative numbers down instead of truncating
+        result = result + 1 if result < 0 and mod else result
+        return to_string(result, precision)
 
     @staticmethod
     def string_add(string1, string2):
@@ -212,25 +285,28 @@ class Precise:
             return string2
         elif string2 is None:
             return string1
-        return str(Precise(string1).add(Precise(string2)))
+        return to_string(*add(*parse(string1), *parse(string2)))
 
     @staticmethod
     def string_sub(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).sub(Precise(string2)))
+        integer2, decimals2 = parse(string2)
+        return to_string(*add(*parse(string1), -integer2, decimals2))
 
     @staticmethod
     def string_abs(string):
         if string is None:
             return None
-        return str(Precise(string).abs())
+        integer, decimals = parse(string)
+        return to_string(abs(integer), decimals)
 
     @staticmethod
     def string_neg(string):
         if string is None:
             return None
-        return str(Precise(string).neg())
+        integer, decimals = parse(string)
+        return to_string(-integer, decimals)
 
     @staticmethod
     def string_mod(string1, string2):
@@ -242,46 +318,46 @@ class Precise:
     def string_equals(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return reduced(*parse(string1)) == reduced(*parse(string2))
 
     @staticmethod
     def string_eq(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return reduced(*parse(string1)) == reduced(*parse(string2))
 
     @staticmethod
     def string_min(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).min(Precise(string2)))
+        return to_string(*parse(string1 if difference(string2, string1) > 0 else string2))
 
     @staticmethod
     def string_max(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).max(Precise(string2)))
+        return to_string(*parse(string1 if difference(string1, string2) > 0 else string2))
 
     @staticmethod
     def string_gt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).gt(Precise(string2))
+        return difference(string1, string2) > 0
 
     @staticmethod
     def string_ge(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).ge(Precise(string2))
+        return difference(string1, string2) >= 0
 
     @staticmethod
     def string_lt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).lt(Precise(string2))
+        return difference(string2, string1) > 0
 
     @staticmethod
     def string_le(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).le(Precise(string2))
+        return difference(string2, string1) >= 0
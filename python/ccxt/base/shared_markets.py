@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""Markets and currencies loaded once and shared by the instances of an exchange"""
+
+import hashlib
+import json
+import threading
+import weakref
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'SharedMarkets',
+    'SharedMarketsRegistry',
+    'registry',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def json_values(value):
+    # the values of the configuration that json represents, callables and other objects would hash their address
+    if isinstance(value, dict):
+        return {str(key): json_values(item) for key, item in value.items() if is_json_value(item)}
+    if isinstance(value, (list, tuple)):
+        return [json_values(item) for item in value if is_json_value(item)]
+    return value
+
+
+def is_json_value(value):
+    return value is None or isinstance(value, (str, int, float, bool, dict, list, tuple))
+
+
+class SharedMarkets:
+    """The markets of one exchange id and configuration, attached instances all hold the same read-only objects"""
+
+    fields = ('markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies', 'markets_sources', 'markets_changes')
+
+    def __init__(self):
+        self.values = None
+        self.instances = weakref.WeakSet()
+        self.lock = threading.Lock()  # one synchronous load at a time
+        self.loading = None  # the task of the asynchronous load in progress
+
+    def attach(self, exchange):
+        self.instances.add(exchange)
+
+    def apply(self, exchange):
+        for field, value in self.values.items():
+            setattr(exchange, field, value)
+        return exchange.markets
+
+    def store(self, exchange):
+        # the markets just loaded by exchange replace the previous ones in every attached instance at once
+        self.values = {field: getattr(exchange, field, None) for field in self.fields}
+        for instance in list(self.instances):
+            self.apply(instance)
+        return exchange.markets
+
+
+class SharedMarketsRegistry:
+    """Process-wide SharedMarkets keyed by (exchange id, hash of the configuration the markets depend on)"""
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(exchange):
+        # the options, the urls (sandbox mode), the defaults merged into every market
+        # and whether credentials are set, fetch_currencies returns nothing without them on some exchanges
+        config = {
+            'credentials': bool(exchange.apiKey),
+            'options': exchange.options,
+            'api': exchange.urls.get('api') if isinstance(exchange.urls, dict) else None,
+            'hostname': exchange.hostname,
+            'precision': exchange.precision,
+            'limits': exchange.limits,
+            'fees': exchange.fees,
+        }
+        encoded = json.dumps(json_values(config), sort_keys=True)
+        return (exchange.id, hashlib.sha1(encoded.encode()).hexdigest())
+
+    def entry(self, exchange):
+        key = self.key(exchange)
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = SharedMarkets()
+            return self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+registry = SharedMarketsRegistry()
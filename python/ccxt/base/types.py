@@ -32,6 +32,11 @@ class Entry:
         self.config = config
 
         def unbound_method(_self, params={}):
+            if 'rateLimitPriority' in params:
+                # the priority lane of the request is for the rate limiter, not for the exchange
+                params = params.copy()
+                config = dict(self.config, priority=params.pop('rateLimitPriority'))
+                return _self.request(self.path, self.api, self.method, params, config=config)
             return _self.request(self.path, self.api, self.method, params, config=self.config)
 
         self.unbound_method = unbound_method
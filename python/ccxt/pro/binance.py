@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide
 import hashlib
 from ccxt.base.types import Balances, Int, Num, Order, OrderBook, OrderSide, OrderType, Position, Str, Strings, Ticker, Tickers, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -785,7 +785,7 @@ class binance(ccxt.async_support.binance):
         stored = self.safe_value(self.ohlcvs[symbol], timeframe)
         if stored is None:
             limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-            stored = ArrayCacheByTimestamp(limit)
+            stored = self.ohlcv_cache(limit)
             self.ohlcvs[symbol][timeframe] = stored
         stored.append(parsed)
         client.resolve(stored, messageHash)
@@ -2753,6 +2753,36 @@ class binance(ccxt.async_support.binance):
         if self.safe_string(code, 0) == '5':
             client.reset(message)
 
+    def message_routes(self):
+        return {
+            'event': {
+                'exact': {
+                    'depthUpdate': self.handle_order_book,
+                    'trade': self.handle_trade,
+                    'aggTrade': self.handle_trade,
+                    'kline': self.handle_ohlcv,
+                    'markPrice_kline': self.handle_ohlcv,
+                    'indexPrice_kline': self.handle_ohlcv,
+                    '1hTicker@arr': self.handle_tickers,
+                    '4hTicker@arr': self.handle_tickers,
+                    '1dTicker@arr': self.handle_tickers,
+                    '24hrTicker@arr': self.handle_tickers,
+                    '24hrMiniTicker@arr': self.handle_tickers,
+                    '1hTicker': self.handle_tickers,
+                    '4hTicker': self.handle_tickers,
+                    '1dTicker': self.handle_tickers,
+                    '24hrTicker': self.handle_tickers,
+                    '24hrMiniTicker': self.handle_tickers,
+                    'bookTicker': self.handle_bids_asks,  # there is no "bookTicker@arr" endpoint
+                    'outboundAccountPosition': self.handle_balance,
+                    'balanceUpdate': self.handle_balance,
+                    'ACCOUNT_UPDATE': self.handle_acount_update,
+                    'executionReport': self.handle_order_update,
+                    'ORDER_TRADE_UPDATE': self.handle_order_update,
+                },
+            },
+        }
+
     def handle_message(self, client: Client, message):
         # handle WebSocketAPI
         status = self.safe_string(message, 'status')
@@ -2767,35 +2797,11 @@ class binance(ccxt.async_support.binance):
             method(client, message)
             return
         # handle other APIs
-        methods = {
-            'depthUpdate': self.handle_order_book,
-            'trade': self.handle_trade,
-            'aggTrade': self.handle_trade,
-            'kline': self.handle_ohlcv,
-            'markPrice_kline': self.handle_ohlcv,
-            'indexPrice_kline': self.handle_ohlcv,
-            '1hTicker@arr': self.handle_tickers,
-            '4hTicker@arr': self.handle_tickers,
-            '1dTicker@arr': self.handle_tickers,
-            '24hrTicker@arr': self.handle_tickers,
-            '24hrMiniTicker@arr': self.handle_tickers,
-            '1hTicker': self.handle_tickers,
-            '4hTicker': self.handle_tickers,
-            '1dTicker': self.handle_tickers,
-            '24hrTicker': self.handle_tickers,
-            '24hrMiniTicker': self.handle_tickers,
-            'bookTicker': self.handle_bids_asks,  # there is no "bookTicker@arr" endpoint
-            'outboundAccountPosition': self.handle_balance,
-            'balanceUpdate': self.handle_balance,
-            'ACCOUNT_UPDATE': self.handle_acount_update,
-            'executionReport': self.handle_order_update,
-            'ORDER_TRADE_UPDATE': self.handle_order_update,
-        }
         event = self.safe_string(message, 'e')
         if isinstance(message, list):
             data = message[0]
             event = self.safe_string(data, 'e') + '@arr'
-        method = self.safe_value(methods, event)
+        method = self.find_message_handler('event', event)
         if method is None:
             requestId = self.safe_string(message, 'id')
             if requestId is not None:
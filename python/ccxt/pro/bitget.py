@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide
 import hashlib
 from ccxt.base.types import Balances, Int, Order, OrderBook, Position, Str, Strings, Ticker, Tickers, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -383,7 +383,7 @@ class bitget(ccxt.async_support.bitget):
         stored = self.safe_value(self.ohlcvs[symbol], timeframe)
         if stored is None:
             limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-            stored = ArrayCacheByTimestamp(limit)
+            stored = self.ohlcv_cache(limit)
             self.ohlcvs[symbol][timeframe] = stored
         data = self.safe_value(message, 'data', [])
         for i in range(0, len(data)):
@@ -1569,6 +1569,26 @@ class bitget(ccxt.async_support.bitget):
                 client.reject(e)
             return True
 
+    def message_routes(self):
+        return {
+            'channel': {
+                'exact': {
+                    'ticker': self.handle_ticker,
+                    'trade': self.handle_trades,
+                    'orders': self.handle_order,
+                    'ordersAlgo': self.handle_order,
+                    'account': self.handle_balance,
+                    'positions': self.handle_positions,
+                    'account-isolated': self.handle_balance,
+                    'account-crossed': self.handle_balance,
+                },
+                'contains': {
+                    'candle': self.handle_ohlcv,
+                    'books': self.handle_order_book,
+                },
+            },
+        }
+
     def handle_message(self, client: Client, message):
         #
         #   {
@@ -1620,25 +1640,11 @@ class bitget(ccxt.async_support.bitget):
         if event == 'subscribe':
             self.handle_subscription_status(client, message)
             return
-        methods = {
-            'ticker': self.handle_ticker,
-            'trade': self.handle_trades,
-            'orders': self.handle_order,
-            'ordersAlgo': self.handle_order,
-            'account': self.handle_balance,
-            'positions': self.handle_positions,
-            'account-isolated': self.handle_balance,
-            'account-crossed': self.handle_balance,
-        }
         arg = self.safe_value(message, 'arg', {})
         topic = self.safe_value(arg, 'channel', '')
-        method = self.safe_value(methods, topic)
+        method = self.find_message_handler('channel', topic)
         if method is not None:
             method(client, message)
-        if topic.find('candle') >= 0:
-            self.handle_ohlcv(client, message)
-        if topic.find('books') >= 0:
-            self.handle_order_book(client, message)
 
     def ping(self, client):
         return 'ping'
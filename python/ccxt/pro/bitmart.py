@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide
 from ccxt.async_support.base.ws.order_book_side import Asks, Bids
 import hashlib
 from ccxt.base.types import Balances, Int, Market, Order, OrderBook, Position, Str, Strings, Ticker, Tickers, Trade
@@ -1021,7 +1021,7 @@ class bitmart(ccxt.async_support.bitmart):
                 stored = self.safe_value(self.ohlcvs[symbol], timeframe)
                 if stored is None:
                     limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-                    stored = ArrayCacheByTimestamp(limit)
+                    stored = self.ohlcv_cache(limit)
                     self.ohlcvs[symbol][timeframe] = stored
                 stored.append(parsed)
                 messageHash = channel + ':' + marketId
@@ -1035,7 +1035,7 @@ class bitmart(ccxt.async_support.bitmart):
             stored = self.safe_value(self.ohlcvs[symbol], timeframe)
             if stored is None:
                 limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-                stored = ArrayCacheByTimestamp(limit)
+                stored = self.ohlcv_cache(limit)
                 self.ohlcvs[symbol][timeframe] = stored
             for i in range(0, len(items)):
                 candle = items[i]
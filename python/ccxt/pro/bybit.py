@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide
 import asyncio
 import hashlib
 from ccxt.base.types import Balances, Int, Order, OrderBook, Position, Str, Strings, Ticker, Tickers, Trade
@@ -433,7 +433,7 @@ class bybit(ccxt.async_support.bybit):
         stored = self.safe_value(ohlcvsByTimeframe, timeframe)
         if stored is None:
             limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-            stored = ArrayCacheByTimestamp(limit)
+            stored = self.ohlcv_cache(limit)
             self.ohlcvs[symbol][timeframe] = stored
         for i in range(0, len(data)):
             parsed = self.parse_ws_ohlcv(data[i])
@@ -1624,6 +1624,31 @@ class bybit(ccxt.async_support.bybit):
                 client.reject(error)
             return True
 
+    def message_routes(self):
+        # a topic is looked up as is, then by the first of the names it contains
+        topics = {
+            'orderbook': self.handle_order_book,
+            'kline': self.handle_ohlcv,
+            'order': self.handle_order,
+            'stopOrder': self.handle_order,
+            'ticker': self.handle_ticker,
+            'trade': self.handle_trades,
+            'publicTrade': self.handle_trades,
+            'depth': self.handle_order_book,
+            'wallet': self.handle_balance,
+            'outboundAccountInfo': self.handle_balance,
+            'execution': self.handle_my_trades,
+            'ticketInfo': self.handle_my_trades,
+            'user.openapi.perp.trade': self.handle_my_trades,
+            'position': self.handle_positions,
+        }
+        return {
+            'topic': {
+                'exact': topics,
+                'contains': topics,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         if self.handle_error_message(client, message):
             return
@@ -1647,33 +1672,10 @@ class bybit(ccxt.async_support.bybit):
             self.handle_subscription_status(client, message)
             return
         topic = self.safe_string(message, 'topic', '')
-        methods = {
-            'orderbook': self.handle_order_book,
-            'kline': self.handle_ohlcv,
-            'order': self.handle_order,
-            'stopOrder': self.handle_order,
-            'ticker': self.handle_ticker,
-            'trade': self.handle_trades,
-            'publicTrade': self.handle_trades,
-            'depth': self.handle_order_book,
-            'wallet': self.handle_balance,
-            'outboundAccountInfo': self.handle_balance,
-            'execution': self.handle_my_trades,
-            'ticketInfo': self.handle_my_trades,
-            'user.openapi.perp.trade': self.handle_my_trades,
-            'position': self.handle_positions,
-        }
-        exacMethod = self.safe_value(methods, topic)
-        if exacMethod is not None:
-            exacMethod(client, message)
+        method = self.find_message_handler('topic', topic)
+        if method is not None:
+            method(client, message)
             return
-        keys = list(methods.keys())
-        for i in range(0, len(keys)):
-            key = keys[i]
-            if topic.find(keys[i]) >= 0:
-                method = methods[key]
-                method(client, message)
-                return
         # unified auth acknowledgement
         type = self.safe_string(message, 'type')
         if (op == 'auth') or (type == 'AUTH_RESP'):
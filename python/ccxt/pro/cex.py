@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById
 import hashlib
 from ccxt.base.types import Balances, Int, Num, Order, OrderBook, OrderSide, OrderType, Str, Strings, Ticker, Tickers, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -1044,7 +1044,7 @@ class cex(ccxt.async_support.cex):
         messageHash = 'ohlcv:' + symbol
         data = self.safe_value(message, 'data', [])
         limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-        stored = ArrayCacheByTimestamp(limit)
+        stored = self.ohlcv_cache(limit)
         sorted = self.sort_by(data, 0)
         for i in range(0, len(sorted)):
             stored.append(self.parse_ohlcv(sorted[i], market))
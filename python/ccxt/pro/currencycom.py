@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache
 import hashlib
 from ccxt.base.types import Balances, Int, OrderBook, Ticker, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -271,7 +271,7 @@ class currencycom(ccxt.async_support.currencycom):
         stored = self.safe_value(self.ohlcvs[symbol], timeframe)
         if stored is None:
             limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-            stored = ArrayCacheByTimestamp(limit)
+            stored = self.ohlcv_cache(limit)
             self.ohlcvs[symbol][timeframe] = stored
         stored.append(result)
         client.resolve(stored, messageHash)
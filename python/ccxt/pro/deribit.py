@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById
 import hashlib
 from ccxt.base.types import Balances, Int, Order, OrderBook, Str, Ticker, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -682,7 +682,7 @@ class deribit(ccxt.async_support.deribit):
         self.ohlcvs[symbol] = self.safe_dict(self.ohlcvs, symbol, {})
         if self.safe_value(self.ohlcvs[symbol], unifiedTimeframe) is None:
             limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-            self.ohlcvs[symbol][unifiedTimeframe] = ArrayCacheByTimestamp(limit)
+            self.ohlcvs[symbol][unifiedTimeframe] = self.ohlcv_cache(limit)
         stored = self.ohlcvs[symbol][unifiedTimeframe]
         ohlcv = self.safe_dict(params, 'data', {})
         # data contains a single OHLCV candle
@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide
 import hashlib
 from ccxt.base.types import Balances, Int, Order, OrderBook, Position, Str, Strings, Ticker, Tickers, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -524,7 +524,7 @@ class gate(ccxt.async_support.gate):
             stored = self.safe_value(self.ohlcvs[symbol], timeframe)
             if stored is None:
                 limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-                stored = ArrayCacheByTimestamp(limit)
+                stored = self.ohlcv_cache(limit)
                 self.ohlcvs[symbol][timeframeId] = stored
             stored.append(parsed)
             marketIds[symbol] = timeframe
@@ -1017,6 +1017,23 @@ class gate(ccxt.async_support.gate):
         if id in client.subscriptions:
             del client.subscriptions[id]
 
+    def message_routes(self):
+        return {
+            'channel': {
+                'exact': {
+                    'usertrades': self.handle_my_trades,
+                    'candlesticks': self.handle_ohlcv,
+                    'orders': self.handle_order,
+                    'positions': self.handle_positions,
+                    'tickers': self.handle_ticker,
+                    'book_ticker': self.handle_bid_ask,
+                    'trades': self.handle_trades,
+                    'order_book_update': self.handle_order_book,
+                    'balances': self.handle_balance,
+                },
+            },
+        }
+
     def handle_message(self, client: Client, message):
         #
         # subscribe
@@ -1116,18 +1133,7 @@ class gate(ccxt.async_support.gate):
         channel = self.safe_string(message, 'channel', '')
         channelParts = channel.split('.')
         channelType = self.safe_value(channelParts, 1)
-        v4Methods = {
-            'usertrades': self.handle_my_trades,
-            'candlesticks': self.handle_ohlcv,
-            'orders': self.handle_order,
-            'positions': self.handle_positions,
-            'tickers': self.handle_ticker,
-            'book_ticker': self.handle_bid_ask,
-            'trades': self.handle_trades,
-            'order_book_update': self.handle_order_book,
-            'balances': self.handle_balance,
-        }
-        method = self.safe_value(v4Methods, channelType)
+        method = self.find_message_handler('channel', channelType)
         if method is not None:
             method(client, message)
 
@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById
 from ccxt.base.types import Int, Num, Order, OrderBook, OrderSide, OrderType, Str, Strings, Ticker, Tickers, Trade
 from ccxt.async_support.base.ws.client import Client
 from typing import List
@@ -427,7 +427,7 @@ class kraken(ccxt.async_support.kraken):
             stored = self.safe_value(self.ohlcvs[symbol], timeframe)
             if stored is None:
                 limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-                stored = ArrayCacheByTimestamp(limit)
+                stored = self.ohlcv_cache(limit)
                 self.ohlcvs[symbol][timeframe] = stored
             stored.append(result)
             client.resolve(stored, messageHash)
@@ -1315,6 +1315,33 @@ class kraken(ccxt.async_support.kraken):
                 return False
         return True
 
+    def message_routes(self):
+        return {
+            'channel': {
+                'exact': {
+                    # public
+                    'book': self.handle_order_book,
+                    'ohlc': self.handle_ohlcv,
+                    'ticker': self.handle_ticker,
+                    'trade': self.handle_trades,
+                    # private
+                    'openOrders': self.handle_orders,
+                    'ownTrades': self.handle_my_trades,
+                },
+            },
+            'event': {
+                'exact': {
+                    'heartbeat': self.handle_heartbeat,
+                    'systemStatus': self.handle_system_status,
+                    'subscriptionStatus': self.handle_subscription_status,
+                    'addOrderStatus': self.handle_create_edit_order,
+                    'editOrderStatus': self.handle_create_edit_order,
+                    'cancelOrderStatus': self.handle_cancel_order,
+                    'cancelAllStatus': self.handle_cancel_all_orders,
+                },
+            },
+        }
+
     def handle_message(self, client: Client, message):
         if isinstance(message, list):
             channelId = self.safe_string(message, 0)
@@ -1323,31 +1350,14 @@ class kraken(ccxt.async_support.kraken):
             messageLength = len(message)
             channelName = self.safe_string(message, messageLength - 2)
             name = self.safe_string(info, 'name')
-            methods = {
-                # public
-                'book': self.handle_order_book,
-                'ohlc': self.handle_ohlcv,
-                'ticker': self.handle_ticker,
-                'trade': self.handle_trades,
-                # private
-                'openOrders': self.handle_orders,
-                'ownTrades': self.handle_my_trades,
-            }
-            method = self.safe_value_2(methods, name, channelName)
+            method = self.find_message_handler('channel', name)
+            if method is None:
+                method = self.find_message_handler('channel', channelName)
             if method is not None:
                 method(client, message, subscription)
         else:
             if self.handle_error_message(client, message):
                 event = self.safe_string(message, 'event')
-                methods = {
-                    'heartbeat': self.handle_heartbeat,
-                    'systemStatus': self.handle_system_status,
-                    'subscriptionStatus': self.handle_subscription_status,
-                    'addOrderStatus': self.handle_create_edit_order,
-                    'editOrderStatus': self.handle_create_edit_order,
-                    'cancelOrderStatus': self.handle_cancel_order,
-                    'cancelAllStatus': self.handle_cancel_all_orders,
-                }
-                method = self.safe_value(methods, event)
+                method = self.find_message_handler('event', event)
                 if method is not None:
                     method(client, message)
@@ -4,7 +4,7 @@
 # https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
 
 import ccxt.async_support
-from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide
 import hashlib
 from ccxt.base.types import Balances, Int, Num, Order, OrderBook, OrderSide, OrderType, Position, Str, Strings, Ticker, Tickers, Trade
 from ccxt.async_support.base.ws.client import Client
@@ -411,7 +411,7 @@ class okx(ccxt.async_support.okx):
             stored = self.safe_value(self.ohlcvs[symbol], timeframe)
             if stored is None:
                 limit = self.safe_integer(self.options, 'OHLCVLimit', 1000)
-                stored = ArrayCacheByTimestamp(limit)
+                stored = self.ohlcv_cache(limit)
                 self.ohlcvs[symbol][timeframe] = stored
             stored.append(parsed)
             messageHash = channel + ':' + market['id']
@@ -1435,6 +1435,46 @@ class okx(ccxt.async_support.okx):
                 client.reject(e)
         return message
 
+    def message_routes(self):
+        return {
+            'event': {
+                'exact': {
+                    # 'info': self.handleSystemStatus,
+                    # 'book': 'handleOrderBook',
+                    'login': self.handle_authenticate,
+                    'subscribe': self.handle_subscription_status,
+                    'order': self.handle_place_orders,
+                    'batch-orders': self.handle_place_orders,
+                    'amend-order': self.handle_place_orders,
+                    'batch-amend-orders': self.handle_place_orders,
+                    'cancel-order': self.handle_place_orders,
+                    'mass-cancel': self.handle_cancel_all_orders,
+                },
+            },
+            'channel': {
+                'exact': {
+                    'bbo-tbt': self.handle_order_book,  # newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
+                    'books': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required
+                    'books5': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms(vs. every 200ms now)
+                    'books50-l2-tbt': self.handle_order_book,  # only users who're VIP4 and above can subscribe, identity verification required before subscription
+                    'books-l2-tbt': self.handle_order_book,  # only users who're VIP5 and above can subscribe, identity verification required before subscription
+                    'tickers': self.handle_ticker,
+                    'positions': self.handle_positions,
+                    'index-tickers': self.handle_ticker,
+                    'sprd-tickers': self.handle_ticker,
+                    'block-tickers': self.handle_ticker,
+                    'trades': self.handle_trades,
+                    'account': self.handle_balance,
+                    # 'margin_account': self.handle_balance,
+                    'orders': self.handle_orders,
+                    'orders-algo': self.handle_orders,
+                },
+                'prefix': {
+                    'candle': self.handle_ohlcv,
+                },
+            },
+        }
+
     def handle_message(self, client: Client, message):
         if not self.handle_error_message(client, message):
             return
@@ -1484,44 +1524,12 @@ class okx(ccxt.async_support.okx):
         # if table is None:
         event = self.safe_string_2(message, 'event', 'op')
         if event is not None:
-            methods = {
-                # 'info': self.handleSystemStatus,
-                # 'book': 'handleOrderBook',
-                'login': self.handle_authenticate,
-                'subscribe': self.handle_subscription_status,
-                'order': self.handle_place_orders,
-                'batch-orders': self.handle_place_orders,
-                'amend-order': self.handle_place_orders,
-                'batch-amend-orders': self.handle_place_orders,
-                'cancel-order': self.handle_place_orders,
-                'mass-cancel': self.handle_cancel_all_orders,
-            }
-            method = self.safe_value(methods, event)
+            method = self.find_message_handler('event', event)
             if method is not None:
                 method(client, message)
         else:
             arg = self.safe_value(message, 'arg', {})
             channel = self.safe_string(arg, 'channel')
-            methods = {
-                'bbo-tbt': self.handle_order_book,  # newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
-                'books': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required
-                'books5': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms(vs. every 200ms now)
-                'books50-l2-tbt': self.handle_order_book,  # only users who're VIP4 and above can subscribe, identity verification required before subscription
-                'books-l2-tbt': self.handle_order_book,  # only users who're VIP5 and above can subscribe, identity verification required before subscription
-                'tickers': self.handle_ticker,
-                'positions': self.handle_positions,
-                'index-tickers': self.handle_ticker,
-                'sprd-tickers': self.handle_ticker,
-                'block-tickers': self.handle_ticker,
-                'trades': self.handle_trades,
-                'account': self.handle_balance,
-                # 'margin_account': self.handle_balance,
-                'orders': self.handle_orders,
-                'orders-algo': self.handle_orders,
-            }
-            method = self.safe_value(methods, channel)
-            if method is None:
-                if channel.find('candle') == 0:
-                    self.handle_ohlcv(client, message)
-            else:
+            method = self.find_message_handler('channel', channel)
+            if method is not None:
                 method(client, message)
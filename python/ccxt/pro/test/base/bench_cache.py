@@ -0,0 +1,47 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import random  # noqa: E402
+import time  # noqa: E402
+from ccxt.async_support.base.ws.cache import ArrayCacheBySymbolById  # noqa: E402
+
+# updates to open orders spread over the whole cache, like fills on a book of resting orders
+# the time per update should not grow with the number of orders
+
+updates = 100000
+random.seed(2)
+
+print(f'{updates} updates')
+for orders in (1000, 5000, 20000):
+    cache = ArrayCacheBySymbolById(orders)
+    for i in range(orders):
+        cache.append({'symbol': 'BTC/USDT', 'id': str(i), 'filled': 0})
+    ids = [str(random.randrange(orders)) for i in range(updates)]
+    start = time.perf_counter()
+    for i, id in enumerate(ids):
+        cache.append({'symbol': 'BTC/USDT', 'id': id, 'filled': i})
+    elapsed = time.perf_counter() - start
+    print(f'{orders:>6} open orders: {elapsed / updates * 1e6:6.3f}us per update')
+
+# output
+
+'''
+100000 updates
+  1000 open orders:  1.609us per update
+  5000 open orders:  2.565us per update
+ 20000 open orders:  3.614us per update
+'''
+
+# the previous deque and list.index implementation
+
+'''
+100000 updates
+  1000 open orders: 15.754us per update
+  5000 open orders: 63.439us per update
+ 20000 open orders: 265.616us per update
+'''
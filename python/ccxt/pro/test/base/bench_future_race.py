@@ -0,0 +1,57 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import random  # noqa: E402
+import time  # noqa: E402
+from ccxt.async_support.base.ws.future import Future  # noqa: E402
+
+# a watch_tickers loop over n symbols, each await is a race of the futures of the symbols and one of them resolves
+
+random.seed(0)
+count = 20000
+
+
+async def watch(symbols):
+    loop = asyncio.get_running_loop()
+    futures = [Future() for i in range(symbols)]
+    start = time.perf_counter()
+    for i in range(count):
+        race = Future.race(futures)
+        index = random.randrange(symbols)
+        loop.call_soon(futures[index].resolve, i)
+        await race
+        futures[index] = Future()
+    return time.perf_counter() - start
+
+
+async def main():
+    for symbols in (1, 10, 100, 500):
+        best = min([await watch(symbols) for i in range(3)])
+        print(f'{symbols:>3} symbols: {count / best:8.0f} awaits/s {best / count * 1e6:6.1f}us per await')
+
+
+asyncio.run(main())
+
+# output
+
+'''
+  1 symbols:    42329 awaits/s   23.6us per await
+ 10 symbols:    35484 awaits/s   28.2us per await
+100 symbols:    14776 awaits/s   67.7us per await
+500 symbols:     4102 awaits/s  243.8us per await
+'''
+
+# with a task of asyncio.wait per race
+
+'''
+  1 symbols:    25120 awaits/s   39.8us per await
+ 10 symbols:    20398 awaits/s   49.0us per await
+100 symbols:     7936 awaits/s  126.0us per await
+500 symbols:     1899 awaits/s  526.7us per await
+'''
@@ -0,0 +1,54 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import time  # noqa: E402
+from aiohttp import WSMessage, WSMsgType  # noqa: E402
+from ccxt.async_support.base.ws.fast_client import FastClient  # noqa: E402
+
+# a burst of trade messages of binance received at once, drained with batches of different sizes
+
+message = '{"e":"trade","E":1700000000000,"s":"BTCUSDT","t":3000000000,"p":"37000.01000000","q":"0.00100000","b":1,"a":2,"T":1700000000000,"m":true,"M":true}'
+count = 100000
+
+
+async def drain(batch_size):
+    loop = asyncio.get_running_loop()
+    client = FastClient('wss://example.com', lambda client, message: None, None, None, None, {'asyncio_loop': loop, 'drainBatchSize': batch_size})
+    messages = [WSMessage(WSMsgType.TEXT, message, None) for i in range(count)]
+    start = time.perf_counter()
+    for item in messages:
+        client.feed_message(item)
+    while client.callback_scheduled:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    assert client.messages_handled == count
+    return elapsed, client.stats()
+
+
+async def main():
+    print(f'{count} messages')
+    for batch_size in (1, 16, 256, 0):
+        best = None
+        for i in range(5):
+            elapsed, stats = await drain(batch_size)
+            best = elapsed if best is None else min(best, elapsed)
+        print(f'drainBatchSize {batch_size:>3}: {best * 1e3:7.2f}ms {best / count * 1e9:5.0f}ns per message, {stats["batches"]:>6} batches')
+
+
+asyncio.run(main())
+
+# output, drainBatchSize 1 is the default and the handling of one message per callback from before
+
+'''
+100000 messages
+drainBatchSize   1: 1092.96ms 10930ns per message, 100000 batches
+drainBatchSize  16:  458.06ms  4581ns per message,   6250 batches
+drainBatchSize 256:  524.31ms  5243ns per message,    391 batches
+drainBatchSize   0:  409.39ms  4094ns per message,      1 batches
+'''
@@ -0,0 +1,69 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import random  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+from ccxt.async_support.base.ws.order_book import OrderBook, ArrayOrderBook  # noqa: E402
+
+# a binance-like book of 5000 levels per side with updates spread over the whole depth
+# and concentrated near the top of the book, like the diff depth stream
+
+levels = 5000
+updates = 200000
+tick = 0.01
+mid = 30000.0
+
+random.seed(1)
+snapshot = {
+    'asks': [[round(mid + (i + 1) * tick, 2), random.randint(1, 1000) / 100] for i in range(levels)],
+    'bids': [[round(mid - (i + 1) * tick, 2), random.randint(1, 1000) / 100] for i in range(levels)],
+}
+deltas = []
+for i in range(updates):
+    distance = int(random.expovariate(1 / 300)) if random.random() < 0.9 else random.randint(0, levels)
+    side = random.choice(['asks', 'bids'])
+    price = round(mid + (distance + 1) * tick, 2) if side == 'asks' else round(mid - (distance + 1) * tick, 2)
+    size = 0 if random.random() < 0.3 else random.randint(1, 1000) / 100
+    deltas.append((side, [price, size]))
+
+
+def bench(Book):
+    tracemalloc.start()
+    book = Book(snapshot, levels)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    asks = book['asks']
+    bids = book['bids']
+    start = time.perf_counter()
+    for side, delta in deltas:
+        (asks if side == 'asks' else bids).storeArray(delta)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(1000):
+        book.limit()
+        top = asks[:20], bids[:20]
+    reads = time.perf_counter() - start
+    print(f'{Book.__name__:>15}: {elapsed / updates * 1e6:6.3f}us per update, {reads * 1000:6.3f}us per limit() and top 20 read, '
+          f'{memory / 1024:8.1f}KiB for the snapshot, {len(asks)} asks {len(bids)} bids')
+    return book, top
+
+
+print(f'{levels} levels per side, {updates} updates')
+list_book, list_top = bench(OrderBook)
+array_book, array_top = bench(ArrayOrderBook)
+assert list_top == array_top
+assert list(list_book['asks']) == list(array_book['asks'])
+
+# output
+
+'''
+5000 levels per side, 200000 updates
+      OrderBook:  3.148us per update,  6.949us per limit() and top 20 read,    985.6KiB for the snapshot, 3621 asks 3599 bids
+ ArrayOrderBook:  1.827us per update, 12.986us per limit() and top 20 read,    182.8KiB for the snapshot, 3621 asks 3599 bids
+'''
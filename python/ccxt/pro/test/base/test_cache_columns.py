@@ -0,0 +1,83 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import random  # noqa: E402
+import ccxt.pro as ccxtpro  # noqa: E402
+from ccxt import BadResponse  # noqa: E402
+from ccxt.async_support.base.ws.cache import ArrayCacheByTimestamp, ArrayCacheByTimestampColumns  # noqa: E402
+
+# the columns engine stays identical to the list engine on random updates of recent candles
+random.seed(1)
+cache = ArrayCacheByTimestamp(5)
+columns = ArrayCacheByTimestampColumns(5)
+for i in range(200):
+    timestamp = 60000 * (i // 3 - random.randrange(2))
+    candle = [timestamp] + [float(random.randrange(100)) for j in range(4)] + [None if random.random() < 0.1 else random.random()]
+    cache.append(list(candle))
+    columns.append(list(candle))
+    assert columns == list(cache) and len(columns) == len(cache)
+    assert sorted(columns.hashmap) == sorted(cache.hashmap)
+    if i % 7 == 0:
+        assert columns.getLimit(None, None) == cache.getLimit(None, None)
+    assert columns[-1] == cache[-1] and columns[1:3] == cache[1:3] and columns[::-1] == cache[::-1]
+
+# a partial update of the current candle
+columns.append([columns[-1][0], 1.5])
+assert columns[-1][1] == 1.5 and columns[-1][2:] == cache[-1][2:]
+
+# a write to a candle read from the cache is stored, like in the list of the list engine
+candle = columns[-1]
+candle[4] = 7.5
+candle[5] = None
+assert columns[-1][4] == 7.5 and columns[-1][5] is None
+columns[0][1] = 2.5
+assert columns[0][1] == 2.5
+# unless the candle has left the cache meanwhile
+oldest = columns[0]
+for i in range(5):
+    columns.append([columns[-1][0] + 60000, 1.0, 2.0, 0.5, 1.5, 10.0])
+oldest[4] = 9.5
+assert all(candle[4] == 1.5 for candle in columns)
+
+# a candle without a timestamp is rejected, the cache is left as it was
+before = list(columns)
+try:
+    columns.append([None, 1.0, 2.0, 0.5, 1.5, 10.0])
+    assert False
+except BadResponse:
+    pass
+try:
+    columns[-1][0] = None
+    assert False
+except BadResponse:
+    pass
+assert columns == before and len(columns.hashmap) == 5
+
+try:
+    import numpy as np
+except ImportError:
+    print('numpy is not installed, skipping the columns view tests')
+    sys.exit()
+
+columns = ArrayCacheByTimestampColumns(3)
+for i in range(5):
+    columns.append([i * 60000, 1.0, 2.0, 0.5, float(i), 10.0])
+timestamps, opens, highs, lows, closes, volumes = columns.arrays()
+assert timestamps.dtype == np.int64 and timestamps.tolist() == [120000, 180000, 240000]
+assert closes.tolist() == [2, 3, 4]
+assert columns.arrays(2)[4].tolist() == [3, 4]
+assert columns.arrays(10)[0].tolist() == [120000, 180000, 240000]
+# the views see the in-place update of the current candle without a copy
+columns.append([240000, 1.0, 2.0, 0.5, 4.5, 11.0])
+assert closes[-1] == 4.5 and volumes[-1] == 11
+assert len(columns.arrays(0)[0]) == 0
+
+# the ohlcvEngine option selects the cache of watch_ohlcv
+exchange = ccxtpro.binance({'ohlcvEngine': 'columns'})
+assert isinstance(exchange.ohlcv_cache(10), ArrayCacheByTimestampColumns)
+assert type(ccxtpro.binance().ohlcv_cache(10)) is ArrayCacheByTimestamp
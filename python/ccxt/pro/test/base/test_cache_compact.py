@@ -0,0 +1,120 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import copy  # noqa: E402
+import json  # noqa: E402
+import pickle  # noqa: E402
+import ccxt.pro as ccxtpro  # noqa: E402
+from ccxt import Exchange  # noqa: E402
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheByTimestamp, TradeRecord, OHLCVRecord, compact_trades  # noqa: E402
+
+
+def trade(id, timestamp, datetime='2023-11-14T22:13:20.000Z'):
+    return {
+        'info': {'t': id},
+        'timestamp': timestamp,
+        'datetime': datetime,
+        'symbol': 'BTC/USDT',
+        'id': id,
+        'order': None,
+        'type': None,
+        'side': 'sell',
+        'takerOrMaker': None,
+        'price': 35000.01,
+        'amount': 0.0123,
+        'cost': 430.500123,
+        'fee': None,
+        'fees': [],
+    }
+
+
+# a trade record reads like the dict it was made from
+record = TradeRecord(trade('1', 1700000000000))
+assert record == trade('1', 1700000000000)
+assert trade('1', 1700000000000) == record
+assert list(record.keys()) == list(trade('1', 1700000000000).keys())
+assert record['datetime'] == '2023-11-14T22:13:20.000Z' and record['fees'] == []
+assert record.get('missing') is None and 'price' in record and 'missing' not in record
+assert json.loads(json.dumps(dict(record))) == json.loads(json.dumps(trade('1', 1700000000000)))
+record['price'] = 1
+assert record['price'] == 1
+try:
+    record['missing'] = 1
+    assert False
+except KeyError:
+    pass
+# a datetime that does not match the timestamp is kept as is
+assert TradeRecord(trade('1', 1700000000000, '2023-11-14T22:13:20Z'))['datetime'] == '2023-11-14T22:13:20Z'
+assert TradeRecord(trade('1', None, None))['datetime'] is None
+assert TradeRecord(trade('1', 1700000000000), False)['info'] is None
+
+# the trade caches made while an exchange with compactTrades handles a message
+token = compact_trades.set(True)
+try:
+    cache = ArrayCache(2)
+finally:
+    compact_trades.reset(token)
+assert cache.compact and not ArrayCache.compact and not ArrayCache(2).compact
+for i in range(3):
+    cache.append(trade(str(i), 1700000000000 + i))
+# other structures are stored as they are
+cache.append({'symbol': 'BTC/USDT', 'data': 1})
+assert isinstance(cache[0], TradeRecord) and type(cache[1]) is dict
+assert cache[0]['id'] == '2' and cache[0]['timestamp'] == 1700000000002
+assert cache.getLimit('BTC/USDT', None) == 4
+
+# a trade record is a dict for json.dumps, copies and the isinstance checks of safe_dict
+record = cache[0]
+assert isinstance(record, dict) and Exchange().safe_dict(cache, 0) is record
+assert json.loads(json.dumps(record)) == json.loads(json.dumps(trade('2', 1700000000002)))
+assert dict(record) == trade('2', 1700000000002) and {**record} == trade('2', 1700000000002)
+assert Exchange.extend({}, record, {'price': 2})['price'] == 2 and record['price'] == 35000.01
+assert record.copy() == trade('2', 1700000000002) and copy.deepcopy(record) == record and pickle.loads(pickle.dumps(record)) == record
+assert len(record) == 14 and record.pop('fee') is None and 'fee' not in record and len(record) == 13
+record.update({'price': 3})
+assert record['price'] == 3 and record.setdefault('fee', 1) == 1 and record['fee'] == 1
+
+# the candle caches of an exchange with ohlcvEngine = 'compact'
+exchange = ccxtpro.binance({'ohlcvEngine': 'compact'})
+cache = exchange.ohlcv_cache(2)
+assert cache.compact and not ArrayCacheByTimestamp.compact and not ccxtpro.binance().ohlcv_cache(2).compact
+cache.append([1700000000000, 1.5, 2.5, 0.5, 2, 10])
+cache.append([1700000060000, 2, 3, 1, 2.5, 20])
+# the current candle is updated in place
+reference = cache[-1]
+cache.append([1700000060000, 2, 4, 1, 3.5, 25])
+assert reference is cache[-1] and isinstance(reference, OHLCVRecord)
+assert cache[-1] == [1700000060000, 2, 4, 1, 3.5, 25]
+assert isinstance(cache[-1][0], int) and list(cache[-1])[0] == 1700000060000 and cache[-1][-6] == 1700000060000
+assert cache[-1][1:3] == [2, 4]
+assert str(cache[-1]) == '[1700000060000, 2.0, 4.0, 1.0, 3.5, 25.0]'
+assert cache.getLimit(None, None) == 2
+# a candle record is a list for json.dumps, copies and the isinstance checks of safe_list
+assert isinstance(reference, list) and Exchange().safe_list(cache, -1) is reference
+assert json.dumps(reference) == '[1700000060000, 2.0, 4.0, 1.0, 3.5, 25.0]'
+assert copy.deepcopy(reference) == reference and pickle.loads(pickle.dumps(reference)) == reference
+assert reference + [1] == [1700000060000, 2, 4, 1, 3.5, 25, 1] and 3.5 in reference and reference.index(3.5) == 4
+cache.append([1700000120000, 2, 3, 1, 2.5, None])
+assert type(cache[-1]) is list and 1700000000000 not in cache.hashmap
+
+
+async def test_exchange():
+    # the trades of an exchange with compactTrades
+    exchange = ccxtpro.binance({'compactTrades': True, 'compactTradesInfo': False})
+    with open(os.path.join(root, '..', 'ts', 'src', 'test', 'static', 'markets', 'binance.json'), encoding='utf-8') as file:
+        exchange.set_markets(json.load(file))
+    client = exchange.client('wss://stream.binance.com:9443/ws')
+    client.on_message_callback(client, {'e': 'trade', 'E': 1700000000000, 's': 'BTCUSDT', 't': 1, 'p': '35000.01', 'q': '0.5', 'T': 1700000000000, 'm': True, 'M': True})
+    stored = exchange.trades['BTC/USDT']
+    assert stored.compact and isinstance(stored[0], TradeRecord) and stored[0]['info'] is None and stored[0]['price'] == 35000.01
+    assert compact_trades.get() is None
+    await exchange.close()
+
+
+asyncio.run(test_exchange())
@@ -0,0 +1,48 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.async_support.base.ws.cache import ArrayCacheBySymbolById, ArrayCacheBySymbolBySide  # noqa: E402
+
+
+def order(symbol, id, status='open'):
+    return {'symbol': symbol, 'id': id, 'status': status}
+
+
+cache = ArrayCacheBySymbolById(3)
+cache.append(order('BTC/USDT', '1'))
+cache.append(order('ETH/USDT', '1'))
+cache.append(order('BTC/USDT', '2'))
+# the same id on another symbol is another order
+cache.append(order('ETH/USDT', '1', 'closed'))
+assert [(o['symbol'], o['id'], o['status']) for o in cache] == [('BTC/USDT', '1', 'open'), ('BTC/USDT', '2', 'open'), ('ETH/USDT', '1', 'closed')]
+assert cache.hashmap['BTC/USDT']['1']['status'] == 'open'
+# the oldest order is evicted
+cache.append(order('BTC/USDT', '3'))
+assert [o['id'] for o in cache] == ['2', '1', '3']
+assert '1' not in cache.hashmap['BTC/USDT']
+# list-like access
+assert cache[0]['id'] == '2' and cache[-1]['id'] == '3' and cache[1]['symbol'] == 'ETH/USDT'
+assert [o['id'] for o in cache[1:]] == ['1', '3']
+assert [o['id'] for o in cache[::-1]] == ['3', '1', '2']
+assert [o['id'] for o in reversed(cache)] == ['3', '1', '2']
+assert len(cache) == 3
+assert cache.hashmap['ETH/USDT']['1'] in cache
+try:
+    cache[3]
+    assert False
+except IndexError:
+    pass
+
+positions = ArrayCacheBySymbolBySide()
+positions.append({'symbol': 'BTC/USDT', 'side': 'long', 'contracts': 1})
+positions.append({'symbol': 'ETH/USDT', 'side': 'long', 'contracts': 2})
+positions.append({'symbol': 'BTC/USDT', 'side': 'short', 'contracts': 3})
+# updates the long BTC/USDT position, not the first long position of any symbol
+positions.append({'symbol': 'ETH/USDT', 'side': 'long', 'contracts': 4})
+assert [(p['symbol'], p['side'], p['contracts']) for p in positions] == [('BTC/USDT', 'long', 1), ('BTC/USDT', 'short', 3), ('ETH/USDT', 'long', 4)]
+assert positions.getLimit('ETH/USDT', None) == 1
@@ -0,0 +1,101 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import time  # noqa: E402
+from ccxt.async_support.base.ws.fast_client import FastClient  # noqa: E402
+
+
+def client(config={}):
+    handled = []
+    result = FastClient('wss://example.com', lambda client, message: None, None, None, None, config)
+    result.handle_message = handled.append
+    return result, handled
+
+
+async def burst(config, count, ticks=3):
+    # count messages received at once, then the event loop runs a few ticks
+    result, handled = client(dict(config, asyncio_loop=asyncio.get_running_loop()))
+    for i in range(count):
+        result.feed_message(i)
+    sizes = []
+    for i in range(ticks):
+        await asyncio.sleep(0)
+        sizes.append(len(handled))
+    return result, handled, sizes
+
+
+async def test():
+    # one message per callback by default
+    result, handled, sizes = await burst({}, 5)
+    assert sizes == [1, 2, 3]
+    assert result.max_queue_depth == 5
+    assert result.queue_depth() == 2
+
+    # batches of drainBatchSize messages
+    result, handled, sizes = await burst({'drainBatchSize': 4}, 10, 4)
+    assert sizes == [4, 8, 10, 10]
+    assert handled == list(range(10))
+    assert not result.callback_scheduled
+    stats = result.stats()
+    assert stats['messages_handled'] == 10 and stats['batches'] == 3
+    assert stats['max_batch_size'] == 4 and stats['average_batch_size'] == 10 / 3
+    assert stats['queue_depth'] == 0 and stats['max_queue_depth'] == 10
+    assert stats['handler_time'] >= 0 and stats['max_handler_time'] <= stats['handler_time']
+
+    # 0 drains everything at once
+    result, handled, sizes = await burst({'drainBatchSize': 0}, 1000, 1)
+    assert sizes == [1000]
+
+    # a batch stops after drainBatchTime microseconds
+    loop = asyncio.get_running_loop()
+    result, handled = client({'drainBatchSize': 0, 'drainBatchTime': 2000, 'asyncio_loop': loop})
+
+    def slow(message):
+        time.sleep(0.001)
+        handled.append(message)
+
+    result.handle_message = slow
+    for i in range(10):
+        result.feed_message(i)
+    await asyncio.sleep(0)
+    assert 1 <= len(handled) <= 3
+    assert result.max_handler_time >= 0.001
+    while result.stack:
+        await asyncio.sleep(0)
+    assert handled == list(range(10))
+
+    # an exception rejects the futures and the next messages are still handled
+    result, handled = client({'drainBatchSize': 10, 'asyncio_loop': loop})
+    future = result.future('hash')
+
+    def failing(message):
+        if message == 1:
+            raise ValueError('bad message')
+        handled.append(message)
+
+    result.handle_message = failing
+    for i in range(3):
+        result.feed_message(i)
+    await asyncio.sleep(0)
+    assert handled == [0, 2]
+    try:
+        await future
+        assert False
+    except ValueError:
+        pass
+
+    # the messages left are handled before the next frame is parsed
+    result, handled = client({'asyncio_loop': loop})
+    for i in range(3):
+        result.feed_message(i)
+    result.handle_messages()
+    assert handled == [0, 1, 2] and result.batches == 1
+
+
+asyncio.run(test())
@@ -0,0 +1,83 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+from ccxt import ExchangeClosedByUser, NetworkError  # noqa: E402
+from ccxt.async_support.base.ws.future import Future  # noqa: E402
+
+
+async def raises(awaitable, error):
+    try:
+        await awaitable
+        assert False
+    except error as e:
+        return e
+
+
+async def test():
+    loop = asyncio.get_running_loop()
+
+    # the first result wins
+    futures = [Future() for i in range(3)]
+    race = Future.race(futures)
+    assert all(f.is_race_future for f in futures)
+    loop.call_soon(futures[1].resolve, 'b')
+    assert await race == 'b'
+    # the listeners of the other futures are removed
+    assert not any(f._callbacks for f in futures)
+    futures[0].resolve('a')
+    await asyncio.sleep(0)
+    assert race.result() == 'b'
+
+    # a future that is already resolved
+    futures = [Future(), Future()]
+    futures[1].resolve(1)
+    assert await Future.race(futures) == 1
+
+    # the exceptions come before the results of the futures done at the same time
+    futures = [Future() for i in range(3)]
+    race = Future.race(futures)
+    futures[0].resolve('a')
+    futures[2].reject(NetworkError('down'))
+    error = await raises(race, NetworkError)
+    assert str(error) == 'down'
+
+    # the futures cancelled by close() are skipped
+    futures = [Future(), Future()]
+    race = Future.race(futures)
+    futures[0].cancel()
+    futures[1].resolve('b')
+    assert await race == 'b'
+
+    # all of them cancelled by close()
+    futures = [Future(), Future()]
+    race = Future.race(futures)
+    for f in futures:
+        f.cancel()
+    await raises(race, ExchangeClosedByUser)
+
+    # cancelling the race leaves the futures pending and removes the listeners
+    futures = [Future(), Future()]
+    race = Future.race(futures)
+    try:
+        await asyncio.wait_for(race, 0.01)
+        assert False
+    except asyncio.TimeoutError:
+        pass
+    assert race.cancelled()
+    assert not any(f.done() for f in futures)
+    await asyncio.sleep(0)
+    assert not any(f._callbacks for f in futures)
+    futures[0].resolve('late')
+    await asyncio.sleep(0)
+
+    # no futures
+    await raises(Future.race([]), ValueError)
+
+
+asyncio.run(test())
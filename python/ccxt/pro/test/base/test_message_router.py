@@ -0,0 +1,112 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.pro as ccxtpro  # noqa: E402
+from ccxt.async_support.base.ws.router import MessageRouter  # noqa: E402
+
+# exact routes first, then the prefixes and the substrings in their order, then the predicates
+
+router = MessageRouter({
+    'exact': {'order': 'order', 'user.trade': 'my trades'},
+    'prefix': {'candle': 'ohlcv', 'book': 'order book'},
+    'contains': {'trade': 'trades', 'order': 'orders'},
+    'predicate': [[lambda route: route.endswith('!'), 'bang']],
+})
+assert router.find('order') == 'order'
+assert router.find('user.trade') == 'my trades'
+assert router.find('candle1m') == 'ohlcv'
+assert router.find('books5') == 'order book'
+assert router.find('spot.trade') == 'trades'
+assert router.find('candle.trade') == 'ohlcv'
+assert router.find('stop.order') == 'orders'
+assert router.find('trade!') == 'trades'
+assert router.find('what!') == 'bang'
+assert router.find('unknown') is None
+assert router.find(None) is None
+assert router.find(['a']) is None
+assert router.resolved['candle1m'] == 'ohlcv' and router.resolved['unknown'] is None
+
+# the resolved routes are bounded
+router.max_resolved = 3
+for i in range(10):
+    assert router.find('candle' + str(i)) == 'ohlcv'
+assert len(router.resolved) <= len(router.exact) + router.max_resolved + 5
+
+# the exchanges find the same handlers as the tables they built for every message
+
+
+class Client:
+    subscriptions = {
+        '42': {'subscription': {'name': 'book'}},
+    }
+
+
+cases = {
+    'binance': [
+        ({'e': 'depthUpdate', 's': 'BTCUSDT'}, 'handle_order_book'),
+        ([{'e': '24hrTicker', 's': 'BTCUSDT'}], 'handle_tickers'),
+        ({'e': 'executionReport'}, 'handle_order_update'),
+        ({'e': 'ACCOUNT_UPDATE'}, 'handle_acount_update'),
+        ({'u': 1, 's': 'BTCUSDT', 'b': '1', 'B': '1', 'a': '2', 'A': '1'}, 'handle_bids_asks'),
+        ({'id': '5', 'result': None}, 'handle_subscription_status'),
+        ({'e': 'unknown'}, None),
+    ],
+    'okx': [
+        ({'event': 'login', 'code': '0'}, 'handle_authenticate'),
+        ({'event': 'mass-cancel'}, 'handle_cancel_all_orders'),
+        ({'arg': {'channel': 'books5', 'instId': 'BTC-USDT'}, 'data': []}, 'handle_order_book'),
+        ({'arg': {'channel': 'index-tickers', 'instId': 'BTC-USDT'}, 'data': []}, 'handle_ticker'),
+        ({'arg': {'channel': 'candle1m', 'instId': 'BTC-USDT'}, 'data': []}, 'handle_ohlcv'),
+        ({'arg': {'channel': 'unknown'}, 'data': []}, None),
+    ],
+    'bybit': [
+        ({'topic': 'orderbook.50.BTCUSDT', 'data': {}}, 'handle_order_book'),
+        ({'topic': 'tickers.BTCUSDT', 'data': {}}, 'handle_ticker'),
+        ({'topic': 'publicTrade.BTCUSDT', 'data': []}, 'handle_trades'),
+        ({'topic': 'kline.1.BTCUSDT', 'data': []}, 'handle_ohlcv'),
+        ({'topic': 'user.openapi.perp.trade', 'data': []}, 'handle_my_trades'),
+        ({'topic': 'user.openapi.perp.order', 'data': []}, 'handle_order'),
+        ({'topic': 'order', 'data': []}, 'handle_order'),
+        ({'op': 'auth', 'success': True}, 'handle_authenticate'),
+    ],
+    'kraken': [
+        ([42, {'a': []}, 'book-10', 'XBT/USD'], 'handle_order_book'),
+        ([43, [], 'trade', 'XBT/USD'], 'handle_trades'),
+        ([44, [], 'spread', 'XBT/USD'], None),
+        ({'event': 'heartbeat'}, 'handle_heartbeat'),
+        ({'event': 'cancelAllStatus', 'status': 'ok'}, 'handle_cancel_all_orders'),
+    ],
+    'bitget': [
+        ({'event': 'subscribe', 'arg': {}}, 'handle_subscription_status'),
+        ({'action': 'update', 'arg': {'channel': 'ticker'}, 'data': []}, 'handle_ticker'),
+        ({'action': 'update', 'arg': {'channel': 'account-crossed'}, 'data': []}, 'handle_balance'),
+        ({'action': 'update', 'arg': {'channel': 'candle1m'}, 'data': []}, 'handle_ohlcv'),
+        ({'action': 'update', 'arg': {'channel': 'books15'}, 'data': []}, 'handle_order_book'),
+    ],
+    'gate': [
+        ({'channel': 'spot.order_book_update', 'event': 'update', 'result': {}}, 'handle_order_book'),
+        ({'channel': 'futures.tickers', 'event': 'update', 'result': {}}, 'handle_ticker'),
+        ({'channel': 'spot.book_ticker', 'event': 'update', 'result': {}}, 'handle_bid_ask'),
+        ({'channel': 'spot.unknown', 'event': 'update', 'result': {}}, None),
+    ],
+}
+
+for exchange_id, messages in cases.items():
+    exchange = getattr(ccxtpro, exchange_id)()
+    called = []
+    for name in dir(exchange):
+        if name.startswith('handle_') and name not in ('handle_message', 'handle_error_message'):
+            setattr(exchange, name, lambda *args, name=name: called.append(name))
+    for message, expected in messages:
+        called.clear()
+        exchange.handle_message(Client(), message)
+        assert called == ([expected] if expected else []), (exchange_id, message, called)
+    # the routers are built once per instance
+    routers = exchange.message_routers
+    exchange.handle_message(Client(), messages[0][0])
+    assert exchange.message_routers is routers
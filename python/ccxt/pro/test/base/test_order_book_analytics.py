@@ -0,0 +1,63 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.async_support.base.ws import order_book_analytics as analytics  # noqa: E402
+from ccxt.async_support.base.ws.order_book import OrderBook, ArrayOrderBook, CountedOrderBook  # noqa: E402
+
+if analytics.np is None:
+    print('numpy is not installed, skipping the order book analytics tests')
+    sys.exit()
+
+import numpy as np  # noqa: E402
+
+snapshot = {
+    'asks': [[101, 1], [102, 2], [104, 4]],
+    'bids': [[99, 1], [98, 3], [96, 2]],
+}
+rest = {'asks': snapshot['asks'], 'bids': snapshot['bids'], 'timestamp': None, 'datetime': None, 'nonce': None, 'symbol': 'BTC/USDT'}
+counted = {
+    'asks': [[101, 1, 1], [102, 2, 1], [104, 4, 1]],
+    'bids': [[99, 1, 1], [98, 3, 1], [96, 2, 1]],
+}
+
+for book in (rest, OrderBook(snapshot), ArrayOrderBook(snapshot), CountedOrderBook(counted)):
+    prices, amounts = analytics.arrays(book, 'bids')
+    assert prices.tolist() == [99, 98, 96] and amounts.tolist() == [1, 3, 2]
+    prices, cumulative_amounts, cumulative_costs = analytics.cumulative(book, 'asks')
+    assert cumulative_amounts.tolist() == [1, 3, 7] and cumulative_costs.tolist() == [101, 305, 721]
+    # buying 2 takes 1 at 101 and 1 at 102
+    impact = analytics.market_impact(book, 'asks', 2)
+    assert impact == {'amount': 2, 'cost': 203, 'average': 101.5, 'price': 102, 'slippage': 0.5 / 101}
+    # selling more than the book has
+    impact = analytics.market_impact(book, 'bids', 10)
+    assert impact['amount'] == 6 and impact['cost'] == 99 + 294 + 192 and impact['price'] == 96
+    assert analytics.vwap(book, 'asks', 1) == 101
+    curve = analytics.slippage_curve(book, 'asks', [0.5, 1, 3, 5])
+    assert curve['cost'].tolist() == [50.5, 101, 305, 513]
+    assert curve['price'].tolist() == [101, 101, 102, 104]
+    assert np.all(np.diff(curve['slippage']) >= 0)
+    assert analytics.imbalance(book) == (6 - 7) / 13
+    assert analytics.imbalance(book, 1) == 0
+    # the mid is 100, 150 bps reach 101.5 and 98.5
+    assert analytics.depth_at_bps(book, 150) == {'asks': 1, 'bids': 1}
+    assert analytics.depth_at_bps(book, [100, 200, 400, 1000])['asks'].tolist() == [1, 3, 7, 7]
+    assert analytics.depth_at_bps(book, [100, 200, 400, 1000])['bids'].tolist() == [1, 4, 6, 6]
+
+empty = OrderBook({})
+assert analytics.depth_at_bps(empty, 10) is None
+assert analytics.imbalance(empty) is None
+assert np.isnan(analytics.market_impact(empty, 'asks', 1)['average'])
+
+# deep array-backed sides span several blocks
+book = ArrayOrderBook({'asks': [[100 + i, 1] for i in range(2000)], 'bids': [[100 - i, 1] for i in range(1, 2000)]})
+assert len(book['asks']._blocks) > 1
+prices, amounts = analytics.arrays(book, 'bids')
+assert prices.tolist() == [level[0] for level in book['bids']]
+assert analytics.market_impact(book, 'asks', 1000)['price'] == 1099
+# the side can still be updated after an export
+book['asks'].store(99.5, 1)
@@ -0,0 +1,135 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import copy  # noqa: E402
+import json  # noqa: E402
+import random  # noqa: E402
+import ccxt.pro as ccxtpro  # noqa: E402
+from ccxt import Exchange  # noqa: E402
+from ccxt.async_support.base.ws.order_book import OrderBook, CountedOrderBook, ArrayOrderBook, ArrayCountedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book_side import ArrayOrderBookSide, ArrayAsks, ArrayBids, ArrayCountedBids  # noqa: E402
+
+# the array engine must behave exactly like the list engine
+
+random.seed(0)
+
+
+def random_delta(counted):
+    price = random.randint(1, 3000) / 4
+    size = random.choice([0, 0, random.randint(1, 100) / 10])
+    return [price, size, random.randint(0, 3)] if counted else [price, size]
+
+
+def assert_same(expected, actual):
+    for key in ('asks', 'bids'):
+        assert actual[key] == expected[key]
+        assert len(actual[key]) == len(expected[key])
+        assert list(actual[key]) == list(expected[key])
+        for i in (0, 1, -1, -2, len(expected[key]) // 2):
+            if -len(expected[key]) <= i < len(expected[key]):
+                assert actual[key][i] == expected[key][i]
+        for start, stop in ((0, 5), (3, 700), (-10, None), (600, 520)):
+            assert actual[key][start:stop] == expected[key][start:stop]
+        assert actual[key][::3] == expected[key][::3]
+
+
+for counted, ListBook, ArrayBook in ((False, OrderBook, ArrayOrderBook), (True, CountedOrderBook, ArrayCountedOrderBook)):
+    snapshot = {
+        'asks': [random_delta(counted) for i in range(2000)],
+        'bids': [random_delta(counted) for i in range(2000)],
+    }
+    for depth in (None, 1000, 10):
+        expected = ListBook(snapshot, depth)
+        actual = ArrayBook(snapshot, depth)
+        assert isinstance(actual['asks'], ArrayOrderBookSide)
+        assert_same(expected, actual)
+        for i in range(20000):
+            key = random.choice(['asks', 'bids'])
+            delta = random_delta(counted)
+            expected[key].storeArray(list(delta))
+            actual[key].storeArray(list(delta))
+            if i % 1000 == 0:
+                expected.limit()
+                actual.limit()
+                assert_same(expected, actual)
+        expected.limit()
+        actual.limit()
+        assert_same(expected, actual)
+        # reset clears the blocks
+        expected.reset({'asks': snapshot['asks'][:10], 'nonce': 1})
+        actual.reset({'asks': snapshot['asks'][:10], 'nonce': 1})
+        assert_same(expected, actual)
+        assert actual['nonce'] == 1
+
+asks = ArrayAsks([[3, 1], [1, 2], [2, 3]])
+assert asks == [[1, 2], [2, 3], [3, 1]]
+assert repr(asks) == '[[1.0, 2.0], [2.0, 3.0], [3.0, 1.0]]'
+try:
+    asks[3]
+    assert False
+except IndexError:
+    pass
+
+# the side is used like the list of the list engine
+book = ArrayOrderBook({'asks': [[3, 1], [1, 2]], 'bids': [[0.5, 1]]})
+assert isinstance(book['asks'], list)
+assert json.loads(json.dumps(book)) == {'asks': [[1, 2], [3, 1]], 'bids': [[0.5, 1]], 'timestamp': None, 'datetime': None, 'nonce': None, 'symbol': None}
+assert Exchange().safe_list(book, 'asks') == [[1, 2], [3, 1]]
+assert [1, 2] in book['asks'] and [1, 3] not in book['asks']
+assert book['asks'].index([3, 1]) == 1 and book['asks'].count([3, 1]) == 1
+assert list(reversed(book['asks'])) == [[3, 1], [1, 2]]
+assert book['asks'] + [[4, 1]] == [[1, 2], [3, 1], [4, 1]]
+assert not (book['asks'] != [[1, 2], [3, 1]])
+assert copy.deepcopy(book['asks']) == book['asks'] and copy.copy(book['asks'])._depth == book['asks']._depth
+
+# writes through indexing are stored
+asks = book['asks']
+asks[0][1] = 5
+assert asks == [[1, 5], [3, 1]]
+asks[-1] = [2, 7]
+assert asks == [[1, 5], [2, 7]]
+asks[1][0] = 4
+assert asks == [[1, 5], [4, 7]]
+del asks[0]
+assert asks == [[4, 7]]
+counted = ArrayCountedBids([[1, 2, 3]])
+counted[0][2] = 4
+assert counted == [[1, 2, 4]]
+counted[0][2] = 0
+assert counted == []
+
+# sizes and counts are numbers, missing ones remove the level like a zero
+bids = ArrayBids([['2.5', '1.5'], [1, '0.5']])
+assert bids == [[2.5, 1.5], [1, 0.5]]
+bids.storeArray([1, None])
+bids.storeArray(['2.5', '0'])
+assert bids == []
+counted.storeArray(['3', '1.5', '2'])
+counted.storeArray([3, 1.5, None])
+assert counted == []
+for delta in ([None, 1], ['price', 1], [1, 'size']):
+    try:
+        bids.storeArray(delta)
+        assert False
+    except ValueError:
+        pass
+
+# bitget keeps the raw delta as the third value of its counted book, for its checksum
+random.seed(1)
+books = [ccxtpro.bitget({'orderBookEngine': engine}).counted_order_book({}) for engine in ('list', 'array')]
+books[1]['bids'].storeArray([5, 1, 1])
+books[1]['bids'].storeArray([5, 0, 1])
+for i in range(3000):
+    key = random.choice(['asks', 'bids'])
+    delta = [str(random.randint(1, 300) / 4), random.choice(['0', str(random.randint(1, 100) / 10)])]
+    for book in books:
+        ccxtpro.bitget().handle_delta(book[key], list(delta))
+expected, actual = books
+assert isinstance(actual['bids'], ArrayOrderBookSide)
+assert_same(expected, actual)
+assert actual['bids'][0][2] == expected['bids'][0][2] and isinstance(actual['bids'][0][2][0], str)
@@ -0,0 +1,62 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.async_support.base.ws.order_book import OrderBook, CountedOrderBook, IndexedOrderBook, ArrayOrderBook, ArrayCountedOrderBook  # noqa: E402
+
+
+def test_views(Book, asks, bids):
+    book = Book({'asks': asks, 'bids': bids, 'nonce': 1}, 3)
+    assert book.best_ask() == asks[1]
+    assert book.best_bid() == bids[0]
+    assert book.mid() == 10.5
+    assert book.spread() == 1
+    # 1 from the best ask, 2 from the second one, 1.5 from the third one
+    assert book.depth_to('asks', 4.5) == {'price': 13, 'amount': 4.5, 'cost': 11 + 24 + 19.5, 'levels': 3}
+    # more than the side has
+    assert book.depth_to('bids', 100) == {'price': 7, 'amount': 9, 'cost': 10 + 18 + 24 + 21, 'levels': 4}
+
+    top = book.top(2)
+    assert top['asks'] == [asks[1], asks[0]] and top['bids'] == [bids[0], bids[1]] and top['nonce'] == 1
+    # nothing changed, the same snapshot is returned
+    assert book.top(2) is top
+    assert book.top() is not top
+    # only the snapshot of the last n is kept
+    assert book.top(2) is not top
+    # a side replaced with an equal one is compared by identity
+    top = book.top(2)
+    book['bids'] = type(book['bids'])([list(level) for level in book['bids']], 3)
+    assert book.top(2) is not top and book.top(2) == top
+    top = book.top(2)
+    # the snapshot is a copy, later updates do not change it
+    book['asks'].storeArray(list(asks[1][:1]) + [5] + list(asks[1][2:]))
+    assert top['asks'][0][1] == 1
+    assert book.top(2) is not top
+    assert book.top(2)['asks'][0][1] == 5
+    top = book.top(2)
+    book.limit()
+    assert book.top(2)['asks'] == top['asks']
+    assert len(book.top()['bids']) == 3
+    top = book.top(2)
+    book.reset({'asks': [], 'bids': [], 'nonce': 2})
+    assert book.top(2) is not top
+    assert book.top(2)['nonce'] == 2
+    assert book.best_ask() is None and book.mid() is None and book.spread() is None
+    assert book.depth_to('asks', 1) == {'price': None, 'amount': 0, 'cost': 0, 'levels': 0}
+
+
+asks = [[12, 2], [11, 1], [13, 3], [14, 4]]
+bids = [[10, 1], [9, 2], [8, 3], [7, 0], [7, 3]]
+test_views(OrderBook, asks, bids)
+test_views(ArrayOrderBook, asks, bids)
+counted_asks = [[12, 2, 1], [11, 1, 1], [13, 3, 1], [14, 4, 1]]
+counted_bids = [[10, 1, 1], [9, 2, 1], [8, 3, 1], [7, 0, 1], [7, 3, 1]]
+test_views(CountedOrderBook, counted_asks, counted_bids)
+test_views(ArrayCountedOrderBook, counted_asks, counted_bids)
+indexed_asks = [[12, 2, 'a'], [11, 1, 'b'], [13, 3, 'c'], [14, 4, 'd']]
+indexed_bids = [[10, 1, 'e'], [9, 2, 'f'], [8, 3, 'g'], [7, 0, 'h'], [7, 3, 'i']]
+test_views(IndexedOrderBook, indexed_asks, indexed_bids)
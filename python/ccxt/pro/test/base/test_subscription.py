@@ -0,0 +1,239 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import ccxt.pro as ccxtpro  # noqa: E402
+from ccxt import NetworkError, NotSupported  # noqa: E402
+
+# binance with the markets of the static tests, the connections are never opened
+
+with open(os.path.join(root, '..', 'ts', 'src', 'test', 'static', 'markets', 'binance.json'), encoding='utf-8') as file:
+    markets = json.load(file)
+
+
+async def send(message):
+    pass
+
+
+class Transport:
+    reading = True
+
+    def is_reading(self):
+        return self.reading
+
+    def is_closing(self):
+        return False
+
+    def pause_reading(self):
+        self.reading = False
+
+    def resume_reading(self):
+        self.reading = True
+
+
+def binance(config={}):
+    exchange = ccxtpro.binance(config)
+    exchange.set_markets(markets)
+    client = exchange.client
+
+    def connected_client(url):
+        result = client(url)
+        if not result.connected.done():
+            result.connected.resolve(url)
+            result.send = send
+            result.transport = Transport()
+        return result
+
+    exchange.client = connected_client
+    return exchange
+
+
+def ticker(client, symbol, price):
+    client.on_message_callback(client, {'e': '24hrTicker', 'E': 1700000000000, 's': symbol, 'c': price, 'o': '1', 'h': '3', 'l': '1', 'v': '10', 'q': '20'})
+
+
+async def started(subscription):
+    while not subscription.message_hashes and not subscription.task.done():
+        await asyncio.sleep(0)
+    return subscription.client
+
+
+async def test():
+    # every update, in order
+    exchange = binance()
+    subscription = exchange.subscription('watch_ticker', 'BTC/USDT')
+    client = await started(subscription)
+    assert client.subscribers == {'ticker:ticker@BTC/USDT': [subscription]}
+    for price in ('1', '2', '3'):
+        ticker(client, 'BTCUSDT', price)
+    assert [(await subscription.__anext__())['last'] for i in range(3)] == [1, 2, 3]
+    # the first call of the watch method returns, no future is left for the next updates
+    await subscription.task
+    ticker(client, 'BTCUSDT', '4')
+    assert not client.futures
+    assert (await subscription.__anext__())['last'] == 4
+
+    # the values queued before an error come first
+    ticker(client, 'BTCUSDT', '5')
+    client.reject(NetworkError('down'))
+    assert (await subscription.__anext__())['last'] == 5
+    try:
+        await subscription.__anext__()
+        assert False
+    except NetworkError:
+        pass
+    assert client.subscribers == {}
+    await exchange.close()
+
+    # the subscriptions of the exchange are stored as they are passed to watch and watch_multiple
+    exchange = binance()
+    subscription = exchange.subscription('watch_order_book', 'BTC/USDT')
+    client = await started(subscription)
+    stored = client.subscriptions['btcusdt@depth']
+    assert isinstance(stored, dict) and stored['method'] == exchange.handle_order_book_subscription
+    url = 'wss://stream.binance.com:9443/ws/test'
+    futures = [
+        exchange.watch(url, 'a', None, 'a', {'name': 'a'}),
+        exchange.watch_multiple(url, ['b', 'c'], None, ['b', 'c'], {'name': 'b'}),
+        exchange.watch(url, 'd', None, 'd'),
+    ]
+    assert exchange.client(url).subscriptions == {'a': {'name': 'a'}, 'b': {'name': 'b'}, 'c': {'name': 'b'}, 'd': True}
+    subscription.close()
+    await exchange.close()
+    await asyncio.gather(*futures, return_exceptions=True)
+
+    # the oldest values are dropped
+    exchange = binance()
+    subscription = exchange.subscription('watch_ticker', 'BTC/USDT', max_size=2)
+    client = await started(subscription)
+    for price in ('1', '2', '3', '4'):
+        ticker(client, 'BTCUSDT', price)
+    assert subscription.dropped == 2
+    assert [(await subscription.__anext__())['last'] for i in range(2)] == [3, 4]
+
+    # closing the exchange ends the iteration
+    await exchange.close()
+    assert [value async for value in subscription] == []
+
+    # the latest value of each message hash
+    exchange = binance()
+    subscription = exchange.subscription('watch_tickers', ['BTC/USDT', 'ETH/USDT'], policy='conflate')
+    client = await started(subscription)
+    assert sorted(subscription.message_hashes) == ['ticker:ticker@BTC/USDT', 'ticker:ticker@ETH/USDT']
+    for price in ('1', '2', '3'):
+        ticker(client, 'BTCUSDT', price)
+        ticker(client, 'ETHUSDT', str(int(price) * 10))
+    updates = [await subscription.__anext__() for i in range(2)]
+    assert [(update['symbol'], update['last']) for update in updates] == [('BTC/USDT', 3), ('ETH/USDT', 30)]
+    assert not subscription.queue
+
+    # closing the subscription detaches it
+    subscription.close()
+    assert client.subscribers == {}
+    assert [value async for value in subscription] == []
+    await exchange.close()
+
+    # reading from the connection is paused while the queue is full
+    exchange = binance()
+    subscription = exchange.subscription('watch_ticker', 'BTC/USDT', max_size=2, policy='block')
+    client = await started(subscription)
+    for price in ('1', '2'):
+        ticker(client, 'BTCUSDT', price)
+    assert client.transport.reading
+    ticker(client, 'BTCUSDT', '3')
+    assert not client.transport.reading and client.paused_by == {subscription}
+    assert subscription.dropped == 0 and len(subscription.queue) == 3
+    await subscription.__anext__()
+    assert not client.transport.reading
+    await subscription.__anext__()
+    assert client.transport.reading and not client.paused_by
+    await exchange.close()
+
+    # the pause ends before the keepalive times the connection out, the values received after it are queued
+    exchange = binance({'streaming': {'maxReadPause': 10}})
+    subscription = exchange.subscription('watch_ticker', 'BTC/USDT', max_size=1, policy='block')
+    client = await started(subscription)
+    assert client.max_read_pause() == 10
+    client.keepAlive = 8
+    assert client.max_read_pause() == 4
+    client.keepAlive = 30000
+    for price in ('1', '2'):
+        ticker(client, 'BTCUSDT', price)
+    assert not client.transport.reading
+    await asyncio.sleep(0.05)
+    assert client.transport.reading and not client.paused_by and client.pause_timer is None
+    for price in ('3', '4'):
+        ticker(client, 'BTCUSDT', price)
+    assert client.transport.reading and len(subscription.queue) == 4
+    assert [(await subscription.__anext__())['last'] for i in range(4)] == [1, 2, 3, 4]
+    assert not subscription.paused
+    await exchange.close()
+
+    # a failing callback detaches the subscription and resumes reading
+    exchange = binance()
+
+    def failing(ticker):
+        raise ValueError('callback failed')
+
+    subscription = exchange.subscription('watch_ticker', 'BTC/USDT', max_size=2, policy='block', callback=failing)
+    client = await started(subscription)
+    for price in ('1', '2', '3', '4'):
+        ticker(client, 'BTCUSDT', price)
+    assert not client.transport.reading
+    try:
+        await subscription.task
+        assert False
+    except ValueError:
+        pass
+    assert client.subscribers == {} and client.transport.reading and not client.paused_by
+    assert not subscription.queue and isinstance(subscription.error, ValueError)
+    ticker(client, 'BTCUSDT', '5')
+    assert not subscription.queue
+    await exchange.close()
+
+    # a callback, sync or async
+    exchange = binance()
+    received = []
+
+    async def on_ticker(ticker):
+        await asyncio.sleep(0)
+        received.append(ticker['last'])
+
+    subscription = exchange.subscription('watch_ticker', 'BTC/USDT', callback=on_ticker)
+    eth = exchange.subscription('watch_ticker', 'ETH/USDT', callback=lambda ticker: received.append(ticker['symbol']))
+    client = await started(subscription)
+    eth_client = await started(eth)
+    for price in ('1', '2'):
+        ticker(client, 'BTCUSDT', price)
+        ticker(eth_client, 'ETHUSDT', price)
+    while len(received) < 4:
+        await asyncio.sleep(0)
+    assert sorted(received, key=str) == [1, 2, 'ETH/USDT', 'ETH/USDT']
+    await exchange.close()
+    await subscription.task
+    await eth.task
+
+    # the errors of the first call of the watch method
+    exchange = binance()
+    subscription = exchange.subscription('watch_ticker', 'UNKNOWN/SYMBOL')
+    try:
+        await subscription.__anext__()
+        assert False
+    except Exception as e:
+        assert 'UNKNOWN/SYMBOL' in str(e)
+    await exchange.close()
+
+    try:
+        exchange.subscription('watch_ticker', 'BTC/USDT', policy='lifo')
+        assert False
+    except NotSupported:
+        pass
+
+
+asyncio.run(test())
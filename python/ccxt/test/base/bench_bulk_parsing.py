@@ -0,0 +1,56 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import time  # noqa: E402
+import ccxt  # noqa: E402
+
+# binance public trades and candles through parse_trades() and parse_ohlcvs(), one page of 1000 with a since in the middle
+
+markets = [{
+    'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT',
+    'type': 'spot', 'spot': True, 'linear': None, 'inverse': None, 'contract': False, 'precision': {'amount': 0.00001, 'price': 0.01},
+}]
+trades = [{'a': 26129 + i, 'p': '0.01633102', 'q': '4.70443515', 'f': 27781 + i, 'l': 27781 + i, 'T': 1498793709153 + i * 10, 'm': i % 2 == 0, 'M': True} for i in range(1000)]
+ohlcvs = [[1591478520000 + i * 60000, '0.02501300', '0.02501800', '0.02500000', '0.02500000', '22.19000000', 1591478579999, '0.55490906', 40, '10.92900000', '0.27336462', '0'] for i in range(1000)]
+
+
+def bench(exchange, method, *args):
+    best = None
+    for i in range(20):
+        start = time.perf_counter()
+        getattr(exchange, method)(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+for bulk in (False, True):
+    exchange = ccxt.binance({'markets': markets, 'bulkParsing': bulk})
+    market = exchange.market('BTC/USDT')
+    print(f'bulkParsing={bulk!s:>5}')
+    print(f'  parse_trades: {bench(exchange, "parse_trades", trades, market):6.2f}ms, since: {bench(exchange, "parse_trades", trades, market, trades[500]["T"], 100):6.2f}ms')
+    print(f'  parse_ohlcvs: {bench(exchange, "parse_ohlcvs", ohlcvs, market):6.2f}ms, since: {bench(exchange, "parse_ohlcvs", ohlcvs, market, "1m", ohlcvs[500][0], 100):6.2f}ms')
+
+# output
+
+'''
+bulkParsing=False
+  parse_trades:  23.24ms, since:  23.50ms
+  parse_ohlcvs:   8.95ms, since:   9.48ms
+bulkParsing= True
+  parse_trades:  21.77ms, since:  22.15ms
+  parse_ohlcvs:   8.87ms, since:   8.77ms
+'''
+
+# safe_market() building the structure of an unknown market on every call
+
+'''
+bulkParsing=False
+  parse_trades:  30.73ms, since:  30.82ms
+  parse_ohlcvs:   9.43ms, since:  10.09ms
+'''
@@ -0,0 +1,41 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+from ccxt.base.columns import ohlcv_columns, trade_columns  # noqa: E402
+
+# memory held by 100000 candles and trades as rows and as columns, and the time of the conversion
+
+count = 100000
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+ohlcvs, ohlcvs_size, elapsed = measure(lambda: [[1591478520000 + i * 60000, 0.025013 + i, 0.025018 + i, 0.025 + i, 0.02501 + i, 22.19 + i] for i in range(count)])
+columns, columns_size, elapsed = measure(lambda: ohlcv_columns(ohlcvs))
+print(f'candles as rows: {ohlcvs_size / 1e6:6.1f}MB, as columns: {columns_size / 1e6:6.1f}MB, converted in {elapsed * 1000:.1f}ms')
+
+trades, trades_size, elapsed = measure(lambda: [{'info': {}, 'id': str(26129 + i), 'timestamp': 1498793709153 + i, 'datetime': '2017-06-30T03:35:09.153Z', 'symbol': 'BTC/USDT', 'order': None, 'type': None, 'side': 'buy', 'takerOrMaker': None, 'price': 0.01633102 + i, 'amount': 4.70443515, 'cost': 0.0768 + i, 'fee': None, 'fees': []} for i in range(count)])
+columns, columns_size, elapsed = measure(lambda: trade_columns(trades))
+print(f' trades as rows: {trades_size / 1e6:6.1f}MB, as columns: {columns_size / 1e6:6.1f}MB, converted in {elapsed * 1000:.1f}ms')
+
+# output, the times include the tracing of the allocations and the ids of the trades are shared with the rows
+
+'''
+candles as rows:   26.8MB, as columns:    4.8MB, converted in 144.2ms
+ trades as rows:   73.0MB, as columns:    4.9MB, converted in 145.0ms
+'''
@@ -0,0 +1,58 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import time  # noqa: E402
+import ccxt  # noqa: E402
+
+# construction time of every exchange in ccxt.exchanges, the first instance of a class
+# builds its describe() cache and its camelcase aliases, the next ones reuse them
+
+instances = 20
+first = {}
+next = {}
+for id in ccxt.exchanges:
+    exchange_class = getattr(ccxt, id)
+    start = time.perf_counter()
+    exchange_class()
+    first[id] = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(instances):
+        exchange_class({'apiKey': 'key', 'secret': 'secret'})
+    next[id] = (time.perf_counter() - start) / instances
+
+print(f'{len(ccxt.exchanges)} exchanges, {instances} instances each')
+print(f'first instance: {sum(first.values()) * 1000:8.1f}ms in total')
+print(f' next instance: {sum(next.values()) * 1000:8.1f}ms in total, {sum(next.values()) / len(next) * 1000:.3f}ms on average')
+for id in sorted(next, key=next.get, reverse=True)[:5]:
+    print(f'{id:>14}: {next[id] * 1000:.3f}ms')
+
+# output
+
+'''
+103 exchanges, 20 instances each
+first instance:    335.5ms in total
+ next instance:     30.6ms in total, 0.297ms on average
+      coinspot: 1.450ms
+       binance: 0.784ms
+         bit2c: 0.779ms
+  binancecoinm: 0.701ms
+     coincheck: 0.671ms
+'''
+
+# describe() and the camelcase aliases built for every instance
+
+'''
+103 exchanges, 20 instances each
+first instance:    435.2ms in total
+ next instance:    432.1ms in total, 4.195ms on average
+   binanceusdm: 14.480ms
+     binanceus: 12.131ms
+  binancecoinm: 10.420ms
+           htx: 9.249ms
+        bitget: 9.220ms
+'''
@@ -0,0 +1,47 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import random  # noqa: E402
+import time  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision, fast_decimal_to_precision, TICK_SIZE, DECIMAL_PLACES  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# price_to_precision() and amount_to_precision() of the quotes of a market maker, with decimal_to_precision() and with the formatters
+
+random.seed(0)
+quotes = [(random.uniform(20000, 30000), random.uniform(0, 5)) for i in range(20000)]
+markets = {
+    'BTC/USDT': {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True},
+}
+
+print(f'{len(quotes)} quotes')
+for mode, precision in ((TICK_SIZE, {'price': 0.01, 'amount': 0.00001}), (DECIMAL_PLACES, {'price': 2, 'amount': 5})):
+    exchange = Exchange({'id': 'bench', 'precisionMode': mode})
+    exchange.update_markets({symbol: dict(market, precision=precision) for symbol, market in markets.items()})
+    for name, method in (('decimal_to_precision', decimal_to_precision), ('fast_decimal_to_precision', fast_decimal_to_precision)):
+        exchange.decimal_to_precision = method
+        best = None
+        for i in range(5):
+            start = time.perf_counter()
+            for price, amount in quotes:
+                exchange.price_to_precision('BTC/USDT', price)
+                exchange.amount_to_precision('BTC/USDT', amount)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        label = 'TICK_SIZE' if mode == TICK_SIZE else 'DECIMAL_PLACES'
+        print(f'{label:>14} {name:>25}: {best / len(quotes) / 2 * 1e9:6.0f}ns per call')
+
+# output
+
+'''
+20000 quotes
+     TICK_SIZE      decimal_to_precision:  11576ns per call
+     TICK_SIZE fast_decimal_to_precision:   4732ns per call
+DECIMAL_PLACES      decimal_to_precision:   5692ns per call
+DECIMAL_PLACES fast_decimal_to_precision:   3881ns per call
+'''
@@ -0,0 +1,53 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+
+# import time and memory of a fresh interpreter that uses one exchange
+# the exchange modules and the signing dependencies are imported on first use
+
+runs = 5
+script = '''
+import resource, sys, time
+start = time.perf_counter()
+{}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(sys.modules))
+'''
+cases = [
+    'import ccxt',
+    'import ccxt; ccxt.binance()',
+    'import ccxt.async_support; ccxt.async_support.binance()',
+    'import ccxt.pro; ccxt.pro.binance()',
+]
+
+for case in cases:
+    results = [subprocess.run([sys.executable, '-c', script.format(case)], cwd=root, capture_output=True, text=True, check=True).stdout.split() for i in range(runs)]
+    elapsed = statistics.median(float(result[0]) for result in results)
+    memory = statistics.median(int(result[1]) for result in results)
+    modules = results[0][2]
+    print(f'{case:56} {elapsed * 1000:7.1f}ms {memory / 1024:6.1f}MiB {modules:>5} modules')
+
+# output
+
+'''
+import ccxt                                                218.3ms   37.9MiB   319 modules
+import ccxt; ccxt.binance()                                287.9ms   48.5MiB   322 modules
+import ccxt.async_support; ccxt.async_support.binance()    511.2ms   62.7MiB   479 modules
+import ccxt.pro; ccxt.pro.binance()                        525.3ms   62.9MiB   481 modules
+'''
+
+# every exchange module and signing dependency imported by the packages
+
+'''
+import ccxt                                               2152.1ms   76.0MiB   655 modules
+import ccxt; ccxt.binance()                               2321.2ms   76.0MiB   655 modules
+import ccxt.async_support; ccxt.async_support.binance()   2840.6ms  100.8MiB   903 modules
+import ccxt.pro; ccxt.pro.binance()                       3788.8ms  101.3MiB   968 modules
+'''
@@ -0,0 +1,80 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import json  # noqa: E402
+import time  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# the safe_* accessors over every object of the static response fixtures, once per key and once with a missing key
+
+responses = os.path.join(os.path.dirname(root), 'ts', 'src', 'test', 'static', 'response')
+
+
+def objects(value, result):
+    if isinstance(value, dict):
+        result.append(value)
+        for item in value.values():
+            objects(item, result)
+    elif isinstance(value, list):
+        for item in value:
+            objects(item, result)
+    return result
+
+
+dictionaries = []
+for name in sorted(os.listdir(responses)):
+    with open(os.path.join(responses, name), encoding='utf-8') as file:
+        fixture = json.load(file)
+    for tests in fixture.get('methods', {}).values():
+        for test in tests:
+            objects(test.get('httpResponse'), dictionaries)
+pairs = [(dictionary, key) for dictionary in dictionaries for key in list(dictionary.keys()) + ['missing']]
+
+methods = {
+    'safe_string': lambda d, k: Exchange.safe_string(d, k),
+    'safe_integer': lambda d, k: Exchange.safe_integer(d, k),
+    'safe_timestamp': lambda d, k: Exchange.safe_timestamp(d, k),
+    'safe_value': lambda d, k: Exchange.safe_value(d, k),
+    'safe_string_2': lambda d, k: Exchange.safe_string_2(d, 'missing', k),
+    'safe_value_n': lambda d, k: Exchange.safe_value_n(d, ['missing', k]),
+}
+
+print(f'{len(dictionaries)} objects, {len(pairs)} keys')
+for name, method in methods.items():
+    best = None
+    for i in range(5):
+        start = time.perf_counter()
+        for dictionary, key in pairs:
+            method(dictionary, key)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{name:>14}: {best / len(pairs) * 1e9:6.0f}ns per call')
+
+# output
+
+'''
+6238 objects, 48793 keys
+   safe_string:    575ns per call
+  safe_integer:    433ns per call
+safe_timestamp:    767ns per call
+    safe_value:    248ns per call
+ safe_string_2:    649ns per call
+  safe_value_n:    409ns per call
+'''
+
+# every lookup through key_exists()
+
+'''
+6238 objects, 48793 keys
+   safe_string:   1393ns per call
+  safe_integer:   1356ns per call
+safe_timestamp:   1892ns per call
+    safe_value:    940ns per call
+ safe_string_2:   2536ns per call
+  safe_value_n:    741ns per call
+'''
@@ -0,0 +1,60 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import time  # noqa: E402
+import ccxt  # noqa: E402
+
+# a reload of 3000 markets with nothing changed and with a few listings, through set_markets() and update_markets()
+
+
+def market(base, quote, type):
+    spot = type == 'spot'
+    return {
+        'id': base + quote + ('' if spot else '_PERP'),
+        'symbol': base + '/' + quote + ('' if spot else ':' + quote),
+        'base': base, 'quote': quote, 'settle': None if spot else quote,
+        'baseId': base, 'quoteId': quote, 'settleId': None if spot else quote,
+        'type': type, 'spot': spot, 'swap': not spot, 'future': False, 'option': False, 'contract': not spot,
+        'linear': None if spot else True, 'inverse': None if spot else False, 'active': True,
+        'precision': {'amount': 0.001, 'price': 0.01},
+        'limits': {'amount': {'min': 0.001, 'max': 10000}, 'price': {'min': 0.01, 'max': 1000000}, 'cost': {'min': 5, 'max': None}},
+        'info': {'symbol': base + quote, 'status': 'TRADING', 'filters': [{'filterType': 'PRICE_FILTER', 'tickSize': '0.01'}]},
+    }
+
+
+def markets(count, listings=0):
+    result = []
+    for i in range(count + listings):
+        base = 'C' + str(i)
+        result.append(market(base, 'USDT', 'spot'))
+        result.append(market(base, 'USDT', 'swap'))
+    return result
+
+
+def bench(method, reloads, count, listings):
+    exchange = ccxt.Exchange({'id': 'bench'})
+    getattr(exchange, method)(markets(count))
+    reloads = [markets(count, listings) for i in range(reloads)]
+    start = time.perf_counter()
+    for reload in reloads:
+        getattr(exchange, method)(reload)
+    return (time.perf_counter() - start) / len(reloads) * 1000
+
+
+for listings in (0, 5):
+    for method in ('set_markets', 'update_markets'):
+        print(f'{method:>14}, 3000 markets, {listings} listings: {bench(method, 10, 1500, listings):7.2f}ms')
+
+# output
+
+'''
+   set_markets, 3000 markets, 0 listings:  381.92ms
+update_markets, 3000 markets, 0 listings:    7.00ms
+   set_markets, 3000 markets, 5 listings:  448.62ms
+update_markets, 3000 markets, 5 listings:    8.64ms
+'''
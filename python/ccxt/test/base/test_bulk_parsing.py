@@ -0,0 +1,85 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import random  # noqa: E402
+import ccxt  # noqa: E402
+
+
+class Parser(ccxt.Exchange):
+    def parse_trade(self, trade, market=None):
+        market = self.safe_market(self.safe_string(trade, 's'), market)
+        return self.safe_trade({
+            'info': trade,
+            'id': self.safe_string(trade, 'i'),
+            'timestamp': self.safe_integer(trade, 't'),
+            'symbol': market['symbol'],
+            'price': self.safe_string(trade, 'p'),
+            'amount': self.safe_string(trade, 'a'),
+        }, market)
+
+    def parse_ohlcv(self, ohlcv, market=None):
+        return [self.safe_integer(ohlcv, 0), self.safe_number(ohlcv, 1), self.safe_number(ohlcv, 2), self.safe_number(ohlcv, 3), self.safe_number(ohlcv, 4), self.safe_number(ohlcv, 5)]
+
+    def parse_order(self, order, market=None):
+        market = self.safe_market(self.safe_string(order, 's'), market)
+        return self.safe_order({
+            'info': order,
+            'id': self.safe_string(order, 'id'),
+            'timestamp': self.safe_integer(order, 't'),
+            'symbol': market['symbol'],
+            'price': self.safe_string(order, 'p'),
+            'amount': self.safe_string(order, 'a'),
+        }, market)
+
+
+markets = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'spot': True, 'type': 'spot'},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'spot': True, 'type': 'spot'},
+]
+regular = Parser({'id': 'parser', 'markets': markets})
+bulk = Parser({'id': 'parser', 'markets': markets, 'bulkParsing': True})
+assert bulk.parse_trades == bulk.parse_trades_in_bulk and bulk.parseTrades == bulk.parse_trades_in_bulk
+assert regular.parse_trades.__func__ is ccxt.Exchange.parse_trades
+
+
+def arrange(items, order):
+    if order == 'reversed':
+        return list(reversed(items))
+    if order == 'shuffled':
+        items = list(items)
+        random.shuffle(items)
+    return items
+
+
+random.seed(1)
+for case in range(300):
+    count = random.randint(0, 20)
+    timestamps = sorted(random.choice([0] + list(range(1000, 1030))) for i in range(count))
+    trades = [{'i': str(random.randint(1, 9)) if random.random() < 0.9 else None, 't': t, 's': random.choice(['BTCUSDT', 'ETHUSDT']), 'p': '100', 'a': '2'} for t in timestamps]
+    # sort_by_2() cannot compare a missing timestamp of a trade with the others, the candles and the orders can have one
+    timestamps = [t if t or random.random() < 0.5 else None for t in timestamps]
+    ohlcvs = [[t, '1', '2', '0.5', '1.5', '10'] for t in timestamps]
+    orders = [{'id': str(i), 't': t, 's': random.choice(['BTCUSDT', 'ETHUSDT']), 'p': '100', 'a': '2'} for i, t in enumerate(timestamps)]
+    order = random.choice(['sorted', 'reversed', 'shuffled'])
+    market = random.choice([None, regular.markets['BTC/USDT']])
+    since = random.choice([None, None, 0, 1010, 1020])
+    limit = random.choice([None, 1, 5, 50])
+    params = random.choice([{}, {'extra': True}])
+    args = (market, since, limit, params)
+    trades, ohlcvs, orders = arrange(trades, order), arrange(ohlcvs, order), arrange(orders, order)
+    assert bulk.parse_trades(trades, *args) == regular.parse_trades(trades, *args), (case, 'trades')
+    assert bulk.parse_ohlcvs(ohlcvs, market, '1m', since, limit) == regular.parse_ohlcvs(ohlcvs, market, '1m', since, limit), (case, 'ohlcvs')
+    assert bulk.parse_orders(orders, *args) == regular.parse_orders(orders, *args), (case, 'orders')
+    by_id = {item.pop('id'): item for item in [dict(item) for item in orders]}
+    assert bulk.parse_orders(by_id, *args) == regular.parse_orders(by_id, *args), (case, 'orders by id')
+
+# strictly descending input is reversed, equal keys keep their order
+trades = [{'i': '1', 't': 1000, 's': 'BTCUSDT', 'p': '1', 'a': '1'}, {'i': '2', 't': 1000, 's': 'BTCUSDT', 'p': '2', 'a': '1'}]
+assert [trade['id'] for trade in bulk.parse_trades(trades)] == ['1', '2']
+assert [trade['id'] for trade in bulk.parse_trades(list(reversed(trades)))] == ['1', '2']
+assert ccxt.Exchange.sort_by_keys(['b', 'a', 'c'], [2, 1, 3]) == ['a', 'b', 'c']
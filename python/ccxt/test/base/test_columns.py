@@ -0,0 +1,98 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import math  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.columns import Columns, ohlcv_columns, trade_columns  # noqa: E402
+
+
+def candles(since, limit):
+    return [[since + i * 60000, 1, 2, 0.5, None if i == 1 else 1.5, 10] for i in range(limit)]
+
+
+def trades(since, limit):
+    return [{'id': str(i), 'timestamp': since + i, 'symbol': 'BTC/USDT', 'side': 'buy' if i % 2 else 'sell', 'price': 100.0 + i, 'amount': 1, 'cost': 100.0 + i} for i in range(limit)]
+
+
+class SyncExchange(ccxt.Exchange):
+    def describe(self):
+        return self.deep_extend(super(SyncExchange, self).describe(), {
+            'id': 'columns',
+            'resultsFormat': 'columns',
+            'timeframes': {'1m': '1m'},
+        })
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        paginate, params = self.handle_option_and_params(params, 'fetchOHLCV', 'paginate', False)
+        if paginate:
+            return self.fetch_paginated_call_deterministic('fetchOHLCV', symbol, since, limit, timeframe, params, 5)
+        # a page is a list of lists, pagination concatenates them
+        result = self.parse_ohlcvs(candles(since or 0, limit or 5), None, timeframe, since, limit)
+        assert isinstance(result, list)
+        return result
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return trades(since or 0, limit or 3)
+
+
+class AsyncExchange(ccxt.async_support.Exchange):
+    def describe(self):
+        return self.deep_extend(super(AsyncExchange, self).describe(), {
+            'id': 'columns',
+            'resultsFormat': 'columns',
+            'timeframes': {'1m': '1m'},
+        })
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        paginate, params = self.handle_option_and_params(params, 'fetchOHLCV', 'paginate', False)
+        if paginate:
+            return await self.fetch_paginated_call_deterministic('fetchOHLCV', symbol, since, limit, timeframe, params, 5)
+        await asyncio.sleep(0)
+        return self.parse_ohlcvs(candles(since or 0, limit or 5), None, timeframe, since, limit)
+
+
+exchange = SyncExchange()
+ohlcv = exchange.fetch_ohlcv('BTC/USDT', '1m', 60000, 3)
+assert isinstance(ohlcv, Columns) and len(ohlcv) == 3 and list(ohlcv) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+assert ohlcv['timestamp'].typecode == 'q' and list(ohlcv['timestamp']) == [60000, 120000, 180000]
+assert ohlcv['close'].typecode == 'd' and math.isnan(ohlcv['close'][1]) and ohlcv['close'][2] == 1.5
+assert exchange.fetchOHLCV('BTC/USDT', '1m', 60000, 2)['timestamp'].tolist() == [60000, 120000]
+# the pages are rows, the paginated result is converted once
+paged = exchange.fetch_ohlcv('BTC/USDT', '1m', 0, None, {'paginate': True, 'paginationCalls': 3})
+assert isinstance(paged, Columns) and len(paged) == 15 and list(paged['timestamp']) == sorted(paged['timestamp'])
+trades_columns = exchange.fetch_trades('BTC/USDT', 1000)
+assert list(trades_columns['side']) == [-1, 1, -1] and trades_columns['id'] == ['0', '1', '2'] and trades_columns['price'].tolist() == [100.0, 101.0, 102.0]
+assert trades_columns.rows()[1] == (1001, 101.0, 1.0, 101.0, 1, '1', 'BTC/USDT')
+# the default is rows
+assert isinstance(SyncExchange({'resultsFormat': 'rows'}).fetch_ohlcv('BTC/USDT', '1m', 0, 2), list)
+assert len(trade_columns([])) == 0 and len(ohlcv_columns([])) == 0
+
+try:
+    import numpy as np
+    arrays = ohlcv.arrays()
+    assert arrays['timestamp'].dtype == np.int64 and arrays['close'].dtype == np.float64 and np.isnan(arrays['close'][1])
+    # a view, not a copy
+    ohlcv['open'][0] = 7
+    assert arrays['open'][0] == 7
+    assert trades_columns.arrays()['id'].dtype == object
+except ImportError:
+    pass
+
+
+async def test_async():
+    exchange = AsyncExchange()
+    ohlcv = await exchange.fetch_ohlcv('BTC/USDT', '1m', 60000, 4)
+    assert isinstance(ohlcv, Columns) and len(ohlcv) == 4
+    paged = await exchange.fetchOHLCV('BTC/USDT', '1m', 0, None, {'paginate': True, 'paginationCalls': 2})
+    assert isinstance(paged, Columns) and len(paged) == 10
+    await exchange.close()
+
+
+asyncio.run(test_async())
@@ -0,0 +1,38 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.errors import InvalidOrder  # noqa: E402
+
+# the instances built from the cached describe() of their class do not share any state
+first = ccxt.binance()
+second = ccxt.binance({'apiKey': 'key', 'options': {'defaultType': 'future', 'custom': {'value': 1}}, 'timeout': 5000})
+third = ccxt.binance()
+assert second.apiKey == 'key' and second.timeout == 5000 and second.options['custom'] == {'value': 1}
+assert second.options['defaultType'] == 'future' and third.options['defaultType'] == first.options['defaultType'] == 'spot'
+assert 'custom' not in third.options
+assert third.options is not first.options and third.urls['api'] is not first.urls['api']
+third.options['warnOnFetchOpenOrdersWithoutSymbol'] = 'changed'
+third.urls['api']['public'] = 'changed'
+third.fees['trading']['maker'] = 'changed'
+assert ccxt.binance().options['warnOnFetchOpenOrdersWithoutSymbol'] is True
+assert ccxt.binance().urls['api']['public'] != 'changed' and ccxt.binance().fees['trading']['maker'] != 'changed'
+# the exception classes are kept as they are
+assert ccxt.binance().exceptions['exact']['-2010'] is InvalidOrder
+
+# camelcase aliases of the methods, the class attributes and the attributes of the config
+exchange = ccxt.kraken({'custom_value': 1})
+assert exchange.fetchOHLCV == exchange.fetch_ohlcv and exchange.loadMarkets == exchange.load_markets
+assert exchange.customValue == 1 and not hasattr(ccxt.kraken(), 'customValue')
+assert ccxt.kraken().substituteCommonCurrencyCodes is True
+assert exchange.deepExtend({'a': {'b': 1}}, {'a': {'c': 2}}) == {'a': {'b': 1, 'c': 2}}
+
+# deep_merge matches deep_extend
+target = {'a': {'b': 1, 'c': {'d': 2}}, 'e': [1], 'f': 1}
+source = {'a': {'c': {'g': 3}, 'h': None}, 'e': [2], 'f': {'i': 4}}
+assert ccxt.Exchange.deep_merge(ccxt.Exchange.deep_extend(target), ccxt.Exchange.deep_extend(source)) == ccxt.Exchange.deep_extend(target, source)
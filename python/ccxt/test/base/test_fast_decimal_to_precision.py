@@ -0,0 +1,81 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import decimal  # noqa: E402
+import random  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision, fast_decimal_to_precision, precision_formatter  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND, DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE, NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# the vectors of test_decimal_to_precision.py through the formatters
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_decimal_to_precision.py'), encoding='utf-8') as file:
+    source = file.read()
+source = source.replace('from ccxt.base.decimal_to_precision import decimal_to_precision ', 'from ccxt.base.decimal_to_precision import fast_decimal_to_precision as decimal_to_precision ')
+assert 'fast_decimal_to_precision as decimal_to_precision' in source
+exec(compile(source, 'test_decimal_to_precision.py', 'exec'), {'__file__': __file__})
+
+# the same results as decimal_to_precision() for random numbers, precisions and modes
+
+random.seed(0)
+
+
+def number():
+    kind = random.random()
+    if kind < 0.3:
+        return round(random.uniform(0, 10 ** random.randint(-6, 8)), random.randint(0, 12))
+    elif kind < 0.4:
+        return random.randint(0, 10 ** random.randint(0, 12))
+    elif kind < 0.5:
+        return random.choice(['0', '0.0', '-0', '-1.5', '1e-8', '1E5', '2.5e+3', '.5', '5.', '+5', '1.5e-30', '123456789012345678901234567890', -12.345])
+    integer = str(random.randint(0, 10 ** random.randint(0, 9)))
+    fraction = '5' * random.randint(1, 4) if random.random() < 0.2 else ''.join(random.choice('0123456789') for i in range(random.randint(0, 14)))
+    return integer + '.' + fraction if fraction else integer
+
+
+def result(method, *args):
+    # the string or the type of the error
+    try:
+        return method(*args)
+    except Exception as error:
+        return type(error)
+
+
+ticks = [0.01, 0.1, 1, 5, 10, 100, 0.5, 0.25, 0.00012, 1e-8, 0.00000012, '0.01', '0.005', '1e-8', decimal.Decimal('0.05'), 0.3, 25, 1100, 10.0, 0.015]
+for i in range(20000):
+    n = number()
+    if random.random() < 0.5:
+        counting_mode, precision = DECIMAL_PLACES, random.choice([0, 1, 2, 3, 4, 6, 8, 12, 20, 25, -1])
+    else:
+        counting_mode, precision = TICK_SIZE, random.choice(ticks)
+    rounding_mode = random.choice([ROUND, TRUNCATE])
+    padding_mode = random.choice([NO_PADDING, PAD_WITH_ZERO])
+    args = (n, rounding_mode, precision, counting_mode, padding_mode)
+    assert result(fast_decimal_to_precision, *args) == result(decimal_to_precision, *args), args
+
+# only the common cases are computed without decimal_to_precision()
+
+assert precision_formatter(8).places == 8
+assert precision_formatter(0.01, TICK_SIZE).places == 2
+assert precision_formatter(100, TICK_SIZE).places == 0
+assert precision_formatter(4, SIGNIFICANT_DIGITS).places is None
+assert precision_formatter(-2).places is None
+assert precision_formatter(0, TICK_SIZE).places is None
+
+# the formatters of the markets are built when the markets are loaded
+
+exchange = Exchange({'id': 'formatters', 'precisionMode': TICK_SIZE})
+precision_formatter.cache_clear()
+exchange.update_markets({
+    'BTC/USDT': {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'precision': {'price': 0.01, 'amount': 0.00001}},
+    'ETH/USDT': {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'spot': True, 'precision': {'price': 0.01, 'amount': 0.0001}},
+})
+assert precision_formatter.cache_info().currsize == 3
+assert exchange.price_to_precision('BTC/USDT', 27123.456) == '27123.46'
+assert exchange.amount_to_precision('ETH/USDT', '1.23456') == '1.2345'
+assert precision_formatter.cache_info().currsize == 3
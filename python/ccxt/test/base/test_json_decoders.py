@@ -0,0 +1,89 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import json  # noqa: E402
+import math  # noqa: E402
+from ccxt.base import json_decoders  # noqa: E402
+from ccxt.base.json_decoders import loads_json, loads_orjson, json_decoder  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# the responses of the static tests, as the exchanges send them
+
+fixtures = os.path.join(root, '..', 'ts', 'src', 'test', 'static', 'response')
+documents = []
+for name in sorted(os.listdir(fixtures)):
+    with open(os.path.join(fixtures, name), encoding='utf-8') as file:
+        for results in json.load(file)['methods'].values():
+            for result in results:
+                documents.append(json.dumps(result['httpResponse']))
+assert len(documents) > 100
+
+# numbers quoted with their text, for Precise
+
+assert loads_json('{"a":0.10,"b":1e-8,"c":42,"d":[-0.0]}', True) == {'a': '0.10', 'b': '1e-8', 'c': '42', 'd': ['-0.0']}
+assert loads_json(b'{"a":0.10}', True) == {'a': '0.10'}
+assert loads_json('{"a":0.10}') == {'a': 0.1}
+
+# the stdlib decoder is the default
+
+assert Exchange.jsonDecoder == 'json'
+assert json_decoder('json') is loads_json
+assert Exchange().json_loads is loads_json
+
+try:
+    json_decoder('simdjson')
+    assert False
+except NotSupported as e:
+    assert 'simdjson' in str(e)
+
+try:
+    Exchange({'jsonDecoder': 'yaml'})
+    assert False
+except NotSupported:
+    pass
+
+# orjson gives the same documents as json in both modes, from str and from bytes
+
+if json_decoders.import_orjson():
+    assert json_decoder('orjson') is loads_orjson
+    assert json_decoder('auto') is loads_orjson
+    for document in documents:
+        encoded = document.encode()
+        for quote_numbers in (False, True):
+            expected = loads_json(document, quote_numbers)
+            assert loads_orjson(document, quote_numbers) == expected
+            assert loads_orjson(encoded, quote_numbers) == expected
+
+    # what orjson rejects and json accepts, the integers beyond 64 bits are floats like in javascript
+    assert math.isnan(loads_orjson('{"a":NaN}')['a'])
+    assert loads_orjson('[18446744073709551615]') == [18446744073709551615]
+    assert loads_orjson('[1e400]') == [math.inf]
+    assert loads_orjson('[123456789012345678901234567890]') == [1.2345678901234568e+29]
+
+    # invalid documents raise the ValueError of json
+    for invalid in ('{"a":', b'{"a":1,}', '', b'\xff'):
+        try:
+            loads_orjson(invalid)
+            assert False
+        except ValueError:
+            pass
+
+    exchange = Exchange({'jsonDecoder': 'orjson'})
+    assert exchange.json_loads is loads_orjson
+    assert exchange.quoteJsonNumbers
+    assert exchange.on_json_response('{"price":"0.10","amount":1.50}') == {'price': '0.10', 'amount': '1.50'}
+    exchange.quoteJsonNumbers = False
+    assert exchange.on_json_response('{"price":"0.10","amount":1.50}') == {'price': '0.10', 'amount': 1.5}
+else:
+    assert json_decoder('auto') is loads_json
+    try:
+        json_decoder('orjson')
+        assert False
+    except NotSupported as e:
+        assert 'pip install orjson' in str(e)
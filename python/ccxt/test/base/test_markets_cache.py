@@ -0,0 +1,111 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import shutil  # noqa: E402
+import tempfile  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.markets_cache import read  # noqa: E402
+
+
+def markets(version):
+    return [
+        {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'spot': True, 'version': version},
+    ]
+
+
+class SyncExchange(ccxt.Exchange):
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(SyncExchange, self).describe(), {
+            'id': 'cached',
+        })
+
+    def fetch_markets(self, params={}):
+        SyncExchange.fetches += 1
+        return markets(SyncExchange.fetches)
+
+
+class AsyncExchange(ccxt.async_support.Exchange):
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(AsyncExchange, self).describe(), {
+            'id': 'cached',
+        })
+
+    async def fetch_markets(self, params={}):
+        AsyncExchange.fetches += 1
+        await asyncio.sleep(0.01)
+        return markets(AsyncExchange.fetches)
+
+
+def age(path, milliseconds):
+    with open(path) as file:
+        cached = json.load(file)
+    cached['timestamp'] -= milliseconds
+    with open(path, 'w') as file:
+        json.dump(cached, file)
+
+
+directory = tempfile.mkdtemp()
+
+# the first run fetches and writes the cache, the next ones start from the file
+SyncExchange({'marketsCache': directory}).load_markets()
+exchange = SyncExchange({'marketsCache': directory})
+exchange.load_markets()
+assert SyncExchange.fetches == 1 and exchange.markets['BTC/USDT']['version'] == 1 and exchange.markets_by_id['BTCUSDT'][0]['symbol'] == 'BTC/USDT'
+path = exchange.markets_cache_file()
+assert os.path.dirname(path) == directory and read(path, ccxt.__version__)[0][0]['id'] == 'BTCUSDT'
+# a reload always fetches and refreshes the file
+exchange.load_markets(True)
+assert SyncExchange.fetches == 2 and read(path, ccxt.__version__)[0][0]['version'] == 2
+# expired files are fetched again
+age(path, 2 * exchange.marketsCacheTTL)
+SyncExchange({'marketsCache': directory}).load_markets()
+assert SyncExchange.fetches == 3
+# files of another version of ccxt and other options are not used
+assert read(path, '0.0.0') is None
+other = SyncExchange({'marketsCache': directory, 'options': {'defaultType': 'swap'}})
+assert other.markets_cache_file() != path
+other.load_markets()
+assert SyncExchange.fetches == 4
+# the markets loaded with params are not cached
+SyncExchange({'marketsCache': directory}).load_markets(False, {'type': 'spot'})
+assert SyncExchange.fetches == 5
+# no cache by default
+SyncExchange().load_markets()
+SyncExchange().load_markets()
+assert SyncExchange.fetches == 7
+shutil.rmtree(directory)
+
+
+async def test_async():
+    directory = tempfile.mkdtemp()
+    first = AsyncExchange({'marketsCache': directory})
+    await first.load_markets()
+    second = AsyncExchange({'marketsCache': directory})
+    await second.load_markets()
+    assert AsyncExchange.fetches == 1 and second.markets['BTC/USDT']['version'] == 1
+    # the expired markets are returned at once and refreshed in the background
+    age(first.markets_cache_file(), 2 * first.marketsCacheTTL)
+    third = AsyncExchange({'marketsCache': directory})
+    await third.load_markets()
+    assert third.markets['BTC/USDT']['version'] == 1 and third.markets_refreshing is not None
+    await asyncio.sleep(0.05)
+    assert AsyncExchange.fetches == 2 and third.markets['BTC/USDT']['version'] == 2 and third.markets_refreshing is None
+    assert read(third.markets_cache_file(), ccxt.__version__)[0][0]['version'] == 2
+    for instance in (first, second, third):
+        await instance.close()
+    shutil.rmtree(directory)
+
+
+asyncio.run(test_async())
@@ -0,0 +1,44 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import itertools  # noqa: E402
+from ccxt.base.precise import Precise  # noqa: E402
+
+# the string_* methods skip the Precise objects, they give the same results as the methods of the objects
+
+strings = ['0', '-0', '0.000', '1', '-1', '10', '100.00', '0.1', '-0.10', '0.00000001', '1e-8', '1E5', '-2.50e-3', '1.5e3', '123.456', '-98765.4321', '3', '7']
+
+for a, b in itertools.product(strings, repeat=2):
+    x, y = Precise(a), Precise(b)
+    assert Precise.string_mul(a, b) == str(x.mul(y))
+    assert Precise.string_add(a, b) == str(Precise(a).add(Precise(b)))
+    assert Precise.string_sub(a, b) == str(Precise(a).sub(Precise(b)))
+    assert Precise.string_min(a, b) == str(Precise(a).min(Precise(b)))
+    assert Precise.string_max(a, b) == str(Precise(a).max(Precise(b)))
+    assert Precise.string_gt(a, b) == Precise(a).gt(Precise(b))
+    assert Precise.string_ge(a, b) == Precise(a).ge(Precise(b))
+    assert Precise.string_lt(a, b) == Precise(a).lt(Precise(b))
+    assert Precise.string_le(a, b) == Precise(a).le(Precise(b))
+    assert Precise.string_equals(a, b) == Precise(a).equals(Precise(b))
+    if Precise(b).integer != 0:
+        assert Precise.string_div(a, b) == str(Precise(a).div(Precise(b)))
+        assert Precise.string_div(a, b, 2) == str(Precise(a).div(Precise(b), 2))
+    for c in strings + [None]:
+        assert Precise.string_mul_add(a, b, c) == Precise.string_add(Precise.string_mul(a, b), c)
+
+for a in strings:
+    assert Precise.string_abs(a) == str(Precise(a).abs())
+    assert Precise.string_neg(a) == str(Precise(a).neg())
+    assert Precise.string_mul(a, None) is None
+    assert Precise.string_add(a, None) == a
+    assert Precise.string_mul_add(a, None, '1') == '1'
+
+assert Precise.string_div('1', '0') is None
+assert Precise.string_div('-1', '3', 2) == '-0.33'
+assert Precise.string_mul_add('1.5', '2', '0.25') == '3.25'
+assert Precise.string_mul_add('2.5', '4', None) == '10'
@@ -0,0 +1,164 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import time  # noqa: E402
+from aiohttp import web  # noqa: E402
+import ccxt.async_support as ccxt  # noqa: E402
+from ccxt.async_support.base.rate_limiter import RateLimiter, parse_binance_headers, parse_ratelimit_headers, parse_retry_after  # noqa: E402
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+# a local stand-in for the exchanges, each route answers with the next queued response
+
+delta = 15
+responses = {}
+
+
+def milliseconds():
+    return int(time.time() * 1000)
+
+
+async def handler(request):
+    status, headers, body = responses[request.path].pop(0)
+    return web.Response(status=status, headers=headers, text=json.dumps(body), content_type='application/json')
+
+
+async def timed(coroutine):
+    start = time.perf_counter_ns()
+    result = await coroutine
+    return result, (time.perf_counter_ns() - start) / 1000000
+
+
+async def main():
+    app = web.Application()
+    app.router.add_get('/{path:.*}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = 'http://127.0.0.1:' + str(runner.addresses[0][1])
+
+    binance = ccxt.binance({'rateLimit': 10})
+    binance.urls['api']['public'] = url + '/binance'
+    bybit = ccxt.bybit({'rateLimit': 10})
+    bybit.urls['api']['public'] = url + '/bybit'
+    okx = ccxt.okx({'rateLimit': 10})
+    okx.urls['api']['rest'] = url + '/okx'
+
+    try:
+        # binance, the used weight is far from the limit, nothing changes
+        responses['/binance/time'] = [
+            (200, {'X-MBX-USED-WEIGHT-1M': '10'}, {'serverTime': 1}),
+            (200, {'X-MBX-USED-WEIGHT-1M': '5990'}, {'serverTime': 2}),
+        ]
+        assert await binance.fetch_time() == 1
+        assert binance.throttle.status()['default']['tokens'] > -1
+        # close to 6000 the bucket waits for the start of the next minute
+        assert await binance.fetch_time() == 2
+        reset = 60000 - milliseconds() % 60000
+        tokens = binance.throttle.status()['default']['tokens']
+        assert abs(tokens + reset / 10) < delta / 10, tokens
+
+        # bybit reports the remaining quota and the timestamp of the reset
+        responses['/bybit/v5/market/time'] = [
+            (200, {'X-Bapi-Limit': '10', 'X-Bapi-Limit-Status': '0', 'X-Bapi-Limit-Reset-Timestamp': str(milliseconds() + 200)}, {'retCode': 0, 'retMsg': 'OK', 'result': {}, 'time': 1}),
+            (200, {'X-Bapi-Limit': '10', 'X-Bapi-Limit-Status': '9'}, {'retCode': 0, 'retMsg': 'OK', 'result': {}, 'time': 2}),
+        ]
+        result, first = await timed(bybit.fetch_time())
+        assert result == 1
+        result, elapsed = await timed(bybit.fetch_time())
+        assert result == 2
+        # the reset timestamp was set before the first request was sent
+        expected = 200 - first
+        print(f'bybit paused for {elapsed}ms expected ~{expected}ms')
+        assert abs(elapsed - expected) < 2 * delta
+
+        # okx answers 429 with a Retry-After header, the next request waits for it
+        okx.throttle.backoff_delay = 100
+        responses['/okx/api/v5/public/time'] = [
+            (429, {'Retry-After': '0.3'}, {'code': '50011', 'msg': 'Too Many Requests', 'data': []}),
+            (429, {}, {'code': '50011', 'msg': 'Too Many Requests', 'data': []}),
+            (429, {}, {'code': '50011', 'msg': 'Too Many Requests', 'data': []}),
+            (200, {}, {'code': '0', 'msg': '', 'data': [{'ts': '1'}]}),
+        ]
+        try:
+            await okx.fetch_time()
+            assert False
+        except ccxt.RateLimitExceeded:
+            pass
+        # without Retry-After the delay doubles on every consecutive rejection
+        for expected in (300, 200):
+            start = time.perf_counter_ns()
+            try:
+                await okx.fetch_time()
+                assert False
+            except ccxt.RateLimitExceeded:
+                elapsed = (time.perf_counter_ns() - start) / 1000000
+            print(f'okx backed off for {elapsed}ms expected ~{expected}ms')
+            assert abs(elapsed - expected) < 2 * delta
+        result, elapsed = await timed(okx.fetch_time())
+        assert result == 1
+        print(f'okx backed off for {elapsed}ms expected ~400ms')
+        assert abs(elapsed - 400) < 2 * delta
+        assert okx.throttle.backoff_streak == 0
+
+        # a malformed header is ignored, the response is returned
+        binance.throttle.default.config['tokens'] = 0
+        responses['/binance/time'] = [
+            (200, {'X-MBX-USED-WEIGHT-1M': ''}, {'serverTime': 3}),
+            (200, {'X-MBX-USED-WEIGHT-1M': 'n/a'}, {'serverTime': 4}),
+        ]
+        assert await binance.fetch_time() == 3
+        assert await binance.fetch_time() == 4
+        assert binance.throttle.status()['default']['tokens'] > -1
+        responses['/okx/api/v5/public/time'] = [(200, {'X-RateLimit-Limit': '20', 'X-RateLimit-Remaining': 'none'}, {'code': '0', 'msg': '', 'data': [{'ts': '5'}]})]
+        assert await okx.fetch_time() == 5
+
+        # with adaptiveRateLimit off the headers are ignored
+        binance.adaptiveRateLimit = False
+        binance.throttle.default.config['tokens'] = 0
+        responses['/binance/time'] = [(200, {'X-MBX-USED-WEIGHT-1M': '6000'}, {'serverTime': 6})]
+        assert await binance.fetch_time() == 6
+        assert binance.throttle.status()['default']['tokens'] > -1
+    finally:
+        await binance.close()
+        await bybit.close()
+        await okx.close()
+        await runner.cleanup()
+
+    # the bucket is resynced to the reported usage, it releases at most what is left of the quota before the reset
+    for scheduler in ('looper', 'timer'):
+        limiter = RateLimiter({'default': Throttler({'refillRate': 0.1, 'scheduler': scheduler})})
+        tokens = limiter.default.config['tokens']
+        # half of the window is left for a sixth of the quota
+        limiter.feedback([{'bucket': 'default', 'used': 5000, 'limit': 6000, 'reset': 30000, 'window': 60000}])
+        assert abs(limiter.default.config['tokens'] + 2000) < 1, limiter.default.config['tokens']
+        # the tokens are never raised by a lower usage
+        limiter.default.config['tokens'] = tokens
+        limiter.feedback([{'bucket': 'default', 'used': 1000, 'limit': 6000, 'reset': 30000, 'window': 60000}])
+        assert abs(limiter.default.config['tokens'] - tokens) <= 1
+        # without a window only an exhausted quota pauses the bucket
+        limiter.feedback([{'bucket': 'default', 'used': 5000, 'limit': 6000, 'reset': 30000}])
+        assert abs(limiter.default.config['tokens'] - tokens) <= 1
+        limiter.feedback([{'bucket': 'default', 'used': 5990, 'limit': 6000, 'reset': 30000}])
+        assert abs(limiter.default.config['tokens'] + 3000) < 1
+
+    # parsers
+    assert parse_binance_headers(binance, {'x-mbx-used-weight': '5', 'x-mbx-uuid': 'a'}) == []
+    orders = parse_binance_headers(binance, {'x-mbx-order-count-10s': '99'})
+    assert orders[0]['bucket'] == 'orders' and orders[0]['limit'] == 100 and orders[0]['reset'] <= 10000 and orders[0]['window'] == 10000
+    assert parse_ratelimit_headers(okx, {'ratelimit-limit': '100, 100;w=10', 'ratelimit-remaining': '1', 'ratelimit-reset': '3'}) == [{'bucket': 'default', 'used': 99, 'limit': 100, 'reset': 3000, 'window': 10000}]
+    assert parse_ratelimit_headers(okx, {'x-ratelimit-limit': '20', 'x-ratelimit-remaining': '5'}) == [{'bucket': 'default', 'used': 15, 'limit': 20, 'reset': 0}]
+    assert binance.parse_rate_limit_headers({'X-MBX-USED-WEIGHT-1M': ''}) == []
+    assert parse_retry_after({'retry-after': '2'}) == 2000
+    assert parse_retry_after({'retry-after': 'Wed, 21 Oct 2015 07:28:00 GMT'}) == 0
+    assert parse_retry_after({'retry-after': 'soon'}) is None
+
+
+asyncio.run(main())
@@ -0,0 +1,80 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import time  # noqa: E402
+import ccxt.async_support as ccxt  # noqa: E402
+from ccxt.async_support.base.rate_limiter import registry  # noqa: E402
+
+
+delta = 10
+
+config = {
+    'rateLimit': 20,
+    'rateLimitScope': 'ip-1',
+    'rateLimitBuckets': {
+        'orders': {
+            'refillRate': 1 / 100,
+            'endpoints': {
+                'private': {
+                    'post': {
+                        'order': 1,
+                    },
+                    'delete': {
+                        'order': {'cost': 1},
+                    },
+                },
+            },
+        },
+    },
+}
+
+
+async def timed(*requests):
+    start = time.perf_counter_ns()
+    for throttle, args in requests:
+        await throttle(*args)
+    return (time.perf_counter_ns() - start) / 1000000
+
+
+async def main():
+    spot = ccxt.binance(config)
+    subaccount = ccxt.binance(config)
+    other_scope = ccxt.binance(ccxt.Exchange.extend(config, {'rateLimitScope': 'ip-2'}))
+    private = ccxt.binance({'rateLimit': 20})
+
+    # instances with the same id and scope share their buckets
+    assert spot.throttle.buckets['default'] is subaccount.throttle.buckets['default']
+    assert spot.throttle.buckets['orders'] is subaccount.throttle.buckets['orders']
+    assert spot.throttle.buckets['default'] is not other_scope.throttle.buckets['default']
+    # without a scope the instance keeps its own bucket as before
+    assert 'orders' not in private.throttle.buckets
+    assert private.throttle.config['refillRate'] == 1 / 20
+
+    # 10 requests alternating between two instances wait for a single shared bucket
+    public = [(spot.throttle, (1, 'public', 'GET', 'ticker')), (subaccount.throttle, (1, 'public', 'GET', 'ticker'))] * 5
+    elapsed = await timed(*public)
+    expected = 9 * 20
+    print(f'shared bucket: {elapsed}ms expected {expected}ms')
+    assert abs(elapsed - expected) < delta
+
+    # an order charges the default bucket and the orders bucket at the same time
+    # the first one waits for the default bucket, the other ones for the orders bucket
+    orders = [(spot.throttle, (1, 'private', 'POST', 'order')), (subaccount.throttle, (1, 'private', 'DELETE', 'order'))] * 2
+    elapsed = await timed(*orders)
+    expected = 20 + 3 * 100
+    print(f'orders bucket: {elapsed}ms expected {expected}ms')
+    assert abs(elapsed - expected) < delta
+
+    status = registry.status('binance', 'ip-1')
+    assert sorted(bucket['bucket'] for bucket in status) == ['default', 'orders']
+    assert all(bucket['queued'] == 0 for bucket in status)
+    assert set(spot.throttle.status().keys()) == {'default', 'orders'}
+
+
+asyncio.run(main())
@@ -0,0 +1,61 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import collections  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# plain dicts take the dict.get() path, an OrderedDict goes through key_exists(), both give the same results
+
+values = {
+    'string': 'abc',
+    'empty': '',
+    'none': None,
+    'zero': 0,
+    'false': False,
+    'integer': 123,
+    'float': 1.5,
+    'numeric': '100.0',
+    'exponent': '1e-8',
+    'invalid': 'x1',
+    'list': [1, 2],
+    'dict': {'a': 1},
+    1: 'one',
+}
+keys = list(values.keys()) + ['missing', 2]
+
+
+def outcome(method, *args):
+    try:
+        return method(*args)
+    except Exception as e:
+        return type(e)
+
+
+def check(method, *args):
+    fast = outcome(method, values, *args)
+    slow = outcome(method, collections.OrderedDict(values), *args)
+    assert fast == slow and type(fast) is type(slow), (method.__name__, args, fast, slow)
+
+
+for key in keys:
+    for method in (Exchange.key_exists, Exchange.safe_float, Exchange.safe_string, Exchange.safe_integer, Exchange.safe_value, Exchange.safe_timestamp):
+        check(method, key)
+        check(method, key, 'default')
+    check(Exchange.safe_integer_product, key, 10)
+    for other in keys:
+        for method in (Exchange.safe_string_2, Exchange.safe_value_2):
+            check(method, key, other)
+            check(method, key, other, 'default')
+        check(Exchange.safe_value_n, [key, other])
+        check(Exchange.safe_string_n, [key, other], 'default')
+
+assert Exchange.safe_string(values, 'empty', 'default') == 'default'
+assert Exchange.safe_integer(values, 'numeric') == 100
+assert Exchange.safe_value(values, 'false') is False
+assert Exchange.safe_string_2(values, 'none', 'integer') == '123'
+assert Exchange.safe_value_n(values, ['missing', 'empty', 'dict']) == {'a': 1}
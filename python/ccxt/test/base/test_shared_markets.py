@@ -0,0 +1,106 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import gc  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.shared_markets import registry  # noqa: E402
+
+
+def markets(version):
+    return [
+        {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'spot': True, 'version': version},
+        {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'spot': True, 'version': version},
+    ]
+
+
+class SyncExchange(ccxt.Exchange):
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(SyncExchange, self).describe(), {
+            'id': 'shared',
+            'sharedMarkets': True,
+            'options': {'defaultType': 'spot'},
+        })
+
+    def fetch_markets(self, params={}):
+        SyncExchange.fetches += 1
+        return markets(SyncExchange.fetches)
+
+
+class AsyncExchange(ccxt.async_support.Exchange):
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(AsyncExchange, self).describe(), {
+            'id': 'shared',
+            'sharedMarkets': True,
+        })
+
+    async def fetch_markets(self, params={}):
+        AsyncExchange.fetches += 1
+        await asyncio.sleep(0.01)
+        return markets(AsyncExchange.fetches)
+
+
+# the markets are fetched once and the instances hold the same objects
+first = SyncExchange({'apiKey': 'a'})
+second = SyncExchange({'apiKey': 'b'})
+first.load_markets()
+second.load_markets()
+assert SyncExchange.fetches == 1
+assert first.markets is second.markets and first.currencies is second.currencies and first.symbols == ['BTC/USDT', 'ETH/USDT']
+# a reload by one instance refreshes all of them
+second.load_markets(True)
+assert SyncExchange.fetches == 2 and first.markets is second.markets and first.markets['BTC/USDT']['version'] == 2
+# other options are another entry
+other = SyncExchange({'options': {'defaultType': 'swap'}})
+other.load_markets()
+assert SyncExchange.fetches == 3 and other.markets is not first.markets
+# the objects in the options are not part of the key, equal configurations share
+assert registry.key(SyncExchange({'options': {'nested': [object(), 1]}})) == registry.key(SyncExchange({'options': {'nested': [object(), 1]}}))
+with_callable = SyncExchange({'options': {'defaultType': 'swap', 'hook': lambda: None}})
+assert registry.key(with_callable) == registry.key(other)
+with_callable.load_markets()
+assert SyncExchange.fetches == 3 and with_callable.markets is other.markets
+mixed_keys = SyncExchange({'options': {'defaultType': 'swap', 1: 'one', '1': 'one'}})
+assert registry.key(mixed_keys) == registry.key(SyncExchange({'options': {'defaultType': 'swap', 1: 'one', '1': 'one'}}))
+# instances with and without credentials do not share, the currencies can depend on them
+keyless = SyncExchange()
+assert registry.key(keyless) != registry.key(SyncExchange({'apiKey': 'a'}))
+keyless.load_markets()
+assert SyncExchange.fetches == 4 and keyless.markets is not first.markets
+# instances without sharedMarkets load their own
+SyncExchange({'sharedMarkets': False}).load_markets()
+assert SyncExchange.fetches == 5
+# the entries do not keep the instances alive
+entry = first.shared_markets_entry()
+del first, second
+gc.collect()
+assert len(entry.instances) == 0
+registry.clear()
+
+
+async def test_async():
+    instances = [AsyncExchange({'apiKey': str(i)}) for i in range(5)]
+    await asyncio.gather(*[instance.load_markets() for instance in instances])
+    assert AsyncExchange.fetches == 1
+    assert all(instance.markets is instances[0].markets for instance in instances)
+    await asyncio.gather(instances[1].load_markets(True), instances[2].load_markets(True))
+    assert AsyncExchange.fetches == 2 and instances[0].markets['ETH/USDT']['version'] == 2
+    late = AsyncExchange({'apiKey': 'late'})
+    await late.load_markets()
+    assert AsyncExchange.fetches == 2 and late.markets is instances[0].markets
+    for instance in instances + [late]:
+        await instance.close()
+    registry.clear()
+
+
+asyncio.run(test_async())
@@ -90,10 +90,11 @@ for i, case in enumerate(test_cases, 1):
     case['expected'] = remaining * case['cost'] / case['refillRate']
 
 
-async def schedule(case):
+async def schedule(case, scheduler):
     throttle = Throttle({
         'tokens': case['tokens'],
         'refillRate': case['refillRate'],
+        'scheduler': scheduler,
     })
     start = time.perf_counter_ns()
     for i in range(case['runs']):
@@ -101,12 +102,12 @@ async def schedule(case):
     end = time.perf_counter_ns()
     elapsed_ms = (end - start) / 1000000
     result = abs(case['expected'] - elapsed_ms) < delta
-    print(f'case {case["number"]} {"succeeded" if result else "failed"} in {elapsed_ms}ms expected {case["expected"]}ms')
+    print(f'{scheduler} case {case["number"]} {"succeeded" if result else "failed"} in {elapsed_ms}ms expected {case["expected"]}ms')
     assert result
 
 
 async def main():
-    await asyncio.wait([schedule(case) for case in test_cases], return_when=asyncio.ALL_COMPLETED)
+    await asyncio.gather(*[schedule(case, scheduler) for case in test_cases for scheduler in ('looper', 'timer')])
 
 
 asyncio.run(main())
@@ -0,0 +1,119 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt.async_support as ccxt  # noqa: E402
+from ccxt.async_support.base.throttler import Throttler as Throttle  # noqa: E402
+
+
+async def served(throttle, requests):
+    # enqueues all requests at once and returns their names in the order they are released
+    order = []
+
+    async def request(name, priority):
+        await throttle(1, priority)
+        order.append(name)
+
+    await asyncio.gather(*[request(name, priority) for name, priority in requests])
+    return order
+
+
+async def test_priorities(scheduler):
+    throttle = Throttle({'refillRate': 1 / 5, 'scheduler': scheduler})
+    requests = [('backfill' + str(i), 'backfill') for i in range(5)] + [('market', None), ('account', 'account'), ('trading', 'trading')]
+    order = await served(throttle, requests)
+    # all requests are queued before the first one is released, the backfill ones wait behind the higher lanes
+    assert order == ['trading', 'account', 'market', 'backfill0', 'backfill1', 'backfill2', 'backfill3', 'backfill4'], order
+    lanes = throttle.status()['lanes']
+    assert lanes['backfill'] == {'served': 5, 'promoted': 0, 'peak': 5, 'queued': 0}
+    assert lanes['trading']['served'] == 1
+
+
+async def test_starvation(scheduler):
+    # a backfill request that waited past starvationDelay goes ahead of the trading requests
+    throttle = Throttle({'refillRate': 1 / 10, 'starvationDelay': 35, 'scheduler': scheduler})
+    requests = [('trading' + str(i), 'trading') for i in range(3)] + [('backfill', 'backfill')] + [('trading' + str(i), 'trading') for i in range(3, 8)]
+    order = await served(throttle, requests)
+    assert order.index('backfill') < 6, order
+    assert throttle.status()['lanes']['backfill']['promoted'] == 1
+
+
+async def test_max_capacity():
+    throttle = Throttle({'refillRate': 1 / 10, 'maxCapacity': {'backfill': 2}})
+    futures = [throttle(1, 'backfill') for i in range(3)]
+    try:
+        throttle(1, 'backfill')
+        assert False
+    except RuntimeError as e:
+        assert 'backfill lane' in str(e)
+    # the other lanes keep the default capacity
+    futures.append(throttle(1, 'trading'))
+    try:
+        throttle(1, 'urgent')
+        assert False
+    except ValueError:
+        pass
+    await asyncio.gather(*futures)
+
+
+async def test_exchange():
+    exchange = ccxt.binance({'rateLimit': 1})
+    urls = []
+
+    async def fetch(url, method='GET', headers=None, body=None):
+        urls.append(url)
+        return {}
+
+    exchange.fetch = fetch
+    lanes = exchange.throttle.buckets['default'].metrics
+    # rateLimitPriority is taken out of the params
+    await exchange.public_get_time({'rateLimitPriority': 'trading', 'foo': 'bar'})
+    assert 'rateLimitPriority' not in urls[-1] and 'foo=bar' in urls[-1]
+    assert lanes['trading']['served'] == 1
+    # a public endpoint defaults to market data
+    await exchange.public_get_time()
+    assert lanes['market']['served'] == 1
+    # pagination runs in the backfill lane
+    await exchange.with_rate_limit_priority(exchange.public_get_time, 'backfill')()
+    assert lanes['backfill']['served'] == 1
+    await exchange.close()
+
+    # the lane follows whether sign() authenticated the endpoint, not its api name
+    exchange = ccxt.binance({'rateLimit': 1, 'apiKey': 'key', 'secret': 'secret'})
+    exchange.fetch = fetch
+    lanes = exchange.throttle.buckets['default'].metrics
+    await exchange.sapi_get_asset_transfer({'type': 'MAIN_UMFUTURE'})
+    assert lanes['market']['served'] == 1
+    await exchange.sapi_get_asset_transfer({'type': 'MAIN_UMFUTURE'})
+    assert lanes['account']['served'] == 1
+    await exchange.sapi_get_system_status()
+    await exchange.sapi_get_system_status()
+    assert lanes['market']['served'] == 3 and lanes['account']['served'] == 1
+    await exchange.fapiprivate_post_order({'symbol': 'BTCUSDT'})
+    assert lanes['trading']['served'] == 1
+    await exchange.close()
+
+
+async def test_queue():
+    # the queue of the default lane is still exposed as before the lanes
+    throttle = Throttle({'refillRate': 1 / 10})
+    futures = [throttle(1), throttle(1, 'trading')]
+    assert throttle.queue is throttle.queues['market'] and len(throttle.queue) == 1
+    await asyncio.gather(*futures)
+
+
+async def main():
+    for scheduler in ('looper', 'timer'):
+        await test_priorities(scheduler)
+        await test_starvation(scheduler)
+    await test_max_capacity()
+    await test_queue()
+    await test_exchange()
+
+
+asyncio.run(main())
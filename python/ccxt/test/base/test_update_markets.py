@@ -0,0 +1,124 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import copy  # noqa: E402
+import ccxt  # noqa: E402
+
+
+def market(base, quote, type='spot', **extra):
+    spot = type == 'spot'
+    result = {
+        'id': base + quote,
+        'symbol': base + '/' + quote + ('' if spot else ':' + quote),
+        'base': base,
+        'quote': quote,
+        'settle': None if spot else quote,
+        'baseId': base.lower(),
+        'quoteId': quote.lower(),
+        'type': type,
+        'spot': spot,
+        'swap': not spot,
+        'linear': None if spot else True,
+        'inverse': None if spot else False,
+        'precision': {'amount': 0.001, 'price': 0.01},
+    }
+    result.update(extra)
+    return result
+
+
+fields = ('markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies')
+
+
+def rebuilt(exchange, markets, currencies=None):
+    # the same loads through set_markets() only
+    fresh = ccxt.Exchange({'id': 'fresh', 'precisionMode': exchange.precisionMode})
+    fresh.set_markets(copy.deepcopy(markets), copy.deepcopy(currencies))
+    return fresh
+
+
+def assert_same(exchange, fresh):
+    for field in fields:
+        assert getattr(exchange, field) == getattr(fresh, field), field
+
+
+first = [market('BTC', 'USDT'), market('ETH', 'USDT'), market('BTC', 'USDT', 'swap'), market('XRP', 'BTC')]
+exchange = ccxt.Exchange({'id': 'incremental', 'precisionMode': ccxt.TICK_SIZE})
+history = [first]
+changes = exchange.update_markets(copy.deepcopy(first))
+assert changes['added'] == ['BTC/USDT', 'BTC/USDT:USDT', 'ETH/USDT', 'XRP/BTC'] and changes['removed'] == [] and 'BTC' in changes['currencies']
+assert_same(exchange, rebuilt(exchange, first))
+
+# nothing changed, the structures are kept
+btc = exchange.markets['BTC/USDT']
+currencies = exchange.currencies
+changes = exchange.update_markets(copy.deepcopy(first))
+assert changes == {'added': [], 'removed': [], 'changed': [], 'currencies': []}
+assert exchange.markets['BTC/USDT'] is btc and exchange.currencies is currencies
+
+# a listing, a delisting and a change of precision
+second = [market('BTC', 'USDT'), market('BTC', 'USDT', 'swap', precision={'amount': 0.0001, 'price': 0.1}), market('XRP', 'BTC'), market('SOL', 'USDT')]
+markets = exchange.markets
+changes = exchange.update_markets(copy.deepcopy(second))
+assert changes['added'] == ['SOL/USDT'] and changes['removed'] == ['ETH/USDT'] and changes['changed'] == ['BTC/USDT:USDT']
+assert changes['currencies'] == ['BTC', 'SOL']
+assert exchange.markets is markets and exchange.markets['BTC/USDT'] is btc
+assert exchange.markets_by_id['BTCUSDT'][0]['spot'] and exchange.markets_by_id['BTCUSDT'][1]['precision']['amount'] == 0.0001
+assert exchange.markets_changes is changes
+# set_markets() keeps the currencies of the removed markets, so does update_markets()
+fresh = rebuilt(exchange, first)
+fresh.set_markets(copy.deepcopy(second))
+assert_same(exchange, fresh)
+assert 'ETH' in exchange.currencies and 'ETH' not in exchange.baseCurrencies
+
+# fetched currencies
+currencies = {
+    'BTC': {'id': 'btc', 'code': 'BTC', 'precision': 0.00001, 'networks': {'BTC': {'fee': 0.0001}}},
+    'USDT': {'id': 'usdt', 'code': 'USDT', 'precision': 0.01, 'networks': {}},
+}
+exchange = ccxt.Exchange({'id': 'incremental'})
+exchange.update_markets(copy.deepcopy(first), copy.deepcopy(currencies))
+usdt = exchange.currencies['USDT']
+updated = copy.deepcopy(currencies)
+updated['BTC']['networks']['BTC']['fee'] = 0.0002
+updated['SOL'] = {'id': 'sol', 'code': 'SOL', 'precision': 0.001, 'networks': {}}
+changes = exchange.update_markets(copy.deepcopy(second), copy.deepcopy(updated))
+assert changes['currencies'] == ['BTC', 'SOL'] and exchange.currencies['USDT'] is usdt
+assert exchange.currencies['BTC']['networks']['BTC']['fee'] == 0.0002 and exchange.currencies_by_id['sol']['code'] == 'SOL'
+fresh = rebuilt(exchange, first, currencies)
+fresh.set_markets(copy.deepcopy(second), copy.deepcopy(updated))
+assert_same(exchange, fresh)
+
+# after set_markets() the next load is a full one, the changes are those to the markets set_markets() installed
+exchange.set_markets(copy.deepcopy(first), copy.deepcopy(currencies))
+changes = exchange.update_markets(copy.deepcopy(second), copy.deepcopy(updated))
+assert changes['added'] == ['SOL/USDT'] and changes['removed'] == ['ETH/USDT'] and changes['changed'] == ['BTC/USDT:USDT']
+fresh = rebuilt(exchange, first, currencies)
+fresh.set_markets(copy.deepcopy(second), copy.deepcopy(updated))
+assert_same(exchange, fresh)
+
+# a direct set_markets() of the same markets is no change
+exchange.set_markets(copy.deepcopy(second), copy.deepcopy(updated))
+changes = exchange.update_markets(copy.deepcopy(second), copy.deepcopy(updated))
+assert changes['added'] == [] and changes['removed'] == [] and changes['changed'] == []
+
+# shared markets are patched in copies, the other instances keep the previous objects until they are stored
+exchange = ccxt.Exchange({'id': 'incremental', 'precisionMode': ccxt.TICK_SIZE})
+exchange._shared_markets = True
+exchange.update_markets(copy.deepcopy(first))
+previous = {field: getattr(exchange, field) for field in fields}
+snapshot = copy.deepcopy(previous)
+changes = exchange.update_markets(copy.deepcopy(second))
+assert changes['added'] == ['SOL/USDT'] and changes['removed'] == ['ETH/USDT']
+for field in fields:
+    assert previous[field] == snapshot[field], field
+assert exchange.markets is not previous['markets'] and exchange.markets_by_id is not previous['markets_by_id']
+assert exchange.currencies is not previous['currencies'] and exchange.baseCurrencies is not previous['baseCurrencies']
+assert exchange.markets['BTC/USDT'] is previous['markets']['BTC/USDT']
+fresh = rebuilt(exchange, first)
+fresh.set_markets(copy.deepcopy(second))
+assert_same(exchange, fresh)
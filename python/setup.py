@@ -99,6 +99,9 @@ setup(
         'type': [
             'mypy==1.6.1',
         ],
+        'numpy': [
+            'numpy>=1.20',
+        ],
     },
     project_urls=project_urls,
 )
@@ -141,6 +141,7 @@ import { Precise } from './Precise.js'
 import WsClient from './ws/WsClient.js';
 import { Future } from './ws/Future.js';
 import { OrderBook as WsOrderBook, IndexedOrderBook, CountedOrderBook } from './ws/OrderBook.js';
+import { MessageRouter } from './ws/MessageRouter.js';
 
 // ----------------------------------------------------------------------------
 //
@@ -355,6 +356,7 @@ export default class Exchange {
 
     // WS/PRO options
     clients: Dictionary<WsClient> = {}
+    messageRouters: Dictionary<MessageRouter> = undefined
     newUpdates: boolean = true
     streaming = {}
 
@@ -915,7 +917,7 @@ export default class Exchange {
         this.throttler = new Throttler (this.tokenBucket);
     }
 
-    throttle (cost = undefined) {
+    throttle (cost = undefined, api = undefined, method = undefined, path = undefined, config = {}) {
         return this.throttler.throttle (cost)
     }
 
@@ -1390,6 +1392,28 @@ export default class Exchange {
         return new CountedOrderBook (snapshot, depth);
     }
 
+    ohlcvCache (limit = undefined) {
+        return new ArrayCacheByTimestamp (limit);
+    }
+
+    messageRoutes () {
+        // the tables of routes to the handlers of the messages, see MessageRouter, overridden by the exchanges
+        return {};
+    }
+
+    findMessageHandler (table, route) {
+        // the routers are built on the first message
+        if (this.messageRouters === undefined) {
+            this.messageRouters = {};
+            const routes = this.messageRoutes ();
+            const names = Object.keys (routes);
+            for (let i = 0; i < names.length; i++) {
+                this.messageRouters[names[i]] = new MessageRouter (this, routes[names[i]]);
+            }
+        }
+        return this.messageRouters[table].find (route);
+    }
+
     handleMessage (client, message) {} // stub to override
 
     // ping (client) {} // stub to override
@@ -4076,7 +4100,7 @@ export default class Exchange {
     async fetch2 (path, api: any = 'public', method = 'GET', params = {}, headers: any = undefined, body: any = undefined, config = {}) {
         if (this.enableRateLimit) {
             const cost = this.calculateRateLimiterCost (api, method, path, params, config);
-            await this.throttle (cost);
+            await this.throttle (cost, api, method, path, config);
         }
         this.lastRestRequestTimestamp = this.milliseconds ();
         const request = this.sign (path, api, method, params, headers, body);
@@ -4266,10 +4290,7 @@ export default class Exchange {
     }
 
     safeMarket (marketId: Str, market: Market = undefined, delimiter: Str = undefined, marketType: Str = undefined): MarketInterface {
-        const result = this.safeMarketStructure ({
-            'symbol': marketId,
-            'marketId': marketId,
-        });
+        // the structure of an unknown market is only built when it is returned, parsers call this for every item
         if (marketId !== undefined) {
             if ((this.markets_by_id !== undefined) && (marketId in this.markets_by_id)) {
                 const markets = this.markets_by_id[marketId];
@@ -4292,6 +4313,10 @@ export default class Exchange {
                     }
                 }
             } else if (delimiter !== undefined && delimiter !== '') {
+                const result = this.safeMarketStructure ({
+                    'symbol': marketId,
+                    'marketId': marketId,
+                });
                 const parts = marketId.split (delimiter);
                 const partsLength = parts.length;
                 if (partsLength === 2) {
@@ -4309,7 +4334,10 @@ export default class Exchange {
         if (market !== undefined) {
             return market;
         }
-        return result;
+        return this.safeMarketStructure ({
+            'symbol': marketId,
+            'marketId': marketId,
+        });
     }
 
     checkRequiredCredentials (error = true) {
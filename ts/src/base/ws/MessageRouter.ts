@@ -0,0 +1,66 @@
+// @ts-nocheck
+
+// one table of routes of Exchange.messageRoutes (), the routes are tried in this order:
+// 'exact' by the whole route, 'prefix' and 'contains' in the order they are listed,
+// then 'predicate', a list of [ predicate (route), handler ]
+// the handler found for a route is remembered, the routes of the messages of a connection repeat
+
+class MessageRouter {
+
+    exchange: any;
+    exact: object;
+    prefixes: any[];
+    substrings: any[];
+    predicates: any[];
+    resolved: Map<string, any>;
+    maxResolved = 1024;
+
+    constructor (exchange, routes = {}) {
+        this.exchange = exchange;
+        this.exact = routes['exact'] || {};
+        this.prefixes = Object.entries (routes['prefix'] || {});
+        this.substrings = Object.entries (routes['contains'] || {});
+        this.predicates = routes['predicate'] || [];
+        this.resolved = new Map ();
+    }
+
+    find (route) {
+        if (typeof route !== 'string') {
+            return undefined;
+        }
+        if (Object.prototype.hasOwnProperty.call (this.exact, route)) {
+            return this.exact[route];
+        }
+        if (this.resolved.has (route)) {
+            return this.resolved.get (route);
+        }
+        const handler = this.resolve (route);
+        if (this.resolved.size < this.maxResolved) {
+            this.resolved.set (route, handler);
+        }
+        return handler;
+    }
+
+    resolve (route) {
+        for (const [ prefix, handler ] of this.prefixes) {
+            if (route.startsWith (prefix)) {
+                return handler;
+            }
+        }
+        for (const [ substring, handler ] of this.substrings) {
+            if (route.indexOf (substring) >= 0) {
+                return handler;
+            }
+        }
+        for (const [ predicate, handler ] of this.predicates) {
+            if (predicate.call (this.exchange, route)) {
+                return handler;
+            }
+        }
+        return undefined;
+    }
+}
+
+export {
+    MessageRouter,
+};
@@ -3,7 +3,7 @@
 
 import ascendexRest from '../ascendex.js';
 import { AuthenticationError, NetworkError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import type { Int, Str, OrderBook, Order, Trade, OHLCV, Balances } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -135,7 +135,7 @@ export default class ascendex extends ascendexRest {
         let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp (limit);
+            stored = this.ohlcvCache (limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         stored.append (parsed);
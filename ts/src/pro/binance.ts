@@ -4,7 +4,7 @@
 import binanceRest from '../binance.js';
 import { Precise } from '../base/Precise.js';
 import { ExchangeError, ArgumentsRequired, BadRequest, NotSupported } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import type { Int, OrderSide, OrderType, Str, Strings, Trade, OrderBook, Order, Ticker, Tickers, OHLCV, Position, Balances, Num } from '../base/types.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import { rsa } from '../base/functions/rsa.js';
@@ -856,7 +856,7 @@ export default class binance extends binanceRest {
         let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp (limit);
+            stored = this.ohlcvCache (limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         stored.append (parsed);
@@ -3046,6 +3046,37 @@ export default class binance extends binanceRest {
         }
     }
 
+    messageRoutes () {
+        return {
+            'event': {
+                'exact': {
+                    'depthUpdate': this.handleOrderBook,
+                    'trade': this.handleTrade,
+                    'aggTrade': this.handleTrade,
+                    'kline': this.handleOHLCV,
+                    'markPrice_kline': this.handleOHLCV,
+                    'indexPrice_kline': this.handleOHLCV,
+                    '1hTicker@arr': this.handleTickers,
+                    '4hTicker@arr': this.handleTickers,
+                    '1dTicker@arr': this.handleTickers,
+                    '24hrTicker@arr': this.handleTickers,
+                    '24hrMiniTicker@arr': this.handleTickers,
+                    '1hTicker': this.handleTickers,
+                    '4hTicker': this.handleTickers,
+                    '1dTicker': this.handleTickers,
+                    '24hrTicker': this.handleTickers,
+                    '24hrMiniTicker': this.handleTickers,
+                    'bookTicker': this.handleBidsAsks, // there is no "bookTicker@arr" endpoint
+                    'outboundAccountPosition': this.handleBalance,
+                    'balanceUpdate': this.handleBalance,
+                    'ACCOUNT_UPDATE': this.handleAcountUpdate,
+                    'executionReport': this.handleOrderUpdate,
+                    'ORDER_TRADE_UPDATE': this.handleOrderUpdate,
+                },
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         // handle WebSocketAPI
         const status = this.safeString (message, 'status');
@@ -3062,36 +3093,12 @@ export default class binance extends binanceRest {
             return;
         }
         // handle other APIs
-        const methods = {
-            'depthUpdate': this.handleOrderBook,
-            'trade': this.handleTrade,
-            'aggTrade': this.handleTrade,
-            'kline': this.handleOHLCV,
-            'markPrice_kline': this.handleOHLCV,
-            'indexPrice_kline': this.handleOHLCV,
-            '1hTicker@arr': this.handleTickers,
-            '4hTicker@arr': this.handleTickers,
-            '1dTicker@arr': this.handleTickers,
-            '24hrTicker@arr': this.handleTickers,
-            '24hrMiniTicker@arr': this.handleTickers,
-            '1hTicker': this.handleTickers,
-            '4hTicker': this.handleTickers,
-            '1dTicker': this.handleTickers,
-            '24hrTicker': this.handleTickers,
-            '24hrMiniTicker': this.handleTickers,
-            'bookTicker': this.handleBidsAsks, // there is no "bookTicker@arr" endpoint
-            'outboundAccountPosition': this.handleBalance,
-            'balanceUpdate': this.handleBalance,
-            'ACCOUNT_UPDATE': this.handleAcountUpdate,
-            'executionReport': this.handleOrderUpdate,
-            'ORDER_TRADE_UPDATE': this.handleOrderUpdate,
-        };
         let event = this.safeString (message, 'e');
         if (Array.isArray (message)) {
             const data = message[0];
             event = this.safeString (data, 'e') + '@arr';
         }
-        method = this.safeValue (methods, event);
+        method = this.findMessageHandler ('event', event);
         if (method === undefined) {
             const requestId = this.safeString (message, 'id');
             if (requestId !== undefined) {
@@ -3,7 +3,7 @@
 
 import bingxRest from '../bingx.js';
 import { BadRequest, NetworkError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import type { Int, OHLCV, Str, OrderBook, Order, Trade, Balances, Ticker } from '../base/types.js';
 import Client from '../base/ws/Client.js';
 import { Precise } from '../base/Precise.js';
@@ -541,7 +541,7 @@ export default class bingx extends bingxRest {
         let stored = this.safeValue (this.ohlcvs[symbol], timeframeId);
         if (stored === undefined) {
             const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp (limit);
+            stored = this.ohlcvCache (limit);
             this.ohlcvs[symbol][timeframeId] = stored;
         }
         for (let i = 0; i < candles.length; i++) {
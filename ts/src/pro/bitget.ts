@@ -3,7 +3,7 @@
 import bitgetRest from '../bitget.js';
 import { AuthenticationError, BadRequest, ArgumentsRequired, NotSupported, InvalidNonce, ExchangeError, RateLimitExceeded } from '../base/errors.js';
 import { Precise } from '../base/Precise.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import type { Int, OHLCV, Str, Strings, OrderBook, Order, Trade, Ticker, Tickers, Position, Balances } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -396,7 +396,7 @@ export default class bitget extends bitgetRest {
         let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp (limit);
+            stored = this.ohlcvCache (limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         const data = this.safeValue (message, 'data', []);
@@ -1685,6 +1685,27 @@ export default class bitget extends bitgetRest {
         }
     }
 
+    messageRoutes () {
+        return {
+            'channel': {
+                'exact': {
+                    'ticker': this.handleTicker,
+                    'trade': this.handleTrades,
+                    'orders': this.handleOrder,
+                    'ordersAlgo': this.handleOrder,
+                    'account': this.handleBalance,
+                    'positions': this.handlePositions,
+                    'account-isolated': this.handleBalance,
+                    'account-crossed': this.handleBalance,
+                },
+                'contains': {
+                    'candle': this.handleOHLCV,
+                    'books': this.handleOrderBook,
+                },
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         //
         //   {
@@ -1741,28 +1762,12 @@ export default class bitget extends bitgetRest {
             this.handleSubscriptionStatus (client, message);
             return;
         }
-        const methods = {
-            'ticker': this.handleTicker,
-            'trade': this.handleTrades,
-            'orders': this.handleOrder,
-            'ordersAlgo': this.handleOrder,
-            'account': this.handleBalance,
-            'positions': this.handlePositions,
-            'account-isolated': this.handleBalance,
-            'account-crossed': this.handleBalance,
-        };
         const arg = this.safeValue (message, 'arg', {});
         const topic = this.safeValue (arg, 'channel', '');
-        const method = this.safeValue (methods, topic);
+        const method = this.findMessageHandler ('channel', topic);
         if (method !== undefined) {
             method.call (this, client, message);
         }
-        if (topic.indexOf ('candle') >= 0) {
-            this.handleOHLCV (client, message);
-        }
-        if (topic.indexOf ('books') >= 0) {
-            this.handleOrderBook (client, message);
-        }
     }
 
     ping (client) {
@@ -3,7 +3,7 @@
 
 import bitmartRest from '../bitmart.js';
 import { ArgumentsRequired, AuthenticationError, ExchangeError, NotSupported } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import type { Int, Market, Str, Strings, OrderBook, Order, Trade, Ticker, Tickers, OHLCV, Position, Balances } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -1103,7 +1103,7 @@ export default class bitmart extends bitmartRest {
                 let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
                 if (stored === undefined) {
                     const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                    stored = new ArrayCacheByTimestamp (limit);
+                    stored = this.ohlcvCache (limit);
                     this.ohlcvs[symbol][timeframe] = stored;
                 }
                 stored.append (parsed);
@@ -1119,7 +1119,7 @@ export default class bitmart extends bitmartRest {
             let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
             if (stored === undefined) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp (limit);
+                stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol][timeframe] = stored;
             }
             for (let i = 0; i < items.length; i++) {
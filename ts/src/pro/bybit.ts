@@ -3,7 +3,7 @@
 
 import bybitRest from '../bybit.js';
 import { ArgumentsRequired, AuthenticationError, ExchangeError, BadRequest } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import type { Int, OHLCV, Str, Strings, Ticker, OrderBook, Order, Trade, Tickers, Position, Balances } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -449,7 +449,7 @@ export default class bybit extends bybitRest {
         let stored = this.safeValue (ohlcvsByTimeframe, timeframe);
         if (stored === undefined) {
             const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-            stored = new ArrayCacheByTimestamp (limit);
+            stored = this.ohlcvCache (limit);
             this.ohlcvs[symbol][timeframe] = stored;
         }
         for (let i = 0; i < data.length; i++) {
@@ -1756,6 +1756,32 @@ export default class bybit extends bybitRest {
         }
     }
 
+    messageRoutes () {
+        // a topic is looked up as is, then by the first of the names it contains
+        const topics = {
+            'orderbook': this.handleOrderBook,
+            'kline': this.handleOHLCV,
+            'order': this.handleOrder,
+            'stopOrder': this.handleOrder,
+            'ticker': this.handleTicker,
+            'trade': this.handleTrades,
+            'publicTrade': this.handleTrades,
+            'depth': this.handleOrderBook,
+            'wallet': this.handleBalance,
+            'outboundAccountInfo': this.handleBalance,
+            'execution': this.handleMyTrades,
+            'ticketInfo': this.handleMyTrades,
+            'user.openapi.perp.trade': this.handleMyTrades,
+            'position': this.handlePositions,
+        };
+        return {
+            'topic': {
+                'exact': topics,
+                'contains': topics,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         if (this.handleErrorMessage (client, message)) {
             return;
@@ -1784,36 +1810,11 @@ export default class bybit extends bybitRest {
             return;
         }
         const topic = this.safeString (message, 'topic', '');
-        const methods = {
-            'orderbook': this.handleOrderBook,
-            'kline': this.handleOHLCV,
-            'order': this.handleOrder,
-            'stopOrder': this.handleOrder,
-            'ticker': this.handleTicker,
-            'trade': this.handleTrades,
-            'publicTrade': this.handleTrades,
-            'depth': this.handleOrderBook,
-            'wallet': this.handleBalance,
-            'outboundAccountInfo': this.handleBalance,
-            'execution': this.handleMyTrades,
-            'ticketInfo': this.handleMyTrades,
-            'user.openapi.perp.trade': this.handleMyTrades,
-            'position': this.handlePositions,
-        };
-        const exacMethod = this.safeValue (methods, topic);
-        if (exacMethod !== undefined) {
-            exacMethod.call (this, client, message);
+        const method = this.findMessageHandler ('topic', topic);
+        if (method !== undefined) {
+            method.call (this, client, message);
             return;
         }
-        const keys = Object.keys (methods);
-        for (let i = 0; i < keys.length; i++) {
-            const key = keys[i];
-            if (topic.indexOf (keys[i]) >= 0) {
-                const method = methods[key];
-                method.call (this, client, message);
-                return;
-            }
-        }
         // unified auth acknowledgement
         const type = this.safeString (message, 'type');
         if ((op === 'auth') || (type === 'AUTH_RESP')) {
@@ -5,7 +5,7 @@ import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import type { Int, OrderSide, OrderType, Strings, Str, OrderBook, Trade, Ticker, Tickers, OHLCV, Order, Balances, Num } from '../base/types.js';
 import { ArgumentsRequired, ExchangeError, BadRequest } from '../base/errors.js';
 import { Precise } from '../base/Precise.js';
-import { ArrayCacheBySymbolById, ArrayCacheByTimestamp, ArrayCache } from '../base/ws/Cache.js';
+import { ArrayCacheBySymbolById, ArrayCache } from '../base/ws/Cache.js';
 import Client from '../base/ws/Client.js';
 
 //  ---------------------------------------------------------------------------
@@ -1134,7 +1134,7 @@ export default class cex extends cexRest {
         const messageHash = 'ohlcv:' + symbol;
         const data = this.safeValue (message, 'data', []);
         const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-        const stored = new ArrayCacheByTimestamp (limit);
+        const stored = this.ohlcvCache (limit);
         const sorted = this.sortBy (data, 0);
         for (let i = 0; i < sorted.length; i++) {
             stored.append (this.parseOHLCV (sorted[i], market));
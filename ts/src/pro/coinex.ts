@@ -4,7 +4,7 @@
 import { Precise } from '../base/Precise.js';
 import coinexRest from '../coinex.js';
 import { AuthenticationError, BadRequest, ExchangeNotAvailable, NotSupported, RequestTimeout, ExchangeError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import { md5 } from '../static_dependencies/noble-hashes/md5.js';
 import type { Int, Str, Strings, OrderBook, Order, Trade, Ticker, Tickers, OHLCV, Balances } from '../base/types.js';
@@ -401,7 +401,7 @@ export default class coinex extends coinexRest {
         if (keysLength === 0) {
             this.ohlcvs['unknown'] = {};
             const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-            const stored = new ArrayCacheByTimestamp (limit);
+            const stored = this.ohlcvCache (limit);
             this.ohlcvs['unknown']['unknown'] = stored;
         }
         const ohlcv = this.ohlcvs['unknown']['unknown'];
@@ -3,7 +3,7 @@
 
 import gateRest from '../gate.js';
 import { AuthenticationError, BadRequest, ArgumentsRequired, InvalidNonce } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { sha512 } from '../static_dependencies/noble-hashes/sha512.js';
 import type { Int, Str, Strings, OrderBook, Order, Trade, Ticker, Tickers, OHLCV, Position, Balances } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -572,7 +572,7 @@ export default class gate extends gateRest {
             let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
             if (stored === undefined) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp (limit);
+                stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol][timeframeId] = stored;
             }
             stored.append (parsed);
@@ -1126,6 +1126,24 @@ export default class gate extends gateRest {
         }
     }
 
+    messageRoutes () {
+        return {
+            'channel': {
+                'exact': {
+                    'usertrades': this.handleMyTrades,
+                    'candlesticks': this.handleOHLCV,
+                    'orders': this.handleOrder,
+                    'positions': this.handlePositions,
+                    'tickers': this.handleTicker,
+                    'book_ticker': this.handleBidAsk,
+                    'trades': this.handleTrades,
+                    'order_book_update': this.handleOrderBook,
+                    'balances': this.handleBalance,
+                },
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         //
         // subscribe
@@ -1227,18 +1245,7 @@ export default class gate extends gateRest {
         const channel = this.safeString (message, 'channel', '');
         const channelParts = channel.split ('.');
         const channelType = this.safeValue (channelParts, 1);
-        const v4Methods = {
-            'usertrades': this.handleMyTrades,
-            'candlesticks': this.handleOHLCV,
-            'orders': this.handleOrder,
-            'positions': this.handlePositions,
-            'tickers': this.handleTicker,
-            'book_ticker': this.handleBidAsk,
-            'trades': this.handleTrades,
-            'order_book_update': this.handleOrderBook,
-            'balances': this.handleBalance,
-        };
-        const method = this.safeValue (v4Methods, channelType);
+        const method = this.findMessageHandler ('channel', channelType);
         if (method !== undefined) {
             method.call (this, client, message);
         }
@@ -3,7 +3,7 @@
 
 import krakenRest from '../kraken.js';
 import { ExchangeError, BadSymbol, PermissionDenied, AccountSuspended, BadRequest, InsufficientFunds, InvalidOrder, OrderNotFound, NotSupported, RateLimitExceeded, ExchangeNotAvailable, InvalidNonce, AuthenticationError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import { Precise } from '../base/Precise.js';
 import type { Int, Strings, OrderSide, OrderType, Str, OrderBook, Order, Trade, Ticker, Tickers, OHLCV, Num } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -436,7 +436,7 @@ export default class kraken extends krakenRest {
             let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
             if (stored === undefined) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp (limit);
+                stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol][timeframe] = stored;
             }
             stored.append (result);
@@ -1433,6 +1433,34 @@ export default class kraken extends krakenRest {
         return true;
     }
 
+    messageRoutes () {
+        return {
+            'channel': {
+                'exact': {
+                    // public
+                    'book': this.handleOrderBook,
+                    'ohlc': this.handleOHLCV,
+                    'ticker': this.handleTicker,
+                    'trade': this.handleTrades,
+                    // private
+                    'openOrders': this.handleOrders,
+                    'ownTrades': this.handleMyTrades,
+                },
+            },
+            'event': {
+                'exact': {
+                    'heartbeat': this.handleHeartbeat,
+                    'systemStatus': this.handleSystemStatus,
+                    'subscriptionStatus': this.handleSubscriptionStatus,
+                    'addOrderStatus': this.handleCreateEditOrder,
+                    'editOrderStatus': this.handleCreateEditOrder,
+                    'cancelOrderStatus': this.handleCancelOrder,
+                    'cancelAllStatus': this.handleCancelAllOrders,
+                },
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         if (Array.isArray (message)) {
             const channelId = this.safeString (message, 0);
@@ -1441,33 +1469,17 @@ export default class kraken extends krakenRest {
             const messageLength = message.length;
             const channelName = this.safeString (message, messageLength - 2);
             const name = this.safeString (info, 'name');
-            const methods = {
-                // public
-                'book': this.handleOrderBook,
-                'ohlc': this.handleOHLCV,
-                'ticker': this.handleTicker,
-                'trade': this.handleTrades,
-                // private
-                'openOrders': this.handleOrders,
-                'ownTrades': this.handleMyTrades,
-            };
-            const method = this.safeValue2 (methods, name, channelName);
+            let method = this.findMessageHandler ('channel', name);
+            if (method === undefined) {
+                method = this.findMessageHandler ('channel', channelName);
+            }
             if (method !== undefined) {
                 method.call (this, client, message, subscription);
             }
         } else {
             if (this.handleErrorMessage (client, message)) {
                 const event = this.safeString (message, 'event');
-                const methods = {
-                    'heartbeat': this.handleHeartbeat,
-                    'systemStatus': this.handleSystemStatus,
-                    'subscriptionStatus': this.handleSubscriptionStatus,
-                    'addOrderStatus': this.handleCreateEditOrder,
-                    'editOrderStatus': this.handleCreateEditOrder,
-                    'cancelOrderStatus': this.handleCancelOrder,
-                    'cancelAllStatus': this.handleCancelAllOrders,
-                };
-                const method = this.safeValue (methods, event);
+                const method = this.findMessageHandler ('event', event);
                 if (method !== undefined) {
                     method.call (this, client, message);
                 }
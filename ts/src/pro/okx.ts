@@ -3,7 +3,7 @@
 
 import okxRest from '../okx.js';
 import { ArgumentsRequired, AuthenticationError, BadRequest, InvalidNonce } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide } from '../base/ws/Cache.js';
 import { sha256 } from '../static_dependencies/noble-hashes/sha256.js';
 import type { Int, OrderSide, OrderType, Str, Strings, OrderBook, Order, Trade, Ticker, Tickers, OHLCV, Position, Balances, Num } from '../base/types.js';
 import Client from '../base/ws/Client.js';
@@ -447,7 +447,7 @@ export default class okx extends okxRest {
             let stored = this.safeValue (this.ohlcvs[symbol], timeframe);
             if (stored === undefined) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp (limit);
+                stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol][timeframe] = stored;
             }
             stored.append (parsed);
@@ -1582,6 +1582,47 @@ export default class okx extends okxRest {
         return message;
     }
 
+    messageRoutes () {
+        return {
+            'event': {
+                'exact': {
+                    // 'info': this.handleSystemStatus,
+                    // 'book': 'handleOrderBook',
+                    'login': this.handleAuthenticate,
+                    'subscribe': this.handleSubscriptionStatus,
+                    'order': this.handlePlaceOrders,
+                    'batch-orders': this.handlePlaceOrders,
+                    'amend-order': this.handlePlaceOrders,
+                    'batch-amend-orders': this.handlePlaceOrders,
+                    'cancel-order': this.handlePlaceOrders,
+                    'mass-cancel': this.handleCancelAllOrders,
+                },
+            },
+            'channel': {
+                'exact': {
+                    'bbo-tbt': this.handleOrderBook, // newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
+                    'books': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required
+                    'books5': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms (vs. every 200ms now)
+                    'books50-l2-tbt': this.handleOrderBook, // only users who're VIP4 and above can subscribe, identity verification required before subscription
+                    'books-l2-tbt': this.handleOrderBook, // only users who're VIP5 and above can subscribe, identity verification required before subscription
+                    'tickers': this.handleTicker,
+                    'positions': this.handlePositions,
+                    'index-tickers': this.handleTicker,
+                    'sprd-tickers': this.handleTicker,
+                    'block-tickers': this.handleTicker,
+                    'trades': this.handleTrades,
+                    'account': this.handleBalance,
+                    // 'margin_account': this.handleBalance,
+                    'orders': this.handleOrders,
+                    'orders-algo': this.handleOrders,
+                },
+                'prefix': {
+                    'candle': this.handleOHLCV,
+                },
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         if (!this.handleErrorMessage (client, message)) {
             return;
@@ -1633,48 +1674,15 @@ export default class okx extends okxRest {
         // if (table === undefined) {
         const event = this.safeString2 (message, 'event', 'op');
         if (event !== undefined) {
-            const methods = {
-                // 'info': this.handleSystemStatus,
-                // 'book': 'handleOrderBook',
-                'login': this.handleAuthenticate,
-                'subscribe': this.handleSubscriptionStatus,
-                'order': this.handlePlaceOrders,
-                'batch-orders': this.handlePlaceOrders,
-                'amend-order': this.handlePlaceOrders,
-                'batch-amend-orders': this.handlePlaceOrders,
-                'cancel-order': this.handlePlaceOrders,
-                'mass-cancel': this.handleCancelAllOrders,
-            };
-            const method = this.safeValue (methods, event);
+            const method = this.findMessageHandler ('event', event);
             if (method !== undefined) {
                 method.call (this, client, message);
             }
         } else {
             const arg = this.safeValue (message, 'arg', {});
             const channel = this.safeString (arg, 'channel');
-            const methods = {
-                'bbo-tbt': this.handleOrderBook, // newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
-                'books': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required
-                'books5': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms (vs. every 200ms now)
-                'books50-l2-tbt': this.handleOrderBook, // only users who're VIP4 and above can subscribe, identity verification required before subscription
-                'books-l2-tbt': this.handleOrderBook, // only users who're VIP5 and above can subscribe, identity verification required before subscription
-                'tickers': this.handleTicker,
-                'positions': this.handlePositions,
-                'index-tickers': this.handleTicker,
-                'sprd-tickers': this.handleTicker,
-                'block-tickers': this.handleTicker,
-                'trades': this.handleTrades,
-                'account': this.handleBalance,
-                // 'margin_account': this.handleBalance,
-                'orders': this.handleOrders,
-                'orders-algo': this.handleOrders,
-            };
-            const method = this.safeValue (methods, channel);
-            if (method === undefined) {
-                if (channel.indexOf ('candle') === 0) {
-                    this.handleOHLCV (client, message);
-                }
-            } else {
+            const method = this.findMessageHandler ('channel', channel);
+            if (method !== undefined) {
                 method.call (this, client, message);
             }
         }
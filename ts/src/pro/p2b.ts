@@ -2,7 +2,7 @@
 
 import p2bRest from '../p2b.js';
 import { BadRequest, ExchangeError } from '../base/errors.js';
-import { ArrayCache, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache } from '../base/ws/Cache.js';
 import type { Int, OHLCV, OrderBook, Trade, Ticker } from '../base/types.js';
 import Client from '../base/ws/Client.js';
 
@@ -228,7 +228,7 @@ export default class p2b extends p2bRest {
         if (symbol !== undefined) {
             if (stored === undefined) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                stored = new ArrayCacheByTimestamp (limit);
+                stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol][timeframe] = stored;
             }
             stored.append (parsed);
@@ -4,7 +4,7 @@
 import whitebitRest from '../whitebit.js';
 import { Precise } from '../base/Precise.js';
 import { ArgumentsRequired, AuthenticationError, BadRequest } from '../base/errors.js';
-import { ArrayCache, ArrayCacheBySymbolById, ArrayCacheByTimestamp } from '../base/ws/Cache.js';
+import { ArrayCache, ArrayCacheBySymbolById } from '../base/ws/Cache.js';
 import type { Int, Str, OrderBook, Order, Trade, Ticker, OHLCV, Balances } from '../base/types.js';
 import Client from '../base/ws/Client.js';
 
@@ -126,7 +126,7 @@ export default class whitebit extends whitebitRest {
             // let stored = this.ohlcvs[symbol]['unknown']; // we don't know the timeframe but we need to respect the type
             if (!('unknown' in this.ohlcvs[symbol])) {
                 const limit = this.safeInteger (this.options, 'OHLCVLimit', 1000);
-                const stored = new ArrayCacheByTimestamp (limit);
+                const stored = this.ohlcvCache (limit);
                 this.ohlcvs[symbol]['unknown'] = stored;
             }
             const ohlcv = this.ohlcvs[symbol]['unknown'];